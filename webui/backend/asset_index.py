@@ -0,0 +1,1105 @@
+"""
+Asset Index data structures
+
+Compact in-memory representation of the images below ASSETS_DIR.
+
+A record keeps only what cannot be derived: relative path, library folder,
+asset type, size and timestamps. Folder and type strings are interned and
+shared by all records, and the file name and /poster_assets URL are built
+lazily when a record is serialized for an API response.
+
+Readers work on an AssetSnapshot: an immutable view of the whole index that
+is replaced with a single reference assignment, never modified in place.
+Scans build a new snapshot from scratch, incremental changes derive one from
+the current snapshot with an AssetSnapshotBuilder (copy-on-write).
+"""
+
+import base64
+import bisect
+import itertools
+import json
+import os
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+from asset_search import AssetSearchIndex
+
+ASSETS_URL_PREFIX = "/poster_assets/"
+
+# Asset type list keys and the matching per-folder counter
+ASSET_TYPE_COUNT_KEYS = {
+    "posters": "poster_count",
+    "backgrounds": "background_count",
+    "seasons": "season_count",
+    "titlecards": "titlecard_count",
+}
+
+# Gallery sort orders -> sort key. Every key ends with the (unique) path, which
+# makes the order total and lets a cursor name an exact position.
+SORT_KEYS = {
+    "path": lambda r: (r.path, r.path),
+    "modified": lambda r: (r.modified, r.path),
+    "size": lambda r: (r.size, r.path),
+}
+
+
+class AssetRecord:
+    """A single indexed image"""
+
+    __slots__ = ("path", "folder", "type", "size", "created", "modified")
+
+    def __init__(
+        self,
+        path: str,
+        folder: str,
+        type_key: Optional[str],
+        size: int,
+        created: float,
+        modified: float,
+    ):
+        """
+        Args:
+            path: Path relative to ASSETS_DIR (OS separators, as returned by the scanner)
+            folder: Top-level library folder ("root" for files directly in ASSETS_DIR)
+            type_key: asset_cache list key ("posters", ...) or None if unclassified
+            size: File size in bytes
+            created: ctime (Unix timestamp)
+            modified: mtime (Unix timestamp)
+        """
+        self.path = path
+        self.folder = sys.intern(folder)
+        self.type = sys.intern(type_key) if type_key else None
+        self.size = size
+        self.created = created
+        self.modified = modified
+
+    @property
+    def url_path(self) -> str:
+        """Relative path with forward slashes"""
+        return self.path.replace("\\", "/")
+
+    @property
+    def name(self) -> str:
+        """File name"""
+        return self.url_path.rsplit("/", 1)[-1]
+
+    @property
+    def url(self) -> str:
+        """URL below the /poster_assets static mount"""
+        # URL encode the path to handle special characters like #
+        return ASSETS_URL_PREFIX + quote(self.url_path, safe="/")
+
+    def to_dict(self) -> dict:
+        """Serialize in the format the gallery endpoints have always returned"""
+        return {
+            "path": self.path,
+            "name": self.name,
+            "size": self.size,
+            "url": self.url,
+            "created": self.created,  # Creation time (Unix timestamp)
+            "modified": self.modified,  # Modification time (Unix timestamp)
+        }
+
+    def __repr__(self) -> str:
+        return f"AssetRecord({self.path!r}, type={self.type!r}, size={self.size})"
+
+
+def estimate_memory(records: Iterable[AssetRecord], count: int, sample_size: int = 1000):
+    """
+    Estimate the memory held by the records and what the previous dict-per-image
+    layout would have needed, extrapolated from a sample.
+
+    Args:
+        records: Iterable over the indexed records
+        count: Total number of records (used for extrapolation)
+        sample_size: Number of records to measure
+
+    Returns:
+        dict with record count and estimated bytes for both layouts
+    """
+    measured = 0
+    compact_bytes = 0
+    dict_bytes = 0
+
+    for record in records:
+        if measured >= sample_size:
+            break
+        measured += 1
+
+        # Compact: the record plus the objects only it references
+        compact_bytes += (
+            sys.getsizeof(record)
+            + sys.getsizeof(record.path)
+            + sys.getsizeof(record.size)
+            + sys.getsizeof(record.created)
+            + sys.getsizeof(record.modified)
+        )
+
+        # Previous layout: one dict with six keys per image
+        legacy = record.to_dict()
+        dict_bytes += sys.getsizeof(legacy) + sum(
+            sys.getsizeof(value) for value in legacy.values()
+        )
+
+    if not measured:
+        return {"records": 0, "estimated_bytes": 0, "dict_layout_estimated_bytes": 0}
+
+    factor = count / measured
+    return {
+        "records": count,
+        "sampled": measured,
+        "estimated_bytes": int(compact_bytes * factor),
+        "dict_layout_estimated_bytes": int(dict_bytes * factor),
+    }
+
+
+# Every snapshot gets the next generation number, so a generation identifies
+# the exact data a response was built from
+_generations = itertools.count(1)
+
+
+def new_asset_folder_entry(folder_name: str) -> dict:
+    """Create an empty per-library folder summary"""
+    return {
+        "name": folder_name,
+        "path": folder_name,
+        "poster_count": 0,
+        "background_count": 0,
+        "season_count": 0,
+        "titlecard_count": 0,
+        "files": 0,
+        "size": 0,
+        "total_count": 0,
+        "newest": 0,
+    }
+
+
+def _record_path(record: AssetRecord) -> str:
+    return record.path
+
+
+def _record_name(record: AssetRecord) -> str:
+    return record.name
+
+
+# Upper bounds (bytes) of the per-library file size histogram buckets; the
+# last bucket holds everything larger
+SIZE_HISTOGRAM_BOUNDS = (
+    100 * 1024,
+    250 * 1024,
+    500 * 1024,
+    1024 * 1024,
+    2 * 1024 * 1024,
+    5 * 1024 * 1024,
+)
+
+
+def size_bucket(size: int) -> int:
+    return bisect.bisect_left(SIZE_HISTOGRAM_BOUNDS, size)
+
+
+class AssetStats:
+    """
+    Running aggregates of a snapshot, kept up to date by AssetSnapshotBuilder
+
+    - types: type key -> count, bytes and newest mtime of its images
+    - histograms: library folder -> image count per file size bucket
+
+    Counts and sums are updated on every add/remove. A newest mtime cannot be
+    "un-maxed", so removing the newest image of a type only marks it stale and
+    it is recomputed from that type's list when the snapshot is built.
+    """
+
+    __slots__ = ("types", "histograms", "stale_types")
+
+    def __init__(self):
+        self.types: Dict[str, dict] = {
+            key: {"count": 0, "bytes": 0, "newest": 0} for key in ASSET_TYPE_COUNT_KEYS
+        }
+        self.histograms: Dict[str, List[int]] = {}
+        self.stale_types = set()
+
+    @classmethod
+    def from_records(cls, records: Iterable[AssetRecord]) -> "AssetStats":
+        stats = cls()
+        for record in records:
+            stats.add(record)
+        return stats
+
+    def copy(self) -> "AssetStats":
+        stats = AssetStats()
+        stats.types = {key: dict(values) for key, values in self.types.items()}
+        stats.histograms = {name: list(h) for name, h in self.histograms.items()}
+        return stats
+
+    def add(self, record: AssetRecord):
+        if record.type:
+            totals = self.types[record.type]
+            totals["count"] += 1
+            totals["bytes"] += record.size
+            if record.modified > totals["newest"]:
+                totals["newest"] = record.modified
+        histogram = self.histograms.get(record.folder)
+        if histogram is None:
+            histogram = self.histograms[record.folder] = [0] * (
+                len(SIZE_HISTOGRAM_BOUNDS) + 1
+            )
+        histogram[size_bucket(record.size)] += 1
+
+    def remove(self, record: AssetRecord):
+        if record.type:
+            totals = self.types[record.type]
+            totals["count"] -= 1
+            totals["bytes"] -= record.size
+            if record.modified >= totals["newest"]:
+                self.stale_types.add(record.type)
+        histogram = self.histograms.get(record.folder)
+        if histogram is not None:
+            histogram[size_bucket(record.size)] -= 1
+            if not any(histogram):
+                del self.histograms[record.folder]
+
+    def refresh(self, lists: Dict[str, tuple]):
+        """Recompute stale newest mtimes from the final type lists"""
+        for type_key in self.stale_types:
+            self.types[type_key]["newest"] = max(
+                (r.modified for r in lists[type_key]), default=0
+            )
+        self.stale_types = set()
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(totals["bytes"] for totals in self.types.values())
+
+
+class AssetSnapshot:
+    """
+    Immutable view of the asset index
+
+    The per-type lists are tuples sorted by path. Folder summaries and the path
+    map must be treated as read-only; changes go through AssetSnapshotBuilder.
+    Supports cache["posters"]-style access for the endpoints.
+    """
+
+    __slots__ = (
+        "generation",
+        "last_scanned",
+        "posters",
+        "backgrounds",
+        "seasons",
+        "titlecards",
+        "folders",
+        "paths",
+        "stats",
+        "_shows",
+        "_search",
+        "_directories",
+        "_views",
+    )
+
+    KEYS = set(ASSET_TYPE_COUNT_KEYS) | {"folders", "last_scanned", "generation"}
+
+    def __init__(
+        self,
+        lists: Dict[str, tuple],
+        folders: tuple,
+        paths: Dict[str, AssetRecord],
+        last_scanned: float = 0,
+        stats: Optional[AssetStats] = None,
+        shows: Optional["ShowTreeIndex"] = None,
+        search: Optional[AssetSearchIndex] = None,
+        directories: Optional["AssetDirectoryIndex"] = None,
+    ):
+        """
+        Args:
+            lists: Type key -> tuple of AssetRecords sorted by path
+            folders: Folder summaries sorted by name
+            paths: Relative path -> AssetRecord (including unclassified images)
+            last_scanned: Time of the scan the snapshot is based on (0 = never)
+            stats: Running aggregates matching paths (computed if omitted)
+            shows: Show tree matching the season/titlecard lists (built if omitted)
+            search: Search index matching paths (built if omitted)
+            directories: Directory index matching paths (built if omitted)
+        """
+        for key in ASSET_TYPE_COUNT_KEYS:
+            setattr(self, key, lists.get(key, ()))
+        self.folders = folders
+        self.paths = paths
+        self.stats = stats if stats is not None else AssetStats.from_records(paths.values())
+        self._shows = (
+            shows
+            if shows is not None
+            else ShowTreeIndex(itertools.chain(self.seasons, self.titlecards))
+        )
+        self._search = search if search is not None else AssetSearchIndex(paths.values())
+        self._directories = (
+            directories
+            if directories is not None
+            else AssetDirectoryIndex(paths.values())
+        )
+        self.last_scanned = last_scanned
+        self.generation = next(_generations)
+        self._views: Dict[tuple, tuple] = {}
+
+    @classmethod
+    def empty(cls, last_scanned: float = 0) -> "AssetSnapshot":
+        return cls({}, (), {}, last_scanned)
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[AssetRecord], last_scanned: float = 0
+    ) -> "AssetSnapshot":
+        """Group records into sorted per-type lists and per-library folder summaries"""
+        lists: Dict[str, List[AssetRecord]] = {key: [] for key in ASSET_TYPE_COUNT_KEYS}
+        paths: Dict[str, AssetRecord] = {}
+        folders: Dict[str, dict] = {}
+        stats = AssetStats()
+
+        for record in records:
+            folder = folders.get(record.folder)
+            if folder is None:
+                folder = folders[record.folder] = new_asset_folder_entry(record.folder)
+
+            # Count files and size for the folder
+            folder["files"] += 1
+            folder["size"] += record.size
+            if record.modified > folder["newest"]:
+                folder["newest"] = record.modified
+            stats.add(record)
+
+            if record.type:
+                lists[record.type].append(record)
+                folder[ASSET_TYPE_COUNT_KEYS[record.type]] += 1
+                folder["total_count"] += 1
+
+            paths[record.path] = record
+
+        # Sort the image lists once by path
+        return cls(
+            {key: tuple(sorted(images, key=_record_path)) for key, images in lists.items()},
+            tuple(sorted(folders.values(), key=lambda x: x["name"])),
+            paths,
+            last_scanned,
+            stats,
+        )
+
+    def replace(self, **changes) -> "AssetSnapshot":
+        """Return a copy sharing all data, with some attributes replaced"""
+        lists = {key: getattr(self, key) for key in ASSET_TYPE_COUNT_KEYS}
+        images_changed = "paths" in changes
+        for key in ASSET_TYPE_COUNT_KEYS:
+            if key in changes:
+                lists[key] = changes.pop(key)
+                images_changed = True
+        values = {
+            "folders": self.folders,
+            "paths": self.paths,
+            "last_scanned": self.last_scanned,
+        }
+        # Aggregates and derived indexes still match unless the images changed
+        if "paths" not in changes:
+            values["stats"] = self.stats
+        if not images_changed:
+            values["shows"] = self._shows
+            values["search"] = self._search
+            values["directories"] = self._directories
+        values.update(changes)
+        return AssetSnapshot(lists, **values)
+
+    def view(self, type_key: str, sort: str = "path", library: Optional[str] = None):
+        """
+        Records of one type in ascending sort order, optionally for one library.
+
+        Views are computed on first use and kept for the lifetime of the
+        snapshot, so every later page request is a bisect into a ready tuple.
+        """
+        cache_key = (type_key, sort, library)
+        view = self._views.get(cache_key)
+        if view is None:
+            if library is None and sort == "path":
+                view = getattr(self, type_key)
+            elif library is not None:
+                view = tuple(
+                    r for r in self.view(type_key, sort) if r.folder == library
+                )
+            else:
+                view = tuple(sorted(getattr(self, type_key), key=SORT_KEYS[sort]))
+            self._views[cache_key] = view
+        return view
+
+    def in_folder(self, type_key: str, folder_path: str) -> List[AssetRecord]:
+        """
+        Records of one type below a folder ("4K" or "Movies/ActionMovies").
+
+        All paths below a folder share its prefix, so they form one contiguous
+        range of the path-sorted list, found with two binary searches.
+        """
+        images = getattr(self, type_key)
+        result: List[AssetRecord] = []
+        # Paths use the OS separator, accept either form of the folder path
+        for separator in {"/", "\\", os.sep}:
+            prefix = folder_path.replace("/", separator).replace("\\", separator)
+            prefix += separator
+            start = bisect.bisect_left(images, prefix, key=_record_path)
+            end = bisect.bisect_left(images, prefix + "\U0010ffff", key=_record_path)
+            result.extend(images[start:end])
+        if len(result) > 1:
+            result.sort(key=_record_path)
+        return result
+
+    def top_folders(self, count: int = 10) -> List[dict]:
+        """Folder summaries with the most files (sorted once per snapshot)"""
+        ranked = self._views.get(("top_folders",))
+        if ranked is None:
+            ranked = self._views[("top_folders",)] = tuple(
+                sorted(self.folders, key=lambda x: x["files"], reverse=True)
+            )
+        return list(ranked[:count])
+
+    def directories(self) -> "AssetDirectoryIndex":
+        """Directory layout of the snapshot"""
+        return self._directories
+
+    def shows(self) -> "ShowTreeIndex":
+        """Show -> season -> episode tree of the season and titlecard images"""
+        return self._shows
+
+    def search_index(self) -> AssetSearchIndex:
+        """Title/year/provider ID search index of the snapshot"""
+        return self._search
+
+    def __getitem__(self, key: str):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.KEYS else default
+
+
+class AssetDirectoryIndex:
+    """
+    Directory layout derived from the indexed images
+
+    - files: directory -> its images, sorted by name
+    - children: directory -> names of its subdirectories that contain images
+    - by_name: directory name -> every directory with that name
+
+    Directories are relative to ASSETS_DIR with OS separators ("" is the root).
+    A directory is listed while it has images or subdirectories with images.
+
+    Built once per scan; AssetSnapshotBuilder keeps it up to date with add()
+    and remove() on a copy() (copy-on-write per directory entry).
+    """
+
+    __slots__ = ("files", "children", "by_name", "_owned")
+
+    def __init__(self, records: Iterable[AssetRecord] = ()):
+        self.files: Dict[str, List[AssetRecord]] = {}
+        self.children: Dict[str, set] = {}
+        self.by_name: Dict[str, List[str]] = {}
+        self._owned = None  # (mapping, key) entries this copy may modify (None: all)
+
+        for record in records:
+            self._add(record, sort=False)
+
+        for entries in self.files.values():
+            entries.sort(key=_record_name)
+
+    def copy(self) -> "AssetDirectoryIndex":
+        """Copy sharing the per-directory entries until they are modified"""
+        index = AssetDirectoryIndex.__new__(AssetDirectoryIndex)
+        index.files = dict(self.files)
+        index.children = dict(self.children)
+        index.by_name = dict(self.by_name)
+        index._owned = set()
+        return index
+
+    def _own(self, kind: str, key: str, mapping: dict, copy):
+        value = mapping.get(key)
+        if value is not None and self._owned is not None and (kind, key) not in self._owned:
+            value = mapping[key] = copy(value)
+            self._owned.add((kind, key))
+        return value
+
+    def _create(self, kind: str, key: str, mapping: dict, value):
+        mapping[key] = value
+        if self._owned is not None:
+            self._owned.add((kind, key))
+        return value
+
+    def _is_listed(self, directory: str) -> bool:
+        return directory == "" or directory in self.files or directory in self.children
+
+    def _register(self, directory: str):
+        """List a directory that just got its first image or subdirectory"""
+        while directory:
+            parent, name = os.path.split(directory)
+            parent_listed = self._is_listed(parent)
+            names = self._own("children", parent, self.children, set)
+            if names is None:
+                names = self._create("children", parent, self.children, set())
+            names.add(name)
+            paths = self._own("by_name", name, self.by_name, list)
+            if paths is None:
+                paths = self._create("by_name", name, self.by_name, [])
+            paths.append(directory)
+            if parent_listed:
+                break
+            directory = parent
+
+    def _unregister(self, directory: str):
+        """Drop a directory that lost its last image or subdirectory"""
+        while directory:
+            parent, name = os.path.split(directory)
+            names = self._own("children", parent, self.children, set)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self.children[parent]
+            paths = self._own("by_name", name, self.by_name, list)
+            if paths is not None and directory in paths:
+                paths.remove(directory)
+                if not paths:
+                    del self.by_name[name]
+            if self._is_listed(parent):
+                break
+            directory = parent
+
+    def add(self, record: AssetRecord):
+        """Add an image (its directory and missing ancestors are listed)"""
+        self._add(record, sort=True)
+
+    def _add(self, record: AssetRecord, sort: bool):
+        directory = os.path.dirname(record.path)
+        entries = self._own("files", directory, self.files, list)
+        if entries is None:
+            listed = self._is_listed(directory)
+            entries = self._create("files", directory, self.files, [])
+            if not listed:
+                self._register(directory)
+        if sort:
+            bisect.insort(entries, record, key=_record_name)
+        else:
+            entries.append(record)
+
+    def remove(self, record: AssetRecord):
+        """Remove an image (directories left without images are dropped)"""
+        directory = os.path.dirname(record.path)
+        entries = self._own("files", directory, self.files, list)
+        if entries is None:
+            return
+        index = bisect.bisect_left(entries, record.name, key=_record_name)
+        if index >= len(entries) or entries[index].path != record.path:
+            return
+        del entries[index]
+        if not entries:
+            del self.files[directory]
+            if not self._is_listed(directory):
+                self._unregister(directory)
+
+    @staticmethod
+    def normalize(directory: str) -> str:
+        """Convert a URL-style directory ("4K/Movie (2020)") to an index key"""
+        directory = directory.replace("\\", "/").strip("/")
+        return os.path.join(*directory.split("/")) if directory else ""
+
+    def subdirectories(self, directory: str) -> List[str]:
+        """Sorted names of the subdirectories of a directory"""
+        return sorted(self.children.get(directory, ()))
+
+    def files_in(self, directory: str) -> List[AssetRecord]:
+        """Images directly in a directory, sorted by name"""
+        return self.files.get(directory, [])
+
+    def file(self, directory: str, name: str) -> Optional[AssetRecord]:
+        """The image with the given file name in a directory, if indexed"""
+        entries = self.files.get(directory)
+        if not entries:
+            return None
+        i = bisect.bisect_left(entries, name, key=_record_name)
+        if i < len(entries) and entries[i].name == name:
+            return entries[i]
+        return None
+
+    def find(self, name: str) -> List[str]:
+        """All directories with the given name"""
+        return self.by_name.get(name, [])
+
+
+# Season posters and titlecards, folder-based ("Season01.jpg", "S01E02.jpg")
+# or file-based with the show name as prefix ("Show (2020)_S01E02.jpg")
+SEASON_FILE_RE = re.compile(r"^(?:(.*)_)?Season(\d+)\.jpg$")
+TITLECARD_FILE_RE = re.compile(r"^(?:(.*)_)?S(\d+)E(\d+)\.jpg$")
+
+
+# Type lists the show tree is built from
+SHOW_TREE_TYPES = ("seasons", "titlecards")
+
+
+def _episode_sort_key(entry) -> tuple:
+    # Entries are (episode, record)
+    return (entry[0], entry[1].path)
+
+
+def _remove_sorted(values: List[str], value: str):
+    index = bisect.bisect_left(values, value)
+    if index < len(values) and values[index] == value:
+        del values[index]
+
+
+class ShowTreeIndex:
+    """
+    Show -> season -> episode tree with counts and sizes on every level
+
+    A show is the directory holding its season and titlecard images, or for
+    file-based assets the directory plus the show name prefix. Shows are keyed
+    by that URL-style path ("TV/Show (2020) {tvdb-1}") and kept sorted, per
+    library as well, so the show list can be paged with a keyset cursor.
+
+    Built once per scan; AssetSnapshotBuilder keeps it up to date with add()
+    and remove() on a copy() (copy-on-write per show), then calls finish().
+    """
+
+    __slots__ = ("shows", "keys", "by_library", "_owned", "_stale")
+
+    def __init__(self, records: Iterable[AssetRecord] = ()):
+        self.shows: Dict[str, dict] = {}
+        self._owned = None  # Keys of shows this copy may modify (None: all)
+        self._stale = set()  # Shows whose newest mtime must be recomputed
+
+        for record in records:
+            self._add(record, sort=False)
+
+        for show in self.shows.values():
+            for season in show["seasons"].values():
+                season["episodes"].sort(key=_episode_sort_key)
+
+        self.keys: List[str] = sorted(self.shows)
+        self.by_library: Dict[str, List[str]] = {}
+        for key in self.keys:
+            self.by_library.setdefault(self.shows[key]["library"], []).append(key)
+
+    @staticmethod
+    def _locate(record: AssetRecord) -> Optional[Tuple[str, str, int, Optional[int]]]:
+        """(show key, show name, season, episode or None) of an image, None if not part of a show"""
+        name = record.name
+        if record.type == "titlecards":
+            match = TITLECARD_FILE_RE.match(name)
+        elif record.type == "seasons":
+            match = SEASON_FILE_RE.match(name)
+        else:
+            return None
+        if match is None:
+            return None
+
+        directory = record.url_path.rpartition("/")[0]
+        prefix = match.group(1)
+        key = f"{directory}/{prefix}" if prefix else directory
+        episode = int(match.group(3)) if record.type == "titlecards" else None
+        return key, prefix or directory.rpartition("/")[2], int(match.group(2)), episode
+
+    def copy(self) -> "ShowTreeIndex":
+        """Copy sharing the show nodes until they are modified"""
+        tree = ShowTreeIndex.__new__(ShowTreeIndex)
+        tree.shows = dict(self.shows)
+        tree.keys = list(self.keys)
+        tree.by_library = {name: list(keys) for name, keys in self.by_library.items()}
+        tree._owned = set()
+        tree._stale = set()
+        return tree
+
+    def _own(self, key: str) -> Optional[dict]:
+        show = self.shows.get(key)
+        if show is None or self._owned is None or key in self._owned:
+            return show
+        show = dict(show)
+        show["seasons"] = {
+            number: dict(season, episodes=list(season["episodes"]))
+            for number, season in show["seasons"].items()
+        }
+        self.shows[key] = show
+        self._owned.add(key)
+        return show
+
+    def add(self, record: AssetRecord):
+        """Add a season poster or titlecard (other images are ignored)"""
+        self._add(record, sort=True)
+
+    def _add(self, record: AssetRecord, sort: bool):
+        location = self._locate(record)
+        if location is None:
+            return
+        key, name, season_number, episode = location
+
+        show = self._own(key)
+        if show is None:
+            show = self.shows[key] = {
+                "key": key,
+                "name": name,
+                "library": record.folder,
+                "season_count": 0,
+                "season_poster_count": 0,
+                "episode_count": 0,
+                "size": 0,
+                "modified": 0,
+                "seasons": {},
+            }
+            if self._owned is not None:
+                self._owned.add(key)
+            if sort:
+                bisect.insort(self.keys, key)
+                bisect.insort(self.by_library.setdefault(record.folder, []), key)
+
+        season = show["seasons"].get(season_number)
+        if season is None:
+            season = show["seasons"][season_number] = {
+                "season": season_number,
+                "poster": None,
+                "episode_count": 0,
+                "size": 0,
+                "modified": 0,
+                "episodes": [],
+            }
+            show["season_count"] += 1
+
+        if episode is not None:
+            if sort:
+                bisect.insort(season["episodes"], (episode, record), key=_episode_sort_key)
+            else:
+                season["episodes"].append((episode, record))
+            season["episode_count"] += 1
+            show["episode_count"] += 1
+        else:
+            season["poster"] = record
+            show["season_poster_count"] += 1
+
+        for node in (show, season):
+            node["size"] += record.size
+            if record.modified > node["modified"]:
+                node["modified"] = record.modified
+
+    def remove(self, record: AssetRecord):
+        """Remove a season poster or titlecard (other images are ignored)"""
+        location = self._locate(record)
+        if location is None:
+            return
+        key, _, season_number, episode = location
+
+        show = self._own(key)
+        season = show["seasons"].get(season_number) if show else None
+        if season is None:
+            return
+
+        if episode is not None:
+            episodes = season["episodes"]
+            index = bisect.bisect_left(
+                episodes, (episode, record.path), key=_episode_sort_key
+            )
+            if index >= len(episodes) or episodes[index][1].path != record.path:
+                return
+            del episodes[index]
+            season["episode_count"] -= 1
+            show["episode_count"] -= 1
+        else:
+            if season["poster"] is None or season["poster"].path != record.path:
+                return
+            season["poster"] = None
+            show["season_poster_count"] -= 1
+
+        for node in (show, season):
+            node["size"] -= record.size
+        if record.modified >= season["modified"]:
+            self._stale.add(key)
+
+        if season["poster"] is None and not season["episodes"]:
+            del show["seasons"][season_number]
+            show["season_count"] -= 1
+        if not show["seasons"]:
+            del self.shows[key]
+            self._stale.discard(key)
+            _remove_sorted(self.keys, key)
+            library_keys = self.by_library.get(show["library"])
+            if library_keys is not None:
+                _remove_sorted(library_keys, key)
+                if not library_keys:
+                    del self.by_library[show["library"]]
+
+    def finish(self) -> "ShowTreeIndex":
+        """Recompute the newest mtimes a removal made stale"""
+        for key in self._stale:
+            show = self.shows.get(key)
+            if show is None:
+                continue
+            for season in show["seasons"].values():
+                season["modified"] = max(
+                    itertools.chain(
+                        (record.modified for _, record in season["episodes"]),
+                        (season["poster"].modified,) if season["poster"] else (),
+                    ),
+                    default=0,
+                )
+            show["modified"] = max(
+                (season["modified"] for season in show["seasons"].values()), default=0
+            )
+        self._stale = set()
+        return self
+
+    @staticmethod
+    def _summary(node: dict, children: str) -> dict:
+        return {k: v for k, v in node.items() if k != children}
+
+    def page(
+        self, library: Optional[str] = None, cursor: Optional[str] = None, limit: int = 50
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        One page of shows (without their seasons), ordered by key
+
+        Args:
+            library: Only shows of this library folder
+            cursor: Key of the last show of the previous page
+
+        Returns:
+            (shows, next_cursor)
+        """
+        keys = self.keys if library is None else self.by_library.get(library, [])
+        start = bisect.bisect_right(keys, cursor) if cursor else 0
+        page_keys = keys[start : start + limit]
+        next_cursor = (
+            page_keys[-1] if page_keys and start + limit < len(keys) else None
+        )
+        return [self._summary(self.shows[k], "seasons") for k in page_keys], next_cursor
+
+    def seasons(self, key: str) -> Optional[List[dict]]:
+        """Seasons of a show (without episodes), None if the show is unknown"""
+        show = self.shows.get(key)
+        if show is None:
+            return None
+        seasons = []
+        for number in sorted(show["seasons"]):
+            season = self._summary(show["seasons"][number], "episodes")
+            if season["poster"] is not None:
+                season["poster"] = season["poster"].to_dict()
+            seasons.append(season)
+        return seasons
+
+    def episodes(self, key: str, season: int) -> Optional[List[dict]]:
+        """Titlecards of one season, None if the show or season is unknown"""
+        show = self.shows.get(key)
+        node = show["seasons"].get(season) if show else None
+        if node is None:
+            return None
+        return [
+            {"episode": number, **record.to_dict()} for number, record in node["episodes"]
+        ]
+
+
+class AssetSnapshotBuilder:
+    """
+    Copy-on-write editor that derives the next snapshot from a published one
+
+    Only the type lists and folder summaries that are actually touched are
+    copied; the base snapshot is never modified.
+    """
+
+    def __init__(self, base: AssetSnapshot):
+        self.base = base
+        self.paths = dict(base.paths)
+        self._lists: Dict[str, List[AssetRecord]] = {}
+        self._folders: Dict[str, dict] = {f["name"]: f for f in base.folders}
+        self._copied_folders = set()
+        self._stale_folders = set()
+        self.stats = base.stats.copy()
+        self._shows: Optional[ShowTreeIndex] = None
+        self._search: Optional[AssetSearchIndex] = None
+        self._directories: Optional[AssetDirectoryIndex] = None
+        self.changed = False
+
+    def _list(self, type_key: str) -> List[AssetRecord]:
+        images = self._lists.get(type_key)
+        if images is None:
+            images = self._lists[type_key] = list(getattr(self.base, type_key))
+        return images
+
+    def _show_tree(self) -> ShowTreeIndex:
+        if self._shows is None:
+            self._shows = self.base.shows().copy()
+        return self._shows
+
+    def _search_index(self) -> AssetSearchIndex:
+        if self._search is None:
+            self._search = self.base.search_index().copy()
+        return self._search
+
+    def _directory_index(self) -> AssetDirectoryIndex:
+        if self._directories is None:
+            self._directories = self.base.directories().copy()
+        return self._directories
+
+    def _folder(self, folder_name: str, create: bool = False) -> Optional[dict]:
+        folder = self._folders.get(folder_name)
+        if folder is None:
+            if not create:
+                return None
+            folder = self._folders[folder_name] = new_asset_folder_entry(folder_name)
+        elif folder_name not in self._copied_folders:
+            folder = self._folders[folder_name] = dict(folder)
+        self._copied_folders.add(folder_name)
+        return folder
+
+    def remove(self, relative_path: str) -> bool:
+        """Remove a single image"""
+        record = self.paths.pop(relative_path, None)
+        if record is None:
+            return False
+        self.changed = True
+
+        if record.type:
+            images = self._list(record.type)
+            index = bisect.bisect_left(images, relative_path, key=_record_path)
+            if index < len(images) and images[index].path == relative_path:
+                del images[index]
+            if record.type in SHOW_TREE_TYPES:
+                self._show_tree().remove(record)
+
+        self.stats.remove(record)
+        self._search_index().remove(record)
+        self._directory_index().remove(record)
+        folder = self._folder(record.folder)
+        if folder:
+            folder["files"] -= 1
+            folder["size"] -= record.size
+            if record.type:
+                folder[ASSET_TYPE_COUNT_KEYS[record.type]] -= 1
+                folder["total_count"] -= 1
+            if folder["files"] <= 0:
+                del self._folders[record.folder]
+            elif record.modified >= folder.get("newest", 0):
+                # Recomputed in build()
+                self._stale_folders.add(record.folder)
+        return True
+
+    def upsert(self, record: AssetRecord) -> AssetRecord:
+        """Add or refresh a single image"""
+        self.remove(record.path)
+        self.changed = True
+
+        self.stats.add(record)
+        self._search_index().add(record)
+        self._directory_index().add(record)
+        folder = self._folder(record.folder, create=True)
+        folder["files"] += 1
+        folder["size"] += record.size
+        if record.modified > folder.get("newest", 0):
+            folder["newest"] = record.modified
+
+        if record.type:
+            bisect.insort(self._list(record.type), record, key=_record_path)
+            folder[ASSET_TYPE_COUNT_KEYS[record.type]] += 1
+            folder["total_count"] += 1
+            if record.type in SHOW_TREE_TYPES:
+                self._show_tree().add(record)
+
+        self.paths[record.path] = record
+        return record
+
+    def remove_tree(self, relative_dir: str, keep: Iterable[str] = ()) -> List[str]:
+        """Remove every image below a directory, except the paths in keep"""
+        prefix = relative_dir + os.sep
+        keep = set(keep)
+        stale = [p for p in self.paths if p.startswith(prefix) and p not in keep]
+        for path in stale:
+            self.remove(path)
+        return stale
+
+    def build(self, last_scanned: Optional[float] = None) -> AssetSnapshot:
+        """Create the new snapshot"""
+        lists = {
+            key: tuple(self._lists[key]) if key in self._lists else getattr(self.base, key)
+            for key in ASSET_TYPE_COUNT_KEYS
+        }
+        self.stats.refresh(lists)
+
+        # The newest image of these folders was removed, find the next newest
+        stale = {
+            name: folder
+            for name, folder in self._folders.items()
+            if name in self._stale_folders
+        }
+        if stale:
+            for folder in stale.values():
+                folder["newest"] = 0
+            for record in self.paths.values():
+                folder = stale.get(record.folder)
+                if folder is not None and record.modified > folder["newest"]:
+                    folder["newest"] = record.modified
+        self._stale_folders = set()
+
+        return AssetSnapshot(
+            lists,
+            tuple(sorted(self._folders.values(), key=lambda x: x["name"])),
+            self.paths,
+            self.base.last_scanned if last_scanned is None else last_scanned,
+            self.stats,
+            self._shows.finish() if self._shows is not None else self.base.shows(),
+            self._search if self._search is not None else self.base.search_index(),
+            self._directories if self._directories is not None else self.base.directories(),
+        )
+
+
+def encode_cursor(record: AssetRecord, sort: str) -> str:
+    """Opaque cursor pointing just behind a record in the given sort order"""
+    raw = json.dumps(list(SORT_KEYS[sort](record))).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple:
+    """Decode a cursor from encode_cursor, raises ValueError if malformed"""
+    try:
+        value, path = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(path, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return (value, path)
+
+
+def paginate(
+    view: tuple,
+    sort: str,
+    descending: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = 200,
+) -> Tuple[List[AssetRecord], Optional[str]]:
+    """
+    Keyset pagination over a sorted view
+
+    The cursor is located with a binary search, so every page costs
+    O(log n + limit) regardless of how deep into the view it is.
+
+    Returns:
+        (records of the page, cursor of the next page or None)
+    """
+    key = SORT_KEYS[sort]
+    position = decode_cursor(cursor) if cursor else None
+
+    try:
+        if not descending:
+            start = bisect.bisect_right(view, position, key=key) if position else 0
+            page = list(view[start : start + limit])
+            more = start + limit < len(view)
+        else:
+            end = (
+                bisect.bisect_left(view, position, key=key) if position else len(view)
+            )
+            start = max(0, end - limit)
+            page = list(reversed(view[start:end]))
+            more = start > 0
+    except TypeError as e:
+        # Cursor from a different sort order (e.g. a path where a size belongs)
+        raise ValueError(f"Cursor does not match sort order '{sort}'") from e
+
+    next_cursor = encode_cursor(page[-1], sort) if more and page else None
+    return page, next_cursor
@@ -0,0 +1,175 @@
+"""
+Database module for the persistent asset index (assets.db)
+
+Stores one row per image below ASSETS_DIR so the Web UI can serve the gallery
+right after startup and reconcile against the filesystem in the background.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Row layout shared with main.py: (path, type, size, mtime, ctime, folder)
+AssetRow = Tuple[str, str, int, float, float, str]
+
+
+class AssetIndexDB:
+    """Database class for the persisted asset index"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the database handler
+
+        Args:
+            db_path: Path to the database file
+        """
+        self.db_path = db_path
+        self.connection = None
+        # One connection is shared by the scan, watcher and request threads
+        self._lock = threading.Lock()
+
+    def connect(self):
+        """Establish database connection"""
+        logger.debug(f"Attempting to connect to asset index database: {self.db_path}")
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            logger.info(f"Connected to asset index database: {self.db_path}")
+        except sqlite3.Error as e:
+            logger.error(f"Error connecting to asset index database: {e}")
+            logger.exception("Full traceback:")
+            raise
+
+    def close(self):
+        """Close database connection"""
+        if self.connection:
+            with self._lock:
+                self.connection.close()
+                self.connection = None
+            logger.info("Asset index database connection closed")
+
+    def create_tables(self):
+        """Create the assets and asset_index_meta tables if they don't exist"""
+        logger.debug("Creating asset index tables if they don't exist...")
+        try:
+            with self._lock:
+                cursor = self.connection.cursor()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS assets (
+                        path TEXT PRIMARY KEY,
+                        type TEXT,
+                        size INTEGER,
+                        mtime REAL,
+                        ctime REAL,
+                        folder TEXT
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS asset_index_meta (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    )
+                """
+                )
+                self.connection.commit()
+            logger.info("Asset index tables created or already exist")
+        except sqlite3.Error as e:
+            logger.error(f"Error creating asset index tables: {e}")
+            logger.exception("Full traceback:")
+            raise
+
+    def initialize(self):
+        """Initialize the database (connect and create tables)"""
+        logger.info(f"Initializing asset index database: {self.db_path}")
+        self.connect()
+        self.create_tables()
+
+    def load_all(self) -> List[AssetRow]:
+        """Return every indexed asset row"""
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT path, type, size, mtime, ctime, folder FROM assets ORDER BY path"
+            )
+            return cursor.fetchall()
+
+    def replace_all(self, rows: Iterable[AssetRow]):
+        """Replace the whole index with the result of a full scan"""
+        start = time.time()
+        with self._lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute("BEGIN")
+                cursor.execute("DELETE FROM assets")
+                cursor.executemany(
+                    "INSERT INTO assets (path, type, size, mtime, ctime, folder) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                cursor.execute(
+                    "INSERT OR REPLACE INTO asset_index_meta (key, value) VALUES (?, ?)",
+                    ("last_full_scan", str(time.time())),
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error persisting asset index: {e}")
+                raise
+        logger.debug(f"Asset index persisted in {time.time() - start:.2f}s")
+
+    def apply_changes(self, upserts: Iterable[AssetRow], removals: Iterable[str]):
+        """Apply incremental changes (watcher deltas, deletes, uploads)"""
+        with self._lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.executemany(
+                    "DELETE FROM assets WHERE path = ?", [(p,) for p in removals]
+                )
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO assets (path, type, size, mtime, ctime, folder) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    upserts,
+                )
+                self.connection.commit()
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                logger.error(f"Error updating asset index: {e}")
+                raise
+
+    def get_last_full_scan(self) -> Optional[float]:
+        """Return the timestamp of the last persisted full scan, if any"""
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT value FROM asset_index_meta WHERE key = 'last_full_scan'"
+            )
+            row = cursor.fetchone()
+        try:
+            return float(row[0]) if row else None
+        except (TypeError, ValueError):
+            return None
+
+
+def init_asset_index_database(db_path: Path) -> AssetIndexDB:
+    """
+    Initialize the asset index database
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        AssetIndexDB: Initialized database instance
+    """
+    asset_db = AssetIndexDB(db_path)
+    asset_db.initialize()
+    return asset_db
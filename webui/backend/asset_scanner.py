@@ -0,0 +1,330 @@
+"""
+Asset Directory Scanner
+
+Walks the assets directory with os.scandir instead of Path.rglob:
+- Excluded directories (Synology @eaDir) are pruned before descending
+- File sizes and timestamps come from the DirEntry, so each image is stat'ed
+  at most once (and not at all on Windows, where scandir returns them)
+- Top-level library folders are walked in parallel with a thread pool, which
+  hides most of the per-directory latency on NFS/SMB mounts
+- Per-library progress and durations are kept for /api/cache/status
+- Differential scans remember each directory's mtime and only re-list
+  directories whose mtime changed, reusing the cached entries of all others.
+  A directory's mtime changes when entries are added, removed or renamed, but
+  not when a file is overwritten in place, so callers should still run a full
+  scan from time to time (or invalidate directories they know have changed).
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from asset_index import AssetRecord
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCLUDED_DIRS = {"@eaDir"}
+
+
+class CachedDirectory(NamedTuple):
+    """Listing of a directory as of its last mtime"""
+
+    mtime_ns: int
+    subdirs: tuple  # Full paths of (non-excluded) child directories
+    images: tuple  # AssetRecord entries of the directory itself, shared with the index
+
+
+class AssetScanner:
+    """Parallel, pruning directory walker for the assets directory"""
+
+    def __init__(
+        self,
+        root: Path,
+        image_extensions: Iterable[str],
+        excluded_dirs: Optional[Set[str]] = None,
+        max_workers: int = 8,
+        classify: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        """
+        Initialize the scanner
+
+        Args:
+            root: Directory to scan (ASSETS_DIR)
+            image_extensions: Lower-case file extensions to index, e.g. {".jpg"}
+            excluded_dirs: Directory names that are never descended into
+            max_workers: Number of library folders walked concurrently
+            classify: Maps a file name to its asset type key (or None)
+        """
+        self.root = Path(root)
+        self.image_extensions = {ext.lower() for ext in image_extensions}
+        self.excluded_dirs = (
+            set(excluded_dirs) if excluded_dirs else set(DEFAULT_EXCLUDED_DIRS)
+        )
+        self.max_workers = max(1, max_workers)
+        self.classify = classify or (lambda name: None)
+
+        # Progress of the current / last scan, guarded by _lock
+        self._lock = threading.Lock()
+        self.progress: Dict[str, dict] = {}
+        self.scan_started: float = 0
+        self.scan_duration: Optional[float] = None
+        self.scan_mode: Optional[str] = None
+
+        # Directory listings from the last scan, keyed by full directory path
+        self._dir_cache: Dict[str, CachedDirectory] = {}
+        self.last_full_scan: float = 0
+        # Paths invalidated while a scan runs (None when no scan is running),
+        # guarded by _lock
+        self._invalidated_during_scan: Optional[Set[str]] = None
+
+    def _is_image(self, name: str) -> bool:
+        return os.path.splitext(name)[1].lower() in self.image_extensions
+
+    def _relative(self, full_path: str) -> str:
+        return full_path[len(self._root_prefix) :]
+
+    @property
+    def _root_prefix(self) -> str:
+        return os.path.join(str(self.root), "")
+
+    def walk(
+        self,
+        directory: Path,
+        folder: Optional[str] = None,
+        dir_cache: Optional[Dict[str, CachedDirectory]] = None,
+        differential: bool = False,
+    ) -> List[AssetRecord]:
+        """
+        Walk a directory below the root and return all images in it.
+
+        Args:
+            directory: Directory to walk (must be inside the root)
+            folder: Library folder name to record; derived from the path if omitted
+            dir_cache: If given, every visited directory's listing is stored here
+            differential: Reuse listings from the previous scan for directories
+                whose mtime has not changed
+        """
+        directory = str(directory)
+        if folder is None:
+            relative = self._relative(os.path.join(directory, ""))
+            folder = relative.split(os.sep, 1)[0] if relative else "root"
+
+        images: List[AssetRecord] = []
+        stack = [directory]
+        dir_count = 0
+        reused_count = 0
+
+        while stack:
+            current = stack.pop()
+            dir_count += 1
+
+            mtime_ns = None
+            if dir_cache is not None:
+                try:
+                    # Taken before listing, so a change during listing is seen next time
+                    mtime_ns = os.stat(current).st_mtime_ns
+                except OSError as e:
+                    logger.warning(f"Cannot stat directory {current}: {e}")
+                    continue
+
+                if differential:
+                    cached = self._dir_cache.get(current)
+                    if cached is not None and cached.mtime_ns == mtime_ns:
+                        dir_cache[current] = cached
+                        images.extend(cached.images)
+                        stack.extend(cached.subdirs)
+                        reused_count += 1
+                        self._update_progress(
+                            folder,
+                            directories=dir_count,
+                            reused_directories=reused_count,
+                            files=len(images),
+                        )
+                        continue
+
+            subdirs = []
+            dir_images = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # Prune before descending
+                                if entry.name not in self.excluded_dirs:
+                                    subdirs.append(entry.path)
+                            elif self._is_image(entry.name):
+                                st = entry.stat()
+                                dir_images.append(
+                                    AssetRecord(
+                                        self._relative(entry.path),
+                                        folder,
+                                        self.classify(entry.name),
+                                        st.st_size,
+                                        st.st_ctime,
+                                        st.st_mtime,
+                                    )
+                                )
+                        except OSError as e:
+                            logger.warning(f"Cannot read {entry.path}: {e}")
+            except OSError as e:
+                logger.warning(f"Cannot list directory {current}: {e}")
+                continue
+
+            if dir_cache is not None:
+                dir_cache[current] = CachedDirectory(
+                    mtime_ns, tuple(subdirs), tuple(dir_images)
+                )
+            images.extend(dir_images)
+            stack.extend(subdirs)
+
+            self._update_progress(
+                folder,
+                directories=dir_count,
+                reused_directories=reused_count,
+                files=len(images),
+            )
+
+        return images
+
+    def invalidate(self, path: Path):
+        """
+        Forget cached listings for a path and its parent directory.
+
+        Called for changes the directory mtime does not reflect (files
+        overwritten in place), so the next differential scan re-lists them.
+        """
+        path = str(path)
+        with self._lock:
+            # A running scan may already have reused the stale listing
+            if self._invalidated_during_scan is not None:
+                self._invalidated_during_scan.add(path)
+            self._dir_cache.pop(path, None)
+            self._dir_cache.pop(os.path.dirname(path), None)
+
+    def _update_progress(self, folder: str, **values):
+        with self._lock:
+            entry = self.progress.get(folder)
+            if entry is not None:
+                entry.update(values)
+
+    def _scan_library(
+        self,
+        library_path: str,
+        folder: str,
+        dir_cache: Dict[str, CachedDirectory],
+        differential: bool,
+    ) -> List[AssetRecord]:
+        start = time.time()
+        self._update_progress(folder, status="scanning", started=start)
+        try:
+            images = self.walk(Path(library_path), folder, dir_cache, differential)
+            self._update_progress(
+                folder, status="done", duration=round(time.time() - start, 3)
+            )
+            return images
+        except Exception as e:
+            logger.error(f"Error scanning library folder {folder}: {e}")
+            self._update_progress(
+                folder, status="error", duration=round(time.time() - start, 3)
+            )
+            return []
+
+    def scan(self, full: bool = True) -> List[AssetRecord]:
+        """
+        Scan the whole root, one worker per top-level library folder
+
+        Args:
+            full: Re-list every directory. If False, only directories whose mtime
+                changed since the last scan are listed again.
+        """
+        differential = not full and bool(self._dir_cache)
+        self.scan_started = time.time()
+        self.scan_duration = None
+        self.scan_mode = "differential" if differential else "full"
+        dir_cache: Dict[str, CachedDirectory] = {}
+
+        libraries = []
+        images: List[AssetRecord] = []
+
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.excluded_dirs:
+                            libraries.append((entry.path, entry.name))
+                    elif self._is_image(entry.name):
+                        st = entry.stat()
+                        images.append(
+                            AssetRecord(
+                                entry.name,
+                                "root",
+                                self.classify(entry.name),
+                                st.st_size,
+                                st.st_ctime,
+                                st.st_mtime,
+                            )
+                        )
+                except OSError as e:
+                    logger.warning(f"Cannot read {entry.path}: {e}")
+
+        with self._lock:
+            self._invalidated_during_scan = set()
+            self.progress = {
+                name: {
+                    "status": "pending",
+                    "directories": 0,
+                    "reused_directories": 0,
+                    "files": 0,
+                    "started": None,
+                    "duration": None,
+                }
+                for _, name in libraries
+            }
+
+        workers = min(self.max_workers, len(libraries)) or 1
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="AssetScan"
+        ) as executor:
+            for library_images in executor.map(
+                lambda lib: self._scan_library(*lib, dir_cache, differential),
+                libraries,
+            ):
+                images.extend(library_images)
+
+        # Directories that disappeared drop out with the old cache; listings
+        # invalidated during the scan are not carried over
+        with self._lock:
+            for path in self._invalidated_during_scan:
+                dir_cache.pop(path, None)
+                dir_cache.pop(os.path.dirname(path), None)
+            self._invalidated_during_scan = None
+            self._dir_cache = dir_cache
+        if not differential:
+            self.last_full_scan = self.scan_started
+
+        self.scan_duration = round(time.time() - self.scan_started, 3)
+        logger.info(
+            f"Scanned {len(libraries)} library folder(s) with {workers} worker(s) "
+            f"({self.scan_mode}): {len(images)} images in {self.scan_duration}s"
+        )
+        return images
+
+    def get_status(self) -> dict:
+        """Progress of the current or last scan for /api/cache/status"""
+        with self._lock:
+            libraries = [
+                {"name": name, **values} for name, values in sorted(self.progress.items())
+            ]
+        return {
+            "started": self.scan_started or None,
+            "duration": self.scan_duration,
+            "mode": self.scan_mode,
+            "last_full_scan": self.last_full_scan or None,
+            "cached_directories": len(self._dir_cache),
+            "workers": self.max_workers,
+            "libraries": libraries,
+        }
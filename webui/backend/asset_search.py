@@ -0,0 +1,275 @@
+"""
+Asset Search Index
+
+Inverted index over the media items of the asset library, so the UI can
+search without downloading and filtering the full image lists.
+
+- An item is a title folder ("TV/Show (2020) {tvdb-123}"), or for file-based
+  assets a library folder plus the file name without its asset suffix
+- Names are parsed like get_assets_folders() does: "Title (Year) {tmdb-123}"
+- Title words and the year are tokenized into token -> item postings; the
+  sorted token list allows prefix matching with two binary searches
+- tmdb/tvdb/imdb IDs are exact-match dictionaries
+- Built once per scan and kept up to date by the snapshot builder: add() and
+  remove() on a copy() only copy the items and postings they touch
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+YEAR_RE = re.compile(r"\((\d{4})\)")
+PROVIDER_ID_RES = {
+    "tmdb": re.compile(r"[\[{(]?tmdb-(\d+)[\]})]?", re.IGNORECASE),
+    "tvdb": re.compile(r"[\[{(]?tvdb-(\d+)[\]})]?", re.IGNORECASE),
+    "imdb": re.compile(r"[\[{(]?imdb-(tt\d+)[\]})]?", re.IGNORECASE),
+}
+# Provider ID typed into the search box: "tmdb-123", "tmdb:123", "imdb tt123"
+QUERY_ID_RE = re.compile(r"^\s*(tmdb|tvdb|imdb)[\s:\-=]*((?:tt)?\d+)\s*$", re.IGNORECASE)
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Suffixes of file-based assets ("Show (2020)_Season01.jpg")
+FILE_ASSET_SUFFIX_RE = re.compile(r"_(?:background|Season\d+|S\d+E\d+)$")
+
+
+def parse_item_name(name: str) -> dict:
+    """Title, year and provider IDs of a folder name like "Title (Year) {tmdb-123}" """
+    title = name
+    year = ""
+    year_match = YEAR_RE.search(name)
+    if year_match:
+        year = year_match.group(1)
+        title = name[: year_match.start()].strip()
+    else:
+        # Without a year, drop trailing ID brackets from the title
+        title = re.sub(r"\s*[\[{(][a-z]+-[^\]})]*[\]})]", "", name).strip() or name
+
+    ids = {}
+    for provider, pattern in PROVIDER_ID_RES.items():
+        match = pattern.search(name)
+        ids[provider] = match.group(1).lower() if match else None
+    return {"title": title, "year": year, **ids}
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def _remove_sorted(values: List[str], value: str):
+    index = bisect.bisect_left(values, value)
+    if index < len(values) and values[index] == value:
+        del values[index]
+
+
+class AssetSearchIndex:
+    """Token and provider ID index over the items of a snapshot"""
+
+    __slots__ = ("items", "postings", "tokens", "ids", "posters", "_owned")
+
+    def __init__(self, records: Iterable = ()):
+        """
+        Args:
+            records: AssetRecords of a snapshot (path, folder, type, url)
+        """
+        self.items: Dict[str, dict] = {}
+        # Token / provider ID -> keys of the items having it
+        self.postings: Dict[str, Set[str]] = {}
+        self.ids: Dict[str, Dict[str, Set[str]]] = {p: {} for p in PROVIDER_ID_RES}
+        self.tokens: List[str] = []
+        # Item key -> URLs of its posters, sorted (the first one is shown)
+        self.posters: Dict[str, List[str]] = {}
+        self._owned = None  # (kind, key) entries this copy may modify (None: all)
+
+        for record in records:
+            self._add(record, sort=False)
+        for key, urls in self.posters.items():
+            urls.sort()
+            self.items[key]["poster"] = urls[0]
+        self.tokens = sorted(self.postings)
+
+    @staticmethod
+    def _item_of(record) -> Tuple[str, str]:
+        """(key, name) of the item an image belongs to"""
+        directory, _, file_name = record.url_path.rpartition("/")
+        if "/" in directory:
+            # Folder-based: Library/Title (Year) {tmdb-1}/poster.jpg
+            name = directory.rpartition("/")[2]
+            return directory, name
+        # File-based (or loose files): Library/Title (Year) {tmdb-1}_S01E01.jpg
+        stem = file_name.rsplit(".", 1)[0]
+        name = FILE_ASSET_SUFFIX_RE.sub("", stem)
+        return (f"{directory}/{name}" if directory else name), name
+
+    @staticmethod
+    def _item_tokens(item: dict) -> Set[str]:
+        return set(tokenize(item["title"])) | ({item["year"]} - {""})
+
+    def copy(self) -> "AssetSearchIndex":
+        """Copy sharing items and postings until they are modified"""
+        index = AssetSearchIndex.__new__(AssetSearchIndex)
+        index.items = dict(self.items)
+        index.postings = dict(self.postings)
+        index.ids = {provider: dict(values) for provider, values in self.ids.items()}
+        index.tokens = list(self.tokens)
+        index.posters = dict(self.posters)
+        index._owned = set()
+        return index
+
+    def _own(self, kind: str, key: str, mapping: dict, copy):
+        """Entry of mapping that this copy may modify (copied on first use)"""
+        value = mapping.get(key)
+        if value is not None and self._owned is not None and (kind, key) not in self._owned:
+            value = mapping[key] = copy(value)
+            self._owned.add((kind, key))
+        return value
+
+    def _claim(self, kind: str, key: str):
+        if self._owned is not None:
+            self._owned.add((kind, key))
+
+    def add(self, record):
+        """Add an image to its item (creating the item if needed)"""
+        self._add(record, sort=True)
+
+    def _add(self, record, sort: bool):
+        key, name = self._item_of(record)
+        item = self._own("item", key, self.items, dict)
+        if item is None:
+            item = self.items[key] = {
+                "key": key,
+                "name": name,
+                "library": record.folder,
+                **parse_item_name(name),
+                "asset_count": 0,
+                "poster": None,
+            }
+            self._claim("item", key)
+            for token in self._item_tokens(item):
+                self._index("token", self.postings, token, key, sort)
+            for provider, values in self.ids.items():
+                if item[provider]:
+                    self._index(provider, values, item[provider], key, sort)
+
+        item["asset_count"] += 1
+        if record.type == "posters":
+            urls = self._own("poster", key, self.posters, list)
+            if urls is None:
+                urls = self.posters[key] = []
+                self._claim("poster", key)
+            if sort:
+                bisect.insort(urls, record.url)
+                item["poster"] = urls[0]
+            else:
+                urls.append(record.url)
+
+    def _index(self, kind: str, mapping: dict, value: str, key: str, sort: bool):
+        keys = self._own(kind, value, mapping, set)
+        if keys is None:
+            keys = mapping[value] = set()
+            self._claim(kind, value)
+            if sort and mapping is self.postings:
+                bisect.insort(self.tokens, value)
+        keys.add(key)
+
+    def _unindex(self, kind: str, mapping: dict, value: str, key: str):
+        keys = self._own(kind, value, mapping, set)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del mapping[value]
+            if mapping is self.postings:
+                _remove_sorted(self.tokens, value)
+
+    def remove(self, record):
+        """Remove an image from its item (dropping the item with its last image)"""
+        key, _ = self._item_of(record)
+        item = self._own("item", key, self.items, dict)
+        if item is None:
+            return
+
+        item["asset_count"] -= 1
+        if record.type == "posters":
+            urls = self._own("poster", key, self.posters, list)
+            if urls is not None and record.url in urls:
+                urls.remove(record.url)
+                if not urls:
+                    del self.posters[key]
+                item["poster"] = urls[0] if urls else None
+
+        if item["asset_count"] <= 0:
+            del self.items[key]
+            self.posters.pop(key, None)
+            for token in self._item_tokens(item):
+                self._unindex("token", self.postings, token, key)
+            for provider, values in self.ids.items():
+                if item[provider]:
+                    self._unindex(provider, values, item[provider], key)
+
+    def _prefix_matches(self, prefix: str) -> set:
+        """Items with any token starting with prefix"""
+        start = bisect.bisect_left(self.tokens, prefix)
+        end = bisect.bisect_left(self.tokens, prefix + "\U0010ffff")
+        matches = set()
+        for token in self.tokens[start:end]:
+            matches.update(self.postings[token])
+        return matches
+
+    def search(
+        self,
+        query: str = "",
+        tmdb: Optional[str] = None,
+        tvdb: Optional[str] = None,
+        imdb: Optional[str] = None,
+        library: Optional[str] = None,
+        limit: int = 50,
+    ) -> dict:
+        """
+        Find items by title/year words and/or provider IDs
+
+        Every query word must be the prefix of a title word (or the year) of an
+        item. IDs are exact matches. All given criteria must match.
+
+        Returns:
+            dict with the matching items (best first) and the total match count
+        """
+        requested_ids = {"tmdb": tmdb, "tvdb": tvdb, "imdb": imdb}
+        id_query = QUERY_ID_RE.match(query or "")
+        if id_query:
+            requested_ids[id_query.group(1).lower()] = id_query.group(2)
+            query = ""
+
+        candidates: Optional[set] = None
+        for provider, value in requested_ids.items():
+            if value:
+                found = set(self.ids[provider].get(str(value).strip().lower(), ()))
+                candidates = found if candidates is None else candidates & found
+
+        words = tokenize(query or "")
+        # Most selective words first, stop as soon as nothing is left
+        for word in sorted(words, key=len, reverse=True):
+            if candidates is not None and not candidates:
+                break
+            found = self._prefix_matches(word)
+            candidates = found if candidates is None else candidates & found
+
+        if not candidates:
+            return {"results": [], "total": 0}
+
+        results = [self.items[key] for key in candidates]
+        if library is not None:
+            results = [item for item in results if item["library"] == library]
+
+        # Exact title first, then titles starting with the query, then the rest
+        phrase = " ".join(words)
+
+        def rank(item):
+            title = " ".join(tokenize(item["title"]))
+            return (
+                0 if title == phrase else 1 if title.startswith(phrase) else 2,
+                item["title"].lower(),
+                item["key"],
+            )
+
+        results.sort(key=rank)
+        return {"results": results[:limit], "total": len(results)}
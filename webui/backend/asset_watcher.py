@@ -0,0 +1,231 @@
+"""
+Assets Directory Watcher
+
+Monitors the assets directory for image changes (Posterizarr runs, uploads,
+deletes from the Web UI or external tools) and forwards them to the asset cache
+as incremental deltas, so the cache no longer depends on full rescans.
+
+Features:
+- Recursive watchdog observer on the assets directory
+- Batches and debounces events so a run writing thousands of files results
+  in a handful of cache updates
+- Ignores Synology @eaDir folders and non-image files
+- Thread-safe background flushing
+- Falls back gracefully (is_running stays False) if the observer cannot start,
+  e.g. when the inotify watch limit is exhausted
+"""
+
+import logging
+import time
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Set
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+class AssetsWatcher:
+    """
+    File system watcher for the assets directory
+    Collects changed paths and hands them to a callback in batches
+    """
+
+    def __init__(
+        self,
+        assets_dir: Path,
+        on_changes: Callable[[Set[str]], None],
+        debounce_seconds: float = 2.0,
+        max_delay_seconds: float = 10.0,
+    ):
+        """
+        Initialize the assets watcher
+
+        Args:
+            assets_dir: Path to the assets directory to watch
+            on_changes: Called with a set of absolute paths (files or directories)
+                that were created, modified, moved or deleted
+            debounce_seconds: Quiet period before a batch is flushed
+            max_delay_seconds: Flush at the latest after this long, even during
+                a continuous stream of events (e.g. a running Posterizarr job)
+        """
+        self.assets_dir = Path(assets_dir)
+        self.on_changes = on_changes
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+
+        self.observer: Any = None  # watchdog.observers.Observer instance
+        self.handler: Any = None  # AssetsFileHandler instance
+        self.flush_thread: Optional[threading.Thread] = None
+        self.is_running = False
+
+        # Pending changes, guarded by _lock
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._first_event_time: float = 0
+        self._last_event_time: float = 0
+
+        # Statistics for /api/cache/status
+        self.events_received = 0
+        self.batches_flushed = 0
+        self.last_flush_time: float = 0
+
+        logger.info(f"AssetsWatcher initialized for directory: {self.assets_dir}")
+
+    def start(self):
+        """Start watching the assets directory"""
+        if self.is_running:
+            logger.warning("AssetsWatcher is already running")
+            return
+
+        if not self.assets_dir.exists():
+            logger.error(f"Assets directory does not exist: {self.assets_dir}")
+            return
+
+        try:
+            self.handler = AssetsFileHandler(self)
+            self.observer = Observer()
+            self.observer.schedule(self.handler, str(self.assets_dir), recursive=True)
+            self.observer.start()
+            self.is_running = True
+
+            self.flush_thread = threading.Thread(
+                target=self._flush_loop, daemon=True, name="AssetsWatcherFlush"
+            )
+            self.flush_thread.start()
+
+            logger.info(f"[OK] Assets watcher started - monitoring: {self.assets_dir}")
+            logger.debug(
+                f"  Debounce: {self.debounce_seconds}s, max delay: {self.max_delay_seconds}s"
+            )
+        except Exception as e:
+            # Typically "inotify watch limit reached" on very large trees
+            logger.error(f"Failed to start assets watcher: {e}", exc_info=True)
+            self.is_running = False
+            try:
+                if self.observer:
+                    self.observer.stop()
+            except Exception:
+                pass
+            self.observer = None
+
+    def stop(self):
+        """Stop watching the assets directory"""
+        if not self.is_running:
+            logger.debug("AssetsWatcher is not running, nothing to stop")
+            return
+
+        self.is_running = False
+        try:
+            if self.observer:
+                self.observer.stop()
+                self.observer.join(timeout=5)
+            if self.flush_thread:
+                self.flush_thread.join(timeout=5)
+            logger.info("AssetsWatcher stopped")
+        except Exception as e:
+            logger.error(f"Error stopping AssetsWatcher: {e}", exc_info=True)
+
+    def queue_paths(self, paths: Iterable[str]):
+        """Queue changed paths for the next batch"""
+        now = time.time()
+        with self._lock:
+            if not self._pending:
+                self._first_event_time = now
+            for path in paths:
+                if "@eaDir" in Path(path).parts:
+                    continue
+                self._pending.add(path)
+                self.events_received += 1
+            self._last_event_time = now
+
+    @property
+    def pending_count(self) -> int:
+        """Number of changed paths waiting for the next flush"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """Hand all pending changes to the callback immediately"""
+        with self._lock:
+            if not self._pending:
+                return
+            batch = self._pending
+            self._pending = set()
+
+        logger.debug(f"Flushing {len(batch)} asset change(s)")
+        try:
+            self.on_changes(batch)
+            self.batches_flushed += 1
+            self.last_flush_time = time.time()
+        except Exception as e:
+            logger.error(f"Error applying asset changes: {e}", exc_info=True)
+
+    def _flush_loop(self):
+        """Background thread that flushes batches once events have settled"""
+        while self.is_running:
+            time.sleep(0.5)
+            with self._lock:
+                if not self._pending:
+                    continue
+                now = time.time()
+                settled = now - self._last_event_time >= self.debounce_seconds
+                overdue = now - self._first_event_time >= self.max_delay_seconds
+            if settled or overdue:
+                self.flush()
+
+        # Apply whatever is left when stopping
+        self.flush()
+
+
+class AssetsFileHandler(FileSystemEventHandler):
+    """File system event handler for the assets directory"""
+
+    IGNORED_EVENTS = {"opened", "closed_no_write"}
+
+    def __init__(self, watcher: AssetsWatcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        """Queue image files and directories touched by the event"""
+        if event.event_type in self.IGNORED_EVENTS:
+            return
+
+        # A directory's own mtime changes whenever its entries do; the entries
+        # themselves produce events, so directory modifications carry no news
+        if event.is_directory and event.event_type in ("modified", "closed"):
+            return
+
+        paths = [event.src_path]
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:
+            paths.append(dest_path)
+
+        relevant = [
+            str(p)
+            for p in paths
+            if event.is_directory or Path(str(p)).suffix.lower() in IMAGE_EXTENSIONS
+        ]
+        if relevant:
+            self.watcher.queue_paths(relevant)
+
+
+def create_assets_watcher(
+    assets_dir: Path, on_changes: Callable[[Set[str]], None]
+) -> AssetsWatcher:
+    """
+    Factory function to create an AssetsWatcher
+
+    Args:
+        assets_dir: Path to the assets directory
+        on_changes: Callback receiving batches of changed paths
+
+    Returns:
+        Configured AssetsWatcher instance
+    """
+    logger.info(f"Creating assets watcher for: {assets_dir}")
+    return AssetsWatcher(assets_dir=assets_dir, on_changes=on_changes)
@@ -3,6 +3,7 @@ Database module for managing imagechoices.db
 """
 
 import sqlite3
+import threading
 from pathlib import Path
 import logging
 
@@ -21,6 +22,13 @@ class ImageChoicesDB:
         """
         self.db_path = db_path
         self.connection = None
+        # The connection is shared by request handlers and background threads;
+        # statements that belong together (a transaction, a query and its
+        # fetch) run under this lock
+        self.lock = threading.RLock()
+        # Bumped on every change, lets readers cache derived data (e.g. encoded
+        # /api/imagechoices responses) until the table changes
+        self.generation = 0
 
     def connect(self):
         """Establish database connection"""
@@ -68,6 +76,27 @@ class ImageChoicesDB:
                 )
             """
             )
+            # Materialized /api/recent-assets feed, rebuilt from imagechoices
+            # and the asset index whenever either changes
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS recent_assets (
+                    choice_id INTEGER PRIMARY KEY,
+                    Title TEXT,
+                    Type TEXT,
+                    Rootfolder TEXT,
+                    LibraryName TEXT,
+                    Language TEXT,
+                    TextTruncated TEXT,
+                    DownloadSource TEXT,
+                    FavProviderLink TEXT,
+                    is_manually_created INTEGER,
+                    poster_url TEXT NOT NULL,
+                    created REAL,
+                    modified REAL
+                )
+            """
+            )
             self.connection.commit()
             logger.info("Table 'imagechoices' created or already exists")
             logger.debug("Table creation/verification complete")
@@ -221,6 +250,7 @@ class ImageChoicesDB:
                         updated_count += 1
 
             self.connection.commit()
+            self.generation += 1
             logger.info(
                 f"ID extraction completed: {updated_count} records updated with extracted IDs"
             )
@@ -329,38 +359,40 @@ class ImageChoicesDB:
         Returns:
             int: ID of the inserted record
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                INSERT INTO imagechoices 
-                (Title, Type, Rootfolder, LibraryName, Language, Fallback, 
-                 TextTruncated, DownloadSource, FavProviderLink, Manual,
-                 tmdbid, tvdbid, imdbid)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    title,
-                    type_,
-                    rootfolder,
-                    library_name,
-                    language,
-                    fallback,
-                    text_truncated,
-                    download_source,
-                    fav_provider_link,
-                    manual,
-                    tmdbid,
-                    tvdbid,
-                    imdbid,
-                ),
-            )
-            self.connection.commit()
-            logger.info(f"Inserted new record for title: {title}")
-            return cursor.lastrowid
-        except sqlite3.Error as e:
-            logger.error(f"Error inserting record: {e}")
-            raise
+        with self.lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO imagechoices 
+                    (Title, Type, Rootfolder, LibraryName, Language, Fallback, 
+                     TextTruncated, DownloadSource, FavProviderLink, Manual,
+                     tmdbid, tvdbid, imdbid)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        title,
+                        type_,
+                        rootfolder,
+                        library_name,
+                        language,
+                        fallback,
+                        text_truncated,
+                        download_source,
+                        fav_provider_link,
+                        manual,
+                        tmdbid,
+                        tvdbid,
+                        imdbid,
+                    ),
+                )
+                self.connection.commit()
+                self.generation += 1
+                logger.info(f"Inserted new record for title: {title}")
+                return cursor.lastrowid
+            except sqlite3.Error as e:
+                logger.error(f"Error inserting record: {e}")
+                raise
 
     def get_all_choices(self):
         """
@@ -369,13 +401,14 @@ class ImageChoicesDB:
         Returns:
             list: List of all records
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT * FROM imagechoices ORDER BY id DESC")
-            return cursor.fetchall()
-        except sqlite3.Error as e:
-            logger.error(f"Error fetching records: {e}")
-            raise
+        with self.lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute("SELECT * FROM imagechoices ORDER BY id DESC")
+                return cursor.fetchall()
+            except sqlite3.Error as e:
+                logger.error(f"Error fetching records: {e}")
+                raise
 
     def get_choice_by_title(self, title: str):
         """
@@ -387,13 +420,14 @@ class ImageChoicesDB:
         Returns:
             sqlite3.Row or None: Record if found, None otherwise
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT * FROM imagechoices WHERE Title = ?", (title,))
-            return cursor.fetchone()
-        except sqlite3.Error as e:
-            logger.error(f"Error fetching record by title: {e}")
-            raise
+        with self.lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute("SELECT * FROM imagechoices WHERE Title = ?", (title,))
+                return cursor.fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Error fetching record by title: {e}")
+                raise
 
     def get_choice_by_id(self, record_id: int):
         """
@@ -405,13 +439,30 @@ class ImageChoicesDB:
         Returns:
             sqlite3.Row or None: Record if found, None otherwise
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT * FROM imagechoices WHERE id = ?", (record_id,))
-            return cursor.fetchone()
-        except sqlite3.Error as e:
-            logger.error(f"Error fetching record by ID: {e}")
-            raise
+        with self.lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute("SELECT * FROM imagechoices WHERE id = ?", (record_id,))
+                return cursor.fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Error fetching record by ID: {e}")
+                raise
+
+    def get_rootfolders(self) -> set:
+        """
+        Get the distinct Rootfolder values of all records
+
+        Returns:
+            set: Rootfolder names
+        """
+        with self.lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute("SELECT DISTINCT Rootfolder FROM imagechoices")
+                return {row[0] for row in cursor.fetchall() if row[0]}
+            except sqlite3.Error as e:
+                logger.error(f"Error fetching rootfolders: {e}")
+                raise
 
     def update_choice(self, record_id: int, **kwargs):
         """
@@ -421,45 +472,47 @@ class ImageChoicesDB:
             record_id: ID of the record to update
             **kwargs: Fields to update
         """
-        try:
-            # Build the UPDATE query dynamically
-            fields = []
-            values = []
-            for key, value in kwargs.items():
-                if key in [
-                    "Title",
-                    "Type",
-                    "Rootfolder",
-                    "LibraryName",
-                    "Language",
-                    "Fallback",
-                    "TextTruncated",
-                    "DownloadSource",
-                    "FavProviderLink",
-                    "Manual",
-                    "tmdbid",
-                    "tvdbid",
-                    "imdbid",
-                ]:
-                    fields.append(f"{key} = ?")
-                    values.append(value)
-
-            if not fields:
-                logger.warning("No valid fields to update")
-                return
-
-            # Add updated_at timestamp
-            fields.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(record_id)
-
-            query = f"UPDATE imagechoices SET {', '.join(fields)} WHERE id = ?"
-            cursor = self.connection.cursor()
-            cursor.execute(query, values)
-            self.connection.commit()
-            logger.info(f"Updated record ID: {record_id}")
-        except sqlite3.Error as e:
-            logger.error(f"Error updating record: {e}")
-            raise
+        with self.lock:
+            try:
+                # Build the UPDATE query dynamically
+                fields = []
+                values = []
+                for key, value in kwargs.items():
+                    if key in [
+                        "Title",
+                        "Type",
+                        "Rootfolder",
+                        "LibraryName",
+                        "Language",
+                        "Fallback",
+                        "TextTruncated",
+                        "DownloadSource",
+                        "FavProviderLink",
+                        "Manual",
+                        "tmdbid",
+                        "tvdbid",
+                        "imdbid",
+                    ]:
+                        fields.append(f"{key} = ?")
+                        values.append(value)
+
+                if not fields:
+                    logger.warning("No valid fields to update")
+                    return
+
+                # Add updated_at timestamp
+                fields.append("updated_at = CURRENT_TIMESTAMP")
+                values.append(record_id)
+
+                query = f"UPDATE imagechoices SET {', '.join(fields)} WHERE id = ?"
+                cursor = self.connection.cursor()
+                cursor.execute(query, values)
+                self.connection.commit()
+                self.generation += 1
+                logger.info(f"Updated record ID: {record_id}")
+            except sqlite3.Error as e:
+                logger.error(f"Error updating record: {e}")
+                raise
 
     def delete_choice(self, record_id: int):
         """
@@ -468,14 +521,64 @@ class ImageChoicesDB:
         Args:
             record_id: ID of the record to delete
         """
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("DELETE FROM imagechoices WHERE id = ?", (record_id,))
-            self.connection.commit()
-            logger.info(f"Deleted record ID: {record_id}")
-        except sqlite3.Error as e:
-            logger.error(f"Error deleting record: {e}")
-            raise
+        with self.lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute("DELETE FROM imagechoices WHERE id = ?", (record_id,))
+                self.connection.commit()
+                self.generation += 1
+                logger.info(f"Deleted record ID: {record_id}")
+            except sqlite3.Error as e:
+                logger.error(f"Error deleting record: {e}")
+                raise
+
+    def replace_recent_assets(self, rows: list):
+        """
+        Replace the materialized recent assets feed
+
+        Args:
+            rows: Tuples in recent_assets column order (choice_id first)
+        """
+        with self.lock:
+            try:
+                with self.connection:
+                    self.connection.execute("DELETE FROM recent_assets")
+                    self.connection.executemany(
+                        """
+                        INSERT INTO recent_assets
+                        (choice_id, Title, Type, Rootfolder, LibraryName, Language,
+                         TextTruncated, DownloadSource, FavProviderLink,
+                         is_manually_created, poster_url, created, modified)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                        rows,
+                    )
+                logger.debug(f"Recent assets feed rebuilt with {len(rows)} record(s)")
+            except sqlite3.Error as e:
+                logger.error(f"Error rebuilding recent assets: {e}")
+                raise
+
+    def get_recent_assets(self, limit: int = 100):
+        """
+        Get the materialized recent assets, newest first
+
+        Args:
+            limit: Maximum number of records
+
+        Returns:
+            list: List of recent_assets records
+        """
+        with self.lock:
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute(
+                    "SELECT * FROM recent_assets ORDER BY choice_id DESC LIMIT ?",
+                    (limit,),
+                )
+                return cursor.fetchall()
+            except sqlite3.Error as e:
+                logger.error(f"Error fetching recent assets: {e}")
+                raise
 
     def import_from_csv(self, csv_path: Path) -> dict:
         """
@@ -517,12 +620,13 @@ class ImageChoicesDB:
                         type_ = row.get("Type", "").strip('"').strip()
 
                         # Check if record already exists (based on Title, Rootfolder AND Type)
-                        cursor = self.connection.cursor()
-                        cursor.execute(
-                            "SELECT id FROM imagechoices WHERE Title = ? AND Rootfolder = ? AND Type = ?",
-                            (title, rootfolder, type_),
-                        )
-                        existing = cursor.fetchone()
+                        with self.lock:
+                            cursor = self.connection.cursor()
+                            cursor.execute(
+                                "SELECT id FROM imagechoices WHERE Title = ? AND Rootfolder = ? AND Type = ?",
+                                (title, rootfolder, type_),
+                            )
+                            existing = cursor.fetchone()
 
                         if existing:
                             stats["skipped"] += 1
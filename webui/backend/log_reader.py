@@ -0,0 +1,622 @@
+"""
+Log Reader
+
+Reads parts of (possibly very large) log files without loading them whole.
+
+- tail_lines() seeks backwards from the end of the file in blocks and stops
+  as soon as it has the requested number of qualifying lines, so the cost of
+  /api/status, /api/logs/{name} and the /ws/logs backlog no longer grows with
+  the size of the log
+- LogLineIndex keeps a sparse line -> byte offset index (one checkpoint
+  every LINE_INDEX_STRIDE lines, with the timestamp of that line), so any
+  page of a log, or the first line at a given time, is reached with one seek
+  and a short forward read
+- Line indexes are persisted as small JSON files, extended incrementally as
+  the log grows and rebuilt after truncation or rotation
+- LogSearch scans a log forward in chunks for lines matching a substring or
+  regex, log levels and a time range; chunks without a possible match are
+  skipped without splitting them into lines
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per backwards step
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _decode_line(raw: bytes) -> str:
+    # Same result as text mode with universal newlines for "\r\n" endings
+    if raw.endswith(b"\r"):
+        raw = raw[:-1]
+    return raw.decode("utf-8", errors="ignore")
+
+
+def tail_lines(
+    path: Path,
+    count: int,
+    select: Optional[Callable[[str], Optional[str]]] = None,
+    keepends: bool = False,
+    block_size: int = TAIL_BLOCK_SIZE,
+    end: Optional[int] = None,
+) -> List[str]:
+    """
+    Last lines of a file, read backwards from the end
+
+    Args:
+        path: Log file
+        count: Number of lines to return
+        select: Maps a line to the value to return, or None to skip the line
+            (skipped lines do not count towards count)
+        keepends: Keep the "\\n" of terminated lines, like readlines()
+        block_size: Bytes read per backwards step
+        end: Only read the bytes before this offset (default: end of file)
+
+    Returns:
+        Up to count lines in file order
+    """
+    if count <= 0:
+        return []
+
+    found: List[str] = []  # Newest first
+
+    def take(raw: bytes, terminated: bool) -> bool:
+        line = _decode_line(raw)
+        if keepends and terminated:
+            line += "\n"
+        if select is not None:
+            line = select(line)
+            if line is None:
+                return False
+        found.append(line)
+        return len(found) >= count
+
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        if end is not None:
+            position = max(min(position, end), 0)
+        buffer = b""
+        last_segment = True  # The text after the final newline
+
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            buffer = f.read(size) + buffer
+
+            # The first part may continue in the previous block
+            parts = buffer.split(b"\n")
+            buffer = parts[0]
+            for raw in reversed(parts[1:]):
+                if last_segment:
+                    last_segment = False
+                    # A file ending with "\n" has no line after it
+                    if raw and take(raw, terminated=False):
+                        return found[::-1]
+                    continue
+                if take(raw, terminated=True):
+                    return found[::-1]
+
+        # First line of the file
+        if buffer or not last_segment:
+            take(buffer, terminated=not last_segment)
+
+    return found[::-1][-count:]
+
+
+# Lines between two checkpoints of a line index
+LINE_INDEX_STRIDE = 1000
+LINE_INDEX_VERSION = 1
+# Bytes read per step while extending an index
+INDEX_CHUNK_SIZE = 1024 * 1024
+# Start of the file remembered to notice a log that was replaced in place
+HEAD_SIGNATURE_SIZE = 64
+
+# "[2025-01-31 12:00:00] [INFO]    |L.123  | ..." (Posterizarr.ps1 Write-Entry)
+LOG_TIMESTAMP_RE = re.compile(rb"^(?:\xef\xbb\xbf)?\[(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})")
+
+
+def parse_log_timestamp(line: bytes) -> Optional[str]:
+    """Timestamp at the start of a log line as "YYYY-MM-DD HH:MM:SS", else None"""
+    match = LOG_TIMESTAMP_RE.match(line)
+    if not match:
+        return None
+    return match.group(1).decode("ascii").replace("T", " ")
+
+
+class LogLineIndex:
+    """
+    Sparse line -> byte offset index of one log file
+
+    checkpoints[i] is the byte offset of line i * stride, times[i] the
+    timestamp of that line (None if it has none). Only newline-terminated
+    lines are indexed; an unterminated last line is still readable.
+    """
+
+    def __init__(self, path: Path, index_path: Path, stride: int = LINE_INDEX_STRIDE):
+        self.path = Path(path)
+        self.index_path = Path(index_path)
+        self.stride = stride
+        self._lock = threading.Lock()
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        self.file_id: Optional[Tuple[int, int]] = None
+        self.head = b""
+        self.indexed_size = 0  # Bytes up to and including the last indexed newline
+        self.line_count = 0  # Newline-terminated lines in indexed_size
+        self.checkpoints: List[int] = [0]
+        self.times: List[Optional[str]] = [None]
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != LINE_INDEX_VERSION or data.get("stride") != self.stride:
+                return
+            self.file_id = tuple(data["file_id"]) if data.get("file_id") else None
+            self.head = bytes.fromhex(data["head"])
+            self.indexed_size = data["indexed_size"]
+            self.line_count = data["line_count"]
+            self.checkpoints = data["checkpoints"]
+            self.times = data["times"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable log index {self.index_path.name}: {e}")
+            self._reset()
+
+    def _save(self):
+        data = {
+            "version": LINE_INDEX_VERSION,
+            "stride": self.stride,
+            "file_id": list(self.file_id) if self.file_id else None,
+            "head": self.head.hex(),
+            "indexed_size": self.indexed_size,
+            "line_count": self.line_count,
+            "checkpoints": self.checkpoints,
+            "times": self.times,
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not save log index {self.index_path.name}: {e}")
+
+    def _is_same_file(self, f, st: os.stat_result) -> bool:
+        if self.file_id is None:
+            return False
+        if (st.st_dev, st.st_ino) != tuple(self.file_id) or st.st_size < self.indexed_size:
+            return False
+        # Same inode rewritten from the start (e.g. truncated and regrown)
+        f.seek(0)
+        return f.read(len(self.head)) == self.head
+
+    def update(self) -> os.stat_result:
+        """
+        Bring the index up to date with the file
+
+        Reads only what was appended since the last update; starts over if the
+        file was truncated or replaced (rotation).
+
+        Returns:
+            The stat result the index was updated against
+        """
+        with self._lock:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if not self._is_same_file(f, st):
+                    if self.file_id is not None:
+                        logger.info(f"Rebuilding line index of {self.path.name} (log was rotated)")
+                    self._reset()
+                    self.file_id = (st.st_dev, st.st_ino)
+                if st.st_size <= self.indexed_size:
+                    return st
+
+                if len(self.head) < HEAD_SIGNATURE_SIZE:
+                    f.seek(0)
+                    self.head = f.read(min(HEAD_SIGNATURE_SIZE, st.st_size))
+
+                indexed_size = self.indexed_size
+                new_checkpoints = self._scan(f, st.st_size)
+                for offset in new_checkpoints:
+                    f.seek(offset)
+                    self.times.append(parse_log_timestamp(f.readline(64)))
+                self.checkpoints.extend(new_checkpoints)
+            # Nothing to save while only an unterminated line grows
+            if self.indexed_size != indexed_size or new_checkpoints:
+                self._save()
+            return st
+
+    def _scan(self, f, size: int) -> List[int]:
+        """Count newlines from indexed_size to size, returning new checkpoint offsets"""
+        new_checkpoints: List[int] = []
+        next_line = len(self.checkpoints) * self.stride
+        position = self.indexed_size
+        f.seek(position)
+
+        while position < size:
+            chunk = f.read(min(INDEX_CHUNK_SIZE, size - position))
+            if not chunk:
+                break
+            newlines = chunk.count(b"\n")
+            needed = next_line - self.line_count
+            if newlines >= needed:
+                # ends[k] + k + 1 is the offset after the (k + 1)-th newline
+                ends = list(accumulate(map(len, chunk.split(b"\n"))))
+                while needed <= newlines:
+                    k = needed - 1
+                    new_checkpoints.append(position + ends[k] + k + 1)
+                    next_line += self.stride
+                    needed += self.stride
+            self.line_count += newlines
+
+            last_newline = chunk.rfind(b"\n")
+            if last_newline >= 0:
+                self.indexed_size = position + last_newline + 1
+            position += len(chunk)
+
+        return new_checkpoints
+
+    def total_lines(self, st: os.stat_result) -> int:
+        # An unterminated last line counts too
+        return self.line_count + (1 if st.st_size > self.indexed_size else 0)
+
+    def read_lines(self, offset: int, limit: int) -> List[str]:
+        """Lines offset .. offset + limit - 1 (0-based), like readlines()"""
+        if limit <= 0 or offset < 0:
+            return []
+        with self._lock:
+            checkpoint = min(offset // self.stride, len(self.checkpoints) - 1)
+            start = self.checkpoints[checkpoint]
+            skip = offset - checkpoint * self.stride
+
+        lines: List[str] = []
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            for _ in range(skip):
+                if not f.readline():
+                    return []
+            while len(lines) < limit:
+                raw = f.readline()
+                if not raw:
+                    break
+                terminated = raw.endswith(b"\n")
+                line = _decode_line(raw[:-1] if terminated else raw)
+                lines.append(line + "\n" if terminated else line)
+        return lines
+
+    def seek_time(self, timestamp: str) -> Tuple[int, int]:
+        """
+        Line number and byte offset of the first line logged at or after timestamp
+
+        Assumes timestamps grow through the file. Returns the total line
+        count and the file size if no line is that late.
+        """
+        timestamp = timestamp.strip().replace("T", " ")
+        with self._lock:
+            known = [(t, i) for i, t in enumerate(self.times) if t is not None]
+            start_checkpoint = 0
+            # Last checkpoint known to be earlier; the match is after it
+            position = bisect.bisect_left(known, (timestamp, -1))
+            if position > 0:
+                start_checkpoint = known[position - 1][1]
+            offset = self.checkpoints[start_checkpoint]
+            line_number = start_checkpoint * self.stride
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                line_time = parse_log_timestamp(raw)
+                if line_time is not None and line_time >= timestamp:
+                    return line_number, offset
+                line_number += 1
+                offset += len(raw)
+        return line_number, offset
+
+    def find_time(self, timestamp: str) -> int:
+        """Line number of the first line logged at or after timestamp"""
+        return self.seek_time(timestamp)[0]
+
+    def get_stats(self) -> dict:
+        return {
+            "file": self.path.name,
+            "indexed_size": self.indexed_size,
+            "lines": self.line_count,
+            "checkpoints": len(self.checkpoints),
+        }
+
+
+class LogIndexStore:
+    """One LogLineIndex per log file, persisted in index_dir"""
+
+    def __init__(self, index_dir: Path, stride: int = LINE_INDEX_STRIDE):
+        self.index_dir = Path(index_dir)
+        self.stride = stride
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, LogLineIndex] = {}
+
+    def get(self, path: Path) -> LogLineIndex:
+        key = str(path)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                # Logs and UILogs may hold files of the same name
+                name = f"{Path(path).parent.name}_{Path(path).name}.json"
+                index = LogLineIndex(path, self.index_dir / name, self.stride)
+                self._indexes[key] = index
+            return index
+
+
+# Bytes scanned per search step (one step per worker thread call)
+SEARCH_CHUNK_SIZE = 1024 * 1024
+
+# "[timestamp] [LEVEL]" at the start of a log line
+LOG_LEVEL_RE = re.compile(r"^\ufeff?\[[^\]]*\]\s*\[([A-Za-z]+)\s*\]")
+TIMESTAMP_PARAM_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2})(:\d{2})?$")
+
+
+def normalize_log_timestamp(value: str, end: bool = False) -> str:
+    """
+    Bring a timestamp parameter into log format ("YYYY-MM-DD HH:MM:SS")
+
+    Seconds are optional; they default to :00, or :59 for the end of a range.
+
+    Raises:
+        ValueError: If the value is not a timestamp
+    """
+    match = TIMESTAMP_PARAM_RE.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid timestamp '{value}', expected YYYY-MM-DD HH:MM[:SS]")
+    seconds = match.group(3) or (":59" if end else ":00")
+    return f"{match.group(1)} {match.group(2)}{seconds}"
+
+
+def _line_time(line: str) -> Optional[str]:
+    return parse_log_timestamp(line[:32].encode("utf-8", errors="ignore"))
+
+
+class LogSearch:
+    """
+    Forward scan of a log for matching lines, one chunk per scan_chunk() call
+
+    All given criteria must match. Lines without a timestamp (continuation
+    lines) use the timestamp of the line before them. The scan ends at the
+    first line logged after `until`, as timestamps grow through the file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        query: Optional[str] = None,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        levels: Optional[List[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        start_offset: int = 0,
+        start_line: int = 0,
+    ):
+        """
+        Args:
+            path: Log file
+            query: Substring or regular expression to look for
+            regex: Treat query as a regular expression
+            case_sensitive: Match query case-sensitively
+            levels: Log levels to keep, e.g. ["ERROR", "WARNING"]
+            since/until: Time range in log format (see normalize_log_timestamp)
+            start_offset/start_line: Where to start (a line start, e.g. from
+                LogLineIndex.seek_time)
+
+        Raises:
+            re.error: If query is an invalid regular expression
+        """
+        self.path = Path(path)
+        self.since = since
+        self.until = until
+        self.levels = {level.strip().upper() for level in levels or () if level.strip()}
+
+        self.pattern = None
+        self.needle = None
+        flags = 0 if case_sensitive else re.IGNORECASE
+        if query:
+            if regex:
+                self.pattern = re.compile(query, flags)
+            else:
+                self.needle = query if case_sensitive else query.lower()
+        self.case_sensitive = case_sensitive
+
+        # Finds candidate lines in a whole chunk (each is checked again on its own)
+        if query:
+            self.finder = re.compile(query if regex else re.escape(query), flags | re.MULTILINE)
+        else:
+            self.finder = re.compile("|".join(re.escape(f"[{level}") for level in sorted(self.levels)))
+
+        self.offset = start_offset
+        self.line_number = start_line
+        self.scanned_lines = 0
+        self.done = False
+        self._last_time: Optional[str] = None
+        self._partial = b""
+        self._file = None
+
+    def _chunk_may_match(self, text: str) -> bool:
+        """Cheap whole-chunk test before looking at single lines"""
+        if self.needle is not None:
+            haystack = text if self.case_sensitive else text.lower()
+            if self.needle not in haystack:
+                return False
+        # The finder is compiled with re.MULTILINE, so ^ and $ work per line
+        if self.pattern is not None and not self.finder.search(text):
+            return False
+        if self.levels and not any(f"[{level}" in text for level in self.levels):
+            return False
+        return True
+
+    def _line_matches(self, line: str) -> Optional[str]:
+        """Level of a matching line ("" if it has none), or None"""
+        level_match = LOG_LEVEL_RE.match(line)
+        level = level_match.group(1).upper() if level_match else ""
+        if self.levels and level not in self.levels:
+            return None
+        if self.needle is not None:
+            if self.needle not in (line if self.case_sensitive else line.lower()):
+                return None
+        if self.pattern is not None and not self.pattern.search(line):
+            return None
+        return level
+
+    def scan_chunk(self) -> Optional[List[dict]]:
+        """
+        Scan the next chunk (blocking, run it in a worker thread)
+
+        Returns:
+            The matches of the chunk (possibly empty), or None once the scan
+            is complete
+        """
+        if self.done:
+            return None
+        if self._file is None:
+            self._file = open(self.path, "rb")
+            self._file.seek(self.offset)
+
+        chunk = self._file.read(SEARCH_CHUNK_SIZE)
+        if not chunk:
+            # An unterminated last line is searched as well
+            data, self._partial = self._partial, b""
+            self.done = True
+            if not data:
+                return None
+        else:
+            # Keep an unterminated last line for the next chunk
+            data, newline, self._partial = (self._partial + chunk).rpartition(b"\n")
+            if not newline:
+                return []
+
+        text = data.decode("utf-8", errors="ignore")
+        if "\r" in text:
+            # CRLF logs: match chunks and single lines on the same text
+            text = text.replace("\r\n", "\n")
+        time_filtered = self.since is not None or self.until is not None
+        if not time_filtered:
+            return self._scan_candidates(text)
+
+        lines = text.split("\n")
+        matches: List[dict] = []
+
+        if not self._chunk_may_match(text):
+            self.line_number += len(lines)
+            self.scanned_lines += len(lines)
+            if time_filtered:
+                # Carry the newest timestamp; past `until` nothing can follow
+                for line in reversed(lines):
+                    line_time = _line_time(line)
+                    if line_time is not None:
+                        self._last_time = line_time
+                        break
+                if self.until is not None and (self._last_time or "") > self.until:
+                    self.done = True
+            return matches
+
+        for line in lines:
+            line_number = self.line_number
+            self.line_number += 1
+            self.scanned_lines += 1
+            line = line.rstrip("\r")
+
+            if time_filtered:
+                line_time = _line_time(line)
+                if line_time is not None:
+                    self._last_time = line_time
+                if self._last_time is None:
+                    if self.since is not None:
+                        continue
+                else:
+                    if self.until is not None and self._last_time > self.until:
+                        self.done = True
+                        break
+                    if self.since is not None and self._last_time < self.since:
+                        continue
+
+            level = self._line_matches(line)
+            if level is None:
+                continue
+            matches.append(
+                {
+                    "type": "match",
+                    "line": line_number,
+                    "timestamp": self._last_time if time_filtered else _line_time(line),
+                    "level": level or None,
+                    "content": line,
+                }
+            )
+        return matches
+
+    def _scan_candidates(self, text: str) -> List[dict]:
+        """Matches of a chunk without time filter: only lines the finder hits are looked at"""
+        matches: List[dict] = []
+        line_number = self.line_number
+        counted = 0  # Position up to which newlines were counted into line_number
+        position = 0
+
+        # Plain substrings are found with str.find, much faster than a regex
+        haystack = None
+        if self.needle is not None:
+            haystack = text if self.case_sensitive else text.lower()
+            if len(haystack) != len(text):
+                haystack = None  # Lower-casing changed positions, use the regex
+
+        while position <= len(text):
+            if haystack is not None:
+                match_start = haystack.find(self.needle, position)
+                if match_start < 0:
+                    break
+            else:
+                found = self.finder.search(text, position)
+                if found is None:
+                    break
+                match_start = found.start()
+            line_start = text.rfind("\n", 0, match_start) + 1
+            line_end = text.find("\n", match_start)
+            if line_end < 0:
+                line_end = len(text)
+            line_number += text.count("\n", counted, line_start)
+            counted = line_start
+
+            line = text[line_start:line_end].rstrip("\r")
+            level = self._line_matches(line)
+            if level is not None:
+                matches.append(
+                    {
+                        "type": "match",
+                        "line": line_number,
+                        "timestamp": _line_time(line),
+                        "level": level or None,
+                        "content": line,
+                    }
+                )
+            # Continue at the next line, a match may have run across lines
+            position = line_end + 1
+
+        line_count = text.count("\n") + 1
+        self.line_number += line_count
+        self.scanned_lines += line_count
+        return matches
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
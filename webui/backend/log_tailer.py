@@ -0,0 +1,385 @@
+"""
+Shared Log Tailer
+
+One tailer task per log file reads new bytes once and fans the lines out to
+every subscriber (/ws/logs connections), instead of each connection stat'ing
+and reopening the file several times per second.
+
+Features:
+- watchdog events on the log directories wake the tailer immediately; a slow
+  safety poll covers mounts that deliver no events. The observer of the logs
+  watcher is reused when it runs, so no second inotify observer is started
+- Falls back to polling (0.3s) if watchdog is missing or its observer cannot
+  start (e.g. inotify watch limit reached)
+- Handles truncation and rotation (file shrank or was replaced)
+- Subscribers get batches of lines through queues bounded by line count; a
+  subscriber that falls behind loses lines (reported with a marker) instead of
+  stalling the tailer or the other subscribers
+- Subscribers collect lines into frames (up to FRAME_MAX_LINES lines or
+  FRAME_MAX_DELAY seconds), so bursts are not sent one message per line
+- The tailer task stops when its last subscriber leaves
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Wait between checks without file events (polling fallback)
+POLL_INTERVAL = 0.3
+# Safety re-check while events are available (e.g. missed events on bind mounts)
+EVENT_SAFETY_INTERVAL = 2.0
+# Bytes read per step, so a burst never blocks on one huge read
+READ_CHUNK_SIZE = 1024 * 1024
+# Lines queued per subscriber before new lines are dropped for it
+SUBSCRIBER_MAX_LINES = 20000
+# WebSocket frames carry up to this many lines, sent at least every FRAME_MAX_DELAY
+FRAME_MAX_LINES = 500
+FRAME_MAX_DELAY = 0.1
+
+
+class LogSubscription:
+    """
+    A subscriber's queue of new lines
+
+    The queue is bounded by the number of queued lines (its depth). Lines
+    that do not fit are dropped for this subscriber alone (oldest first), and
+    a marker with the number of dropped lines is queued in their place, so a
+    slow client never stalls the tailer or the other clients.
+    """
+
+    def __init__(self, tailer: "LogTailer", max_lines: int = SUBSCRIBER_MAX_LINES):
+        self.tailer = tailer
+        self.max_lines = max_lines
+        # Items are lists of lines or an int (number of dropped lines)
+        self.queue: "asyncio.Queue[Union[List[str], int]]" = asyncio.Queue()
+        self.queued_lines = 0
+        self.dropped_lines = 0
+        self._gap = 0  # Dropped lines not yet reported to the client
+
+    def publish(self, lines: List[str]):
+        """Queue a batch without blocking the tailer (keeps only the newest lines that fit)"""
+        room = max(self.max_lines - self.queued_lines, 0)
+        if len(lines) > room:
+            dropped = len(lines) - room
+            self._gap += dropped
+            self.dropped_lines += dropped
+            lines = lines[dropped:]
+            if not lines:
+                return
+        if self._gap:
+            self.queue.put_nowait(self._gap)
+            self._gap = 0
+        self.queue.put_nowait(lines)
+        self.queued_lines += len(lines)
+
+    def _take(self, item) -> Union[List[str], int]:
+        if isinstance(item, list):
+            self.queued_lines -= len(item)
+        return item
+
+    async def get_frames(
+        self, max_lines: int = FRAME_MAX_LINES, max_delay: float = FRAME_MAX_DELAY
+    ) -> List[Tuple[str, Union[List[str], int]]]:
+        """
+        Wait for new lines and collect them into frames
+
+        After the first batch arrives, keeps collecting for up to max_delay
+        seconds or until max_lines lines are together.
+
+        Returns:
+            ("lines", [...]) frames of at most max_lines lines each, with
+            ("dropped", count) frames where lines were dropped
+        """
+        loop = asyncio.get_running_loop()
+        items = [self._take(await self.queue.get())]
+        line_count = len(items[0]) if isinstance(items[0], list) else 0
+        deadline = loop.time() + max_delay
+
+        while line_count < max_lines:
+            try:
+                item = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            items.append(self._take(item))
+            if isinstance(item, list):
+                line_count += len(item)
+
+        # Report a gap that has not been followed by new lines yet
+        if self._gap and self.queue.empty():
+            items.append(self._gap)
+            self._gap = 0
+
+        frames: List[Tuple[str, Union[List[str], int]]] = []
+        for item in items:
+            if isinstance(item, int):
+                frames.append(("dropped", item))
+                continue
+            for start in range(0, len(item), max_lines):
+                chunk = item[start : start + max_lines]
+                if frames and frames[-1][0] == "lines" and (
+                    len(frames[-1][1]) + len(chunk) <= max_lines
+                ):
+                    frames[-1][1].extend(chunk)
+                else:
+                    frames.append(("lines", list(chunk)))
+        return frames
+
+
+class LogTailer:
+    """Follows one log file and publishes new lines to its subscribers"""
+
+    def __init__(self, path: Path, use_events: bool):
+        self.path = Path(path)
+        self.use_events = use_events
+        self.subscribers: Set[LogSubscription] = set()
+        self.task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+
+        # Read position and identity of the file it belongs to
+        self.position = 0
+        self.file_id = None
+        self._partial = b""
+        # Offset after the last line handed to the subscribers; a new
+        # subscriber's backlog ends here so no line is sent twice
+        self.published_position = 0
+        self._init_position()
+
+        # Statistics for /api/log-stream/status
+        self.reads = 0
+        self.lines_published = 0
+
+    def _init_position(self):
+        # New subscribers only get lines written from now on
+        try:
+            st = os.stat(self.path)
+            self.position = st.st_size
+            self.file_id = (st.st_dev, st.st_ino)
+        except OSError:
+            self.position = 0
+            self.file_id = None
+        self.published_position = self.position
+
+    def wake(self):
+        """Called (in the event loop) when the file may have changed"""
+        self._wake.set()
+
+    def _read_new(self) -> Tuple[List[str], int]:
+        """
+        Read everything appended since the last read (runs in a worker thread)
+
+        Returns:
+            The new complete lines and the offset after the last of them
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return [], self.published_position
+
+        file_id = (st.st_dev, st.st_ino)
+        if file_id != self.file_id or st.st_size < self.position:
+            if self.file_id is not None:
+                logger.info(f"Log file {self.path.name} was truncated or rotated")
+            self.file_id = file_id
+            self.position = 0
+            self._partial = b""
+
+        if st.st_size <= self.position:
+            return [], self.position - len(self._partial)
+
+        lines: List[str] = []
+        with open(self.path, "rb") as f:
+            f.seek(self.position)
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.position += len(chunk)
+                data = self._partial + chunk
+                # Keep an unterminated last line until the rest is written
+                complete, _, self._partial = data.rpartition(b"\n")
+                if complete:
+                    for line in complete.decode("utf-8", errors="ignore").splitlines():
+                        stripped = line.strip()
+                        if stripped:
+                            lines.append(stripped)
+        self.reads += 1
+        return lines, self.position - len(self._partial)
+
+    async def run(self):
+        """Tail the file until the last subscriber leaves"""
+        interval = EVENT_SAFETY_INTERVAL if self.use_events else POLL_INTERVAL
+        logger.debug(f"Log tailer started for {self.path.name} (interval {interval}s)")
+        try:
+            while self.subscribers:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+
+                try:
+                    lines, end = await asyncio.to_thread(self._read_new)
+                except OSError as e:
+                    logger.warning(f"Error reading log file {self.path.name}: {e}")
+                    await asyncio.sleep(1)  # Wait longer on file errors
+                    continue
+
+                # Updated in the event loop together with publishing, so it
+                # always matches what subscribers have been sent
+                self.published_position = end
+                if lines:
+                    self.lines_published += len(lines)
+                    for subscriber in list(self.subscribers):
+                        subscriber.publish(lines)
+        finally:
+            logger.debug(f"Log tailer stopped for {self.path.name}")
+
+    def get_stats(self) -> dict:
+        return {
+            "file": self.path.name,
+            "subscribers": len(self.subscribers),
+            "position": self.position,
+            "published_position": self.published_position,
+            "reads": self.reads,
+            "lines_published": self.lines_published,
+            "queue_depths": [s.queued_lines for s in self.subscribers],
+            "dropped_lines": sum(s.dropped_lines for s in self.subscribers),
+        }
+
+
+class _LogEventHandler(FileSystemEventHandler if WATCHDOG_AVAILABLE else object):
+    """Forwards file events of tailed logs to their tailer"""
+
+    def __init__(self, hub: "LogTailerHub"):
+        super().__init__()
+        self.hub = hub
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                self.hub.notify(str(path))
+
+
+class LogTailerHub:
+    """Creates and shares one LogTailer per log file"""
+
+    def __init__(self):
+        self.tailers: Dict[str, LogTailer] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.observer: Any = None  # watchdog.observers.Observer instance
+        self.owns_observer = False  # False when borrowed from the logs watcher
+        self._watched_dirs: Set[str] = set()
+        self.events_available = False
+
+    def use_observer(self, observer: Any):
+        """
+        Schedule the log directory watches on an already running observer
+        (the logs watcher's) instead of starting a separate one
+
+        Must be called before the first subscription.
+        """
+        if self.observer is not None:
+            return
+        self.observer = observer
+        self.owns_observer = False
+        self.events_available = True
+
+    def _ensure_started(self):
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        if self.observer is not None or not WATCHDOG_AVAILABLE:
+            return
+        try:
+            self.observer = Observer()
+            self.observer.start()
+            self.owns_observer = True
+            self.events_available = True
+        except Exception as e:
+            logger.warning(f"Log file events unavailable, polling instead: {e}")
+            self.observer = None
+
+    def _watch_directory(self, directory: Path):
+        if self.observer is None or str(directory) in self._watched_dirs:
+            return
+        try:
+            self.observer.schedule(_LogEventHandler(self), str(directory), recursive=False)
+            self._watched_dirs.add(str(directory))
+        except Exception as e:
+            # Directory missing or watch limit reached, its tailers poll instead
+            logger.warning(f"Cannot watch log directory {directory}: {e}")
+
+    def notify(self, path: str):
+        """Called from the watchdog thread for every event in a watched directory"""
+        tailer = self.tailers.get(path)
+        if tailer is not None and self.loop is not None:
+            self.loop.call_soon_threadsafe(tailer.wake)
+
+    def subscribe(self, path: Path) -> LogSubscription:
+        """Start receiving new lines of a log file (must run in the event loop)"""
+        self._ensure_started()
+        key = str(path)
+        tailer = self.tailers.get(key)
+        if tailer is None:
+            self._watch_directory(Path(path).parent)
+            tailer = LogTailer(
+                path, use_events=str(Path(path).parent) in self._watched_dirs
+            )
+            self.tailers[key] = tailer
+
+        subscription = LogSubscription(tailer)
+        tailer.subscribers.add(subscription)
+        if tailer.task is None or tailer.task.done():
+            tailer.task = asyncio.create_task(tailer.run())
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription):
+        """Stop receiving lines; the tailer stops with its last subscriber"""
+        tailer = subscription.tailer
+        tailer.subscribers.discard(subscription)
+        if not tailer.subscribers:
+            if tailer.task is not None:
+                tailer.task.cancel()
+            if self.tailers.get(str(tailer.path)) is tailer:
+                del self.tailers[str(tailer.path)]
+
+    def stop(self):
+        for tailer in list(self.tailers.values()):
+            if tailer.task is not None:
+                tailer.task.cancel()
+        self.tailers.clear()
+        if self.observer is not None:
+            # A borrowed observer is stopped by its owner
+            if self.owns_observer:
+                try:
+                    self.observer.stop()
+                    self.observer.join(timeout=5)
+                except Exception as e:
+                    logger.error(f"Error stopping log tailer observer: {e}")
+            self.observer = None
+            self._watched_dirs.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "events": self.events_available,
+            "tailers": [tailer.get_stats() for tailer in self.tailers.values()],
+        }
@@ -5,6 +5,7 @@ from fastapi import (
     HTTPException,
     Query,
     Request,
+    Response,
     UploadFile,
     File,
     Form,
@@ -12,7 +13,7 @@ from fastapi import (
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import json
@@ -21,7 +22,7 @@ import asyncio
 import os
 import httpx
 from pathlib import Path
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Tuple
 import logging
 import re
 import time
@@ -127,16 +128,21 @@ FONTPREVIEWS_DIR = BASE_DIR / "fontpreviews"
 DATABASE_DIR = BASE_DIR / "database"
 RUNNING_FILE = TEMP_DIR / "Posterizarr.Running"
 IMAGECHOICES_DB_PATH = DATABASE_DIR / "imagechoices.db"
+ASSET_INDEX_DB_PATH = DATABASE_DIR / "assets.db"
+THUMBNAILS_DIR = BASE_DIR / "cache" / "thumbnails"
+LOG_INDEX_DIR = BASE_DIR / "cache" / "logindex"
 
 # Clear UILogs on startup - remove all log files
 import glob
 
-for log_file in glob.glob(str(UI_LOGS_DIR / "*.log")):
-    try:
-        os.remove(log_file)
-        pass  # Silent - no console output
-    except Exception as e:
-        pass  # Silent - no console output
+# Not when multiprocessing re-imports this script in a worker (__mp_main__)
+if __name__ != "__mp_main__":
+    for log_file in glob.glob(str(UI_LOGS_DIR / "*.log")):
+        try:
+            os.remove(log_file)
+            pass  # Silent - no console output
+        except Exception as e:
+            pass  # Silent - no console output
 
 # Determine log level from config file or environment variable or default to INFO
 LOG_LEVEL_MAP = {
@@ -482,6 +488,74 @@ except ImportError as e:
     )
     logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
 
+# Import assets watcher module
+try:
+    logger.debug("Attempting to import asset_watcher module")
+    from asset_watcher import create_assets_watcher
+
+    ASSETS_WATCHER_AVAILABLE = True
+    logger.info("Assets watcher module loaded successfully")
+except ImportError as e:
+    ASSETS_WATCHER_AVAILABLE = False
+    logger.warning(
+        f"Assets watcher not available: {e}. Asset cache will rely on periodic rescans."
+    )
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import thumbnail cache (requires Pillow)
+try:
+    logger.debug("Attempting to import thumbnail_cache module")
+    from thumbnail_cache import PILLOW_AVAILABLE, ThumbnailCache, media_type_for
+
+    THUMBNAILS_AVAILABLE = PILLOW_AVAILABLE
+    if THUMBNAILS_AVAILABLE:
+        logger.info("Thumbnail cache module loaded successfully")
+    else:
+        logger.warning(
+            "Pillow not available. Gallery thumbnails will fall back to full images."
+        )
+except ImportError as e:
+    THUMBNAILS_AVAILABLE = False
+    logger.warning(
+        f"Thumbnail cache not available: {e}. Gallery thumbnails will fall back to full images."
+    )
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import asset index and scanner (standard library only, always available)
+from asset_index import (
+    ASSET_TYPE_COUNT_KEYS,
+    AssetRecord,
+    AssetSnapshot,
+    AssetSnapshotBuilder,
+    SIZE_HISTOGRAM_BOUNDS,
+    SORT_KEYS,
+    estimate_memory,
+    paginate,
+)
+from asset_scanner import AssetScanner
+from manual_assets_index import ManualAssetsIndex
+
+# Import encoded response cache (orjson is optional, falls back to json)
+from response_cache import ORJSON_AVAILABLE, EncodedResponseCache, FastJSONResponse
+
+# Import shared log tailer for /ws/logs (watchdog is optional, falls back to polling)
+from log_tailer import WATCHDOG_AVAILABLE as LOG_EVENTS_AVAILABLE, LogTailerHub
+from log_reader import LogIndexStore, LogSearch, normalize_log_timestamp, tail_lines
+
+# Import asset index database module
+try:
+    logger.debug("Attempting to import asset_index_database module")
+    from asset_index_database import init_asset_index_database, AssetIndexDB
+
+    ASSET_INDEX_DB_AVAILABLE = True
+    logger.info("Asset index database module loaded successfully")
+except ImportError as e:
+    ASSET_INDEX_DB_AVAILABLE = False
+    logger.warning(
+        f"Asset index database not available: {e}. Startup will wait for a full asset scan."
+    )
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
 logger.info("Module loading completed")
 logger.debug(f"Config Mapper: {CONFIG_MAPPER_AVAILABLE}")
 logger.debug(f"Scheduler: {SCHEDULER_AVAILABLE}")
@@ -490,6 +564,11 @@ logger.debug(f"Database: {DATABASE_AVAILABLE}")
 logger.debug(f"Config Database: {CONFIG_DATABASE_AVAILABLE}")
 logger.debug(f"Runtime Database: {RUNTIME_DB_AVAILABLE}")
 logger.debug(f"Logs Watcher: {LOGS_WATCHER_AVAILABLE}")
+logger.debug(f"Assets Watcher: {ASSETS_WATCHER_AVAILABLE}")
+logger.debug(f"Asset Index Database: {ASSET_INDEX_DB_AVAILABLE}")
+logger.debug(f"orjson: {ORJSON_AVAILABLE}")
+logger.debug(f"Thumbnails: {THUMBNAILS_AVAILABLE}")
+logger.debug(f"Log file events: {LOG_EVENTS_AVAILABLE}")
 
 current_process: Optional[subprocess.Popen] = None
 current_mode: Optional[str] = None
@@ -497,11 +576,19 @@ current_start_time: Optional[str] = None
 scheduler: Optional["PosterizarrScheduler"] = None
 db: Optional["ImageChoicesDB"] = None
 config_db: Optional["ConfigDB"] = None
+asset_index_db: Optional["AssetIndexDB"] = None
+thumbnail_cache: Optional["ThumbnailCache"] = None
+
+# One tailer per log file, shared by all /ws/logs connections
+log_tailer_hub = LogTailerHub()
+# Sparse line offset indexes for paging through large logs
+log_index_store = LogIndexStore(LOG_INDEX_DIR)
 
 # Initialize cache variables early to prevent race conditions
 cache_refresh_task = None
 cache_refresh_running = False
-cache_scan_in_progress = False
+assets_watcher = None
+manual_assets_watcher = None
 
 
 def check_directory_permissions(
@@ -561,6 +648,10 @@ def check_directory_permissions(
     return result
 
 
+# (mtime_ns, size) of the last imported ImageChoices.csv
+imagechoices_csv_signature = None
+
+
 def import_imagechoices_to_db():
     """
     Import ImageChoices.csv from Logs directory to database
@@ -570,14 +661,25 @@ def import_imagechoices_to_db():
         logger.debug("Database not available, skipping CSV import")
         return
 
+    global imagechoices_csv_signature
+
     csv_path = LOGS_DIR / "ImageChoices.csv"
-    if not csv_path.exists():
+    try:
+        csv_stat = csv_path.stat()
+    except OSError:
         logger.debug("ImageChoices.csv does not exist yet, skipping import")
         return
 
+    # Skip re-reading a CSV that has not changed since the last import
+    signature = (csv_stat.st_mtime_ns, csv_stat.st_size)
+    if signature == imagechoices_csv_signature:
+        logger.debug("ImageChoices.csv unchanged since last import, skipping")
+        return
+
     try:
         logger.info(" Importing ImageChoices.csv to database...")
         stats = db.import_from_csv(csv_path)
+        imagechoices_csv_signature = signature
 
         if stats["added"] > 0:
             logger.info(
@@ -595,6 +697,9 @@ def import_imagechoices_to_db():
 
     except Exception as e:
         logger.error(f"Error importing CSV to database: {e}")
+        return
+
+    request_recent_assets_refresh()
 
 
 def parse_version(version_str: str) -> tuple:
@@ -788,165 +893,687 @@ def is_titlecard_file(filename: str) -> bool:
 # ============================================================================
 CACHE_TTL_SECONDS = 180  # Cache data for 3 minutes (only for statistics)
 CACHE_REFRESH_INTERVAL = 180  # Refresh cache every 3 minutes for faster gallery updates
-
-asset_cache = {
-    "last_scanned": 0,
-    "posters": [],
-    "backgrounds": [],
-    "seasons": [],
-    "titlecards": [],
-    "folders": [],
-}
+CACHE_CONSISTENCY_INTERVAL = 3600  # Rescan interval while the assets watcher is active
+CACHE_FULL_SCAN_INTERVAL = 6 * 3600  # Periodic rescans re-list every directory this often
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+# In-memory index of the manual assets gallery, updated by the upload, replace
+# and delete endpoints and rebuilt with the periodic asset rescans
+manual_assets_index = ManualAssetsIndex(MANUAL_ASSETS_DIR, IMAGE_EXTENSIONS)
+
+# Current snapshot of the asset index. Published snapshots are never modified;
+# scans and incremental changes build a new one and swap the reference, so
+# readers neither wait nor see a half-applied refresh.
+asset_cache = AssetSnapshot.empty()
+
+# Serializes writers (scan publish, watcher deltas); readers never take it.
+# Only held while a new snapshot is derived, never for disk or database I/O
+asset_cache_lock = threading.Lock()
+# Serializes writes to the asset index database
+asset_index_write_lock = threading.Lock()
+# Generation of the snapshot last written to the database in full
+asset_index_persisted_generation = 0
+# Paths whose current state still has to be written, guarded by
+# asset_index_dirty_lock (flushed by whoever holds asset_index_write_lock)
+asset_index_dirty_paths: set = set()
+asset_index_dirty_lock = threading.Lock()
+# Held for the duration of a scan, only one scan runs at a time
+asset_scan_lock = threading.Lock()
+# Paths changed while a scan is running, re-applied on top of its result
+asset_scan_pending: Optional[set] = None
 
 # Background refresh control (already initialized above, see global variables)
 
 
-def process_image_path(image_path: Path):
-    """Helper function to process a Path object into a dictionary."""
+def get_asset_type_key(filename: str) -> Optional[str]:
+    """Return the asset_cache list key for an image filename, or None if unclassified"""
+    if is_poster_file(filename):
+        return "posters"
+    if is_background_file(filename):
+        return "backgrounds"
+    if is_season_file(filename):
+        return "seasons"
+    if is_titlecard_file(filename):
+        return "titlecards"
+    return None
+
+
+# Parallel scandir-based walker, also tracks per-library scan progress
+ASSET_SCAN_WORKERS = int(os.environ.get("ASSET_SCAN_WORKERS", 8))
+asset_scanner = AssetScanner(
+    ASSETS_DIR,
+    IMAGE_EXTENSIONS,
+    excluded_dirs={"@eaDir"},
+    max_workers=ASSET_SCAN_WORKERS,
+    classify=get_asset_type_key,
+)
+
+
+def serialize_assets(records) -> list:
+    """Convert cached AssetRecords into the dicts returned by the API"""
+    return [record.to_dict() for record in records]
+
+
+def get_gallery_page(
+    cache: AssetSnapshot,
+    type_key: str,
+    cursor: Optional[str] = None,
+    limit: int = 200,
+    sort: str = "path",
+    order: str = "asc",
+    library: Optional[str] = None,
+) -> dict:
+    """
+    One page of a gallery, served from the sorted views of a snapshot.
+
+    Raises HTTPException (400) for unknown sort orders or malformed cursors.
+    """
+    if sort not in SORT_KEYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort. Must be one of: {list(SORT_KEYS)}",
+        )
+    if order not in ("asc", "desc"):
+        raise HTTPException(
+            status_code=400, detail="Invalid order. Must be 'asc' or 'desc'"
+        )
+
+    view = cache.view(type_key, sort, library)
+    try:
+        records, next_cursor = paginate(
+            view, sort, descending=order == "desc", cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "images": serialize_assets(records),
+        "total": len(view),
+        "next_cursor": next_cursor,
+        "sort": sort,
+        "order": order,
+    }
+
+
+def process_image_path(image_path: Path) -> Optional[AssetRecord]:
+    """Helper function to process a Path object into an AssetRecord."""
     try:
         relative_path = image_path.relative_to(ASSETS_DIR)
-        url_path = str(relative_path).replace("\\", "/")
-        # URL encode the path to handle special characters like #
-        encoded_url_path = quote(url_path, safe="/")
+        parts = relative_path.parts
+        folder_name = parts[0] if len(parts) > 1 else "root"
 
         # Get file stats
         file_stat = image_path.stat()
 
-        return {
-            "path": str(relative_path),
-            "name": image_path.name,
-            "size": file_stat.st_size,
-            "url": f"/poster_assets/{encoded_url_path}",
-            "created": file_stat.st_ctime,  # Creation time (Unix timestamp)
-            "modified": file_stat.st_mtime,  # Modification time (Unix timestamp)
-        }
+        return AssetRecord(
+            str(relative_path),
+            folder_name,
+            get_asset_type_key(image_path.name),
+            file_stat.st_size,
+            file_stat.st_ctime,  # Creation time (Unix timestamp)
+            file_stat.st_mtime,  # Modification time (Unix timestamp)
+        )
     except Exception as e:
         logger.error(f"Error processing image path {image_path}: {e}")
         return None
 
 
-def scan_and_cache_assets():
-    """Scans the assets directory and populates/refreshes the cache."""
-    global cache_scan_in_progress
+def asset_index_row(record: AssetRecord):
+    """Convert a cached image into an asset index database row."""
+    return (
+        record.path,
+        record.type or "",
+        record.size,
+        record.modified,
+        record.created,
+        record.folder,
+    )
+
 
-    # Prevent overlapping scans (thread-safe)
-    if cache_scan_in_progress:
-        logger.warning("Asset scan already in progress, skipping this request")
+def _snapshot_diff(old: AssetSnapshot, new: AssetSnapshot):
+    """
+    Index rows added or changed, and paths removed, between two snapshots.
+
+    Returns:
+        (upsert rows, removed paths) for AssetIndexDB.apply_changes
+    """
+    old_paths = old.paths
+    new_paths = new.paths
+    upserts = []
+    for path, record in new_paths.items():
+        previous = old_paths.get(path)
+        if previous is None or record is not previous:
+            row = asset_index_row(record)
+            if previous is None or asset_index_row(previous) != row:
+                upserts.append(row)
+    removals = [path for path in old_paths if path not in new_paths]
+    return upserts, removals
+
+
+def _resolve_changed_paths(changed_paths) -> list:
+    """
+    Look up the current state of changed filesystem paths (no lock held).
+
+    Each path may be a file or a directory, existing or gone:
+    - existing image file  -> ("file", relative path, record)
+    - existing directory   -> ("dir", relative path, records of its images)
+      (e.g. a folder moved in)
+    - missing path         -> ("gone", relative path, None): the file, or
+      everything below the directory, is removed
+
+    Returns the changes for _apply_resolved_changes.
+    """
+    changes = []
+
+    for raw_path in sorted(changed_paths):
+        path = Path(raw_path)
+        try:
+            relative_path = str(path.relative_to(ASSETS_DIR))
+        except ValueError:
+            continue
+        if "@eaDir" in path.parts:
+            continue
+
+        # In-place overwrites don't change the directory mtime, so make sure
+        # the next differential scan does not reuse the old listing
+        asset_scanner.invalidate(path)
+
+        try:
+            if path.is_dir():
+                changes.append(("dir", relative_path, list(asset_scanner.walk(path))))
+            elif path.is_file():
+                if path.suffix.lower() in IMAGE_EXTENSIONS:
+                    record = process_image_path(path)
+                    if record:
+                        changes.append(("file", relative_path, record))
+            else:
+                changes.append(("gone", relative_path, None))
+        except Exception as e:
+            logger.error(f"Error applying asset change for {raw_path}: {e}")
+
+    return changes
+
+
+def _apply_resolved_changes(builder: AssetSnapshotBuilder, changes):
+    """
+    Apply changes from _resolve_changed_paths to a snapshot builder.
+
+    Returns the upserted records and the removed paths.
+    """
+    upserts = []
+    removals = []
+
+    for kind, relative_path, payload in changes:
+        if kind == "dir":
+            found = []
+            for record in payload:
+                upserts.append(builder.upsert(record))
+                found.append(record.path)
+            removals.extend(builder.remove_tree(relative_path, keep=found))
+        elif kind == "file":
+            upserts.append(builder.upsert(payload))
+        else:
+            if builder.remove(relative_path):
+                removals.append(relative_path)
+            removals.extend(builder.remove_tree(relative_path))
+
+    return upserts, removals
+
+
+def _persist_asset_snapshot():
+    """
+    Rewrite the whole asset index database from the current snapshot.
+
+    Stores the snapshot published at write time (which includes edits made
+    since the scan). A write is skipped when a newer snapshot has already
+    been stored in full.
+    """
+    global asset_index_persisted_generation
+
+    with asset_index_write_lock:
+        cache = asset_cache
+        if cache.generation <= asset_index_persisted_generation:
+            logger.debug(
+                f"Asset index already stored from a newer snapshot, skipping write "
+                f"of generation {cache.generation}"
+            )
+        else:
+            try:
+                asset_index_db.replace_all(
+                    [asset_index_row(record) for record in cache.paths.values()]
+                )
+                asset_index_persisted_generation = cache.generation
+            except Exception as e:
+                logger.error(f"Error persisting asset index: {e}")
+
+    # Edits queued while the database was rewritten
+    _flush_asset_index()
+
+
+def _persist_asset_paths(relative_paths):
+    """
+    Write the current state of some index paths to the asset index database.
+
+    Rows are taken from the snapshot published at write time, not from the
+    edit that requested the write, so edits can be stored in any order:
+    whichever writes last stores the newest state. If another thread is
+    writing, the paths are left for it and this returns immediately.
+    """
+    if asset_index_db is None or not relative_paths:
         return
 
-    cache_scan_in_progress = True
-    logger.info("Starting asset scan to refresh cache...")
+    with asset_index_dirty_lock:
+        asset_index_dirty_paths.update(relative_paths)
+    _flush_asset_index()
+
 
-    # Clear old data before re-scanning
-    asset_cache["posters"].clear()
-    asset_cache["backgrounds"].clear()
-    asset_cache["seasons"].clear()
-    asset_cache["titlecards"].clear()
-    asset_cache["folders"].clear()
+def _flush_asset_index():
+    """Write queued paths unless another thread holds the write lock (it will)"""
+    global asset_index_dirty_paths
 
-    if not ASSETS_DIR.exists() or not ASSETS_DIR.is_dir():
-        logger.warning("Assets directory not found. Skipping cache population.")
-        asset_cache["last_scanned"] = time.time()
-        cache_scan_in_progress = False
+    while True:
+        if not asset_index_write_lock.acquire(blocking=False):
+            return
+        try:
+            with asset_index_dirty_lock:
+                relative_paths = asset_index_dirty_paths
+                asset_index_dirty_paths = set()
+            if relative_paths:
+                cache = asset_cache
+                upserts = []
+                removals = []
+                for relative_path in relative_paths:
+                    record = cache.paths.get(relative_path)
+                    if record is None:
+                        removals.append(relative_path)
+                    else:
+                        upserts.append(asset_index_row(record))
+                try:
+                    asset_index_db.apply_changes(upserts, removals)
+                except Exception as e:
+                    logger.error(f"Error persisting asset changes: {e}")
+        finally:
+            asset_index_write_lock.release()
+
+        # Paths queued by a thread that found the lock taken just before release
+        with asset_index_dirty_lock:
+            if not asset_index_dirty_paths:
+                return
+
+
+def scan_and_cache_assets(full: bool = True):
+    """
+    Scans the assets directory and publishes a new asset cache snapshot.
+
+    Readers keep using the previous (e.g. database-loaded) snapshot until the
+    new one is swapped in. Watcher changes arriving during the scan are applied
+    to the current snapshot as usual and re-applied on top of the scan result,
+    so they are not lost when the scan (started earlier) is published.
+
+    Args:
+        full: Re-list every directory. Otherwise only directories whose mtime
+            changed since the previous scan are listed again (see AssetScanner).
+    """
+    global asset_cache, asset_scan_pending
+
+    # Prevent overlapping scans
+    if not asset_scan_lock.acquire(blocking=False):
+        logger.warning("Asset scan already in progress, skipping this request")
         return
 
     try:
-        # Scan once for all image types and filter @eaDir in one pass
-        image_extensions = {".jpg", ".jpeg", ".png", ".webp"}
-        all_images = [
-            p
-            for p in ASSETS_DIR.rglob("*")
-            if p.suffix.lower() in image_extensions and "@eaDir" not in p.parts
-        ]
+        logger.info("Starting asset scan to refresh cache...")
+        scan_start = time.time()
 
-        temp_folders = {}
+        if not ASSETS_DIR.exists() or not ASSETS_DIR.is_dir():
+            logger.warning("Assets directory not found. Skipping cache population.")
+            with asset_cache_lock:
+                asset_cache = AssetSnapshot.empty(last_scanned=time.time())
+            return
 
-        for image_path in all_images:
-            image_data = process_image_path(image_path)
-            if not image_data:
-                continue
+        with asset_cache_lock:
+            asset_scan_pending = set()
 
-            # Get folder name from original Path object (already computed in image_path)
-            try:
-                folder_name = image_path.relative_to(ASSETS_DIR).parts[0]
-            except (ValueError, IndexError):
-                folder_name = "root"
-
-            if folder_name not in temp_folders:
-                temp_folders[folder_name] = {
-                    "name": folder_name,
-                    "path": folder_name,
-                    "poster_count": 0,
-                    "background_count": 0,
-                    "season_count": 0,
-                    "titlecard_count": 0,
-                    "files": 0,
-                    "size": 0,
-                }
+        try:
+            # Walk all library folders in parallel, @eaDir is pruned by the scanner
+            scanned_records = asset_scanner.scan(full=full)
+        except Exception as e:
+            logger.error(f"An error occurred during asset scan: {e}")
+            scanned_records = None
+
+        if scanned_records is None:
+            with asset_cache_lock:
+                asset_scan_pending = None
+                # Keep serving the previous snapshot
+                asset_cache = asset_cache.replace(last_scanned=time.time())
+            return
 
-            # Count files and size for the folder
-            temp_folders[folder_name]["files"] += 1
-            temp_folders[folder_name]["size"] += image_data["size"]
-
-            if is_poster_file(image_path.name):
-                asset_cache["posters"].append(image_data)
-                temp_folders[folder_name]["poster_count"] += 1
-            elif is_background_file(image_path.name):
-                asset_cache["backgrounds"].append(image_data)
-                temp_folders[folder_name]["background_count"] += 1
-            elif is_season_file(image_path.name):
-                asset_cache["seasons"].append(image_data)
-                temp_folders[folder_name]["season_count"] += 1
-            elif is_titlecard_file(image_path.name):
-                asset_cache["titlecards"].append(image_data)
-                temp_folders[folder_name]["titlecard_count"] += 1
-
-        # Sort the image lists once by path
-        for key in ["posters", "backgrounds", "seasons", "titlecards"]:
-            asset_cache[key].sort(key=lambda x: x["path"])
-
-        # Finalize folder data
-        folder_list = list(temp_folders.values())
-        for folder in folder_list:
-            folder["total_count"] = (
-                folder["poster_count"]
-                + folder["background_count"]
-                + folder["season_count"]
-                + folder["titlecard_count"]
-            )
-        folder_list.sort(key=lambda x: x["name"])
-        asset_cache["folders"] = folder_list
+        # Build the snapshot without blocking edits, then re-apply the changes
+        # made meanwhile until none are left to publish it with
+        snapshot = AssetSnapshot.from_records(scanned_records, last_scanned=time.time())
+        while True:
+            with asset_cache_lock:
+                changed_during_scan = asset_scan_pending
+                if not changed_during_scan:
+                    asset_scan_pending = None
+                    previous = asset_cache
+                    asset_cache = snapshot
+                    break
+                asset_scan_pending = set()
+
+            builder = AssetSnapshotBuilder(snapshot)
+            _apply_resolved_changes(builder, _resolve_changed_paths(changed_during_scan))
+            snapshot = builder.build()
+            logger.debug(
+                f"Re-applied {len(changed_during_scan)} change(s) made during the scan"
+            )
 
-    except Exception as e:
-        logger.error(f"An error occurred during asset scan: {e}")
+        # Persist after publishing, without blocking readers or edits. The
+        # database mirrors the previous snapshot, so a differential scan only
+        # writes its diff.
+        if asset_index_db is not None:
+            if full:
+                _persist_asset_snapshot()
+            else:
+                upserts, removals = _snapshot_diff(previous, snapshot)
+                if upserts or removals:
+                    _persist_asset_paths([row[0] for row in upserts] + removals)
+                    logger.debug(
+                        f"Asset index updated: {len(upserts)} added/updated, "
+                        f"{len(removals)} removed"
+                    )
+
+        logger.info(
+            f"Asset cache refresh finished in {time.time() - scan_start:.1f}s. "
+            f"Found {len(snapshot.posters)} posters, "
+            f"{len(snapshot.backgrounds)} backgrounds, "
+            f"{len(snapshot.seasons)} seasons, "
+            f"{len(snapshot.titlecards)} titlecards, "
+            f"{len(snapshot.folders)} folders."
+        )
     finally:
-        asset_cache["last_scanned"] = time.time()
-        cache_scan_in_progress = False  # Release lock
+        asset_scan_lock.release()
+
+
+def load_asset_cache_from_db() -> bool:
+    """
+    Populate the asset cache from the persisted asset index.
+
+    Returns True if the cache was populated, False if there was nothing to load
+    (first start, database unavailable or unreadable).
+    """
+    global asset_cache
+
+    if asset_index_db is None:
+        return False
+
+    try:
+        load_start = time.time()
+        rows = asset_index_db.load_all()
+        if not rows:
+            logger.info("Asset index database is empty, a full scan is required")
+            return False
+
+        snapshot = AssetSnapshot.from_records(
+            (
+                AssetRecord(
+                    path,
+                    folder_name,
+                    type_key if type_key in ASSET_TYPE_COUNT_KEYS else None,
+                    size,
+                    ctime,
+                    mtime,
+                )
+                for path, type_key, size, mtime, ctime, folder_name in rows
+            ),
+            last_scanned=asset_index_db.get_last_full_scan() or time.time(),
+        )
+
+        with asset_cache_lock:
+            asset_cache = snapshot
+
         logger.info(
-            f"Asset cache refresh finished. Found {len(asset_cache['posters'])} posters, "
-            f"{len(asset_cache['backgrounds'])} backgrounds, "
-            f"{len(asset_cache['seasons'])} seasons, "
-            f"{len(asset_cache['titlecards'])} titlecards, "
-            f"{len(asset_cache['folders'])} folders."
+            f"Asset cache loaded from database in {time.time() - load_start:.2f}s "
+            f"({len(rows)} images)"
         )
+        return True
+
+    except Exception as e:
+        logger.error(f"Error loading asset index from database: {e}")
+        return False
+
+
+def _publish_asset_edit(changed_paths, edit) -> bool:
+    """
+    Derive a new snapshot with edit(builder) and publish it.
+
+    The changes are applied copy-on-write to the current snapshot and the result
+    is published with a single reference assignment. edit must not touch the
+    disk (the writer lock is held while it runs); it returns the upserted
+    records and removed paths, which are persisted to the asset index after
+    the lock is released.
+
+    Returns True if the snapshot changed.
+    """
+    global asset_cache
+
+    with asset_cache_lock:
+        # A scan in progress re-applies these paths on top of its result
+        if asset_scan_pending is not None:
+            asset_scan_pending.update(str(path) for path in changed_paths)
+
+        builder = AssetSnapshotBuilder(asset_cache)
+        upserts, removals = edit(builder)
+        if not builder.changed:
+            return False
+        asset_cache = builder.build()
+
+    logger.info(
+        f"Asset cache updated incrementally: {len(upserts)} added/updated, "
+        f"{len(removals)} removed"
+    )
+    changed = [record.path for record in upserts] + removals
+    _persist_asset_paths(changed)
+    if affects_recent_assets(changed):
+        request_recent_assets_refresh()
+    return True
+
+
+def apply_asset_changes(changed_paths):
+    """
+    Apply a batch of filesystem changes to the asset cache without a full rescan.
+
+    Used by the assets watcher; each path may be a file or a directory (see
+    _resolve_changed_paths).
+    """
+    changes = _resolve_changed_paths(changed_paths)
+    _publish_asset_edit(
+        changed_paths, lambda builder: _apply_resolved_changes(builder, changes)
+    )
+
+
+def apply_manual_asset_changes(changed_paths):
+    """
+    Apply a batch of filesystem changes to the manual assets index.
+
+    Used by the manual assets watcher, so files added or removed outside the
+    Web UI show up without waiting for the next background scan.
+    """
+    if manual_assets_index.refresh_paths(changed_paths):
+        logger.debug(
+            f"Manual assets index updated from {len(changed_paths)} watcher change(s)"
+        )
+
+
+def _asset_relative_path(path) -> Optional[str]:
+    """Index key (relative to ASSETS_DIR, OS separators) of an asset path, or None"""
+    path = Path(path)
+    for root in (ASSETS_DIR, ASSETS_DIR.resolve()):
+        try:
+            return str(path.relative_to(root))
+        except ValueError:
+            continue
+    return None
+
+
+def remove_asset_paths(paths) -> bool:
+    """
+    Remove deleted image files from the asset cache.
+
+    Paths outside ASSETS_DIR are ignored. Nothing is stat'ed or re-listed;
+    request handlers still call it through asyncio.to_thread, as it may wait
+    for another writer.
+
+    Returns True if the cache changed.
+    """
+    relative_paths = [
+        relative for relative in map(_asset_relative_path, paths) if relative
+    ]
+    if not relative_paths:
+        return False
 
+    for relative_path in relative_paths:
+        asset_scanner.invalidate(ASSETS_DIR / relative_path)
 
-def background_cache_refresh():
-    """Background thread that refreshes the cache periodically"""
+    def edit(builder):
+        removals = []
+        for relative_path in relative_paths:
+            if builder.remove(relative_path):
+                removals.append(relative_path)
+        return [], removals
+
+    return _publish_asset_edit([ASSETS_DIR / p for p in relative_paths], edit)
+
+
+def upsert_asset_paths(paths) -> bool:
+    """
+    Add or refresh written image files in the asset cache.
+
+    Each file is stat'ed once; files that no longer exist are removed (e.g. the
+    old location of an asset moved between the assets and manual assets
+    folders). Paths outside ASSETS_DIR are ignored.
+
+    Returns True if the cache changed.
+    """
+    relative_paths = [
+        relative for relative in map(_asset_relative_path, paths) if relative
+    ]
+    if not relative_paths:
+        return False
+
+    # Stat the files before taking the writer lock
+    records = {}
+    for relative_path in relative_paths:
+        full_path = ASSETS_DIR / relative_path
+        asset_scanner.invalidate(full_path)
+        if full_path.suffix.lower() in IMAGE_EXTENSIONS and full_path.is_file():
+            records[relative_path] = process_image_path(full_path)
+        else:
+            records[relative_path] = None
+
+    def edit(builder):
+        upserts = []
+        removals = []
+        for relative_path, record in records.items():
+            if record is not None:
+                upserts.append(builder.upsert(record))
+            elif builder.remove(relative_path):
+                removals.append(relative_path)
+        return upserts, removals
+
+    return _publish_asset_edit([ASSETS_DIR / p for p in relative_paths], edit)
+
+
+# Distinguishes ETags of this process from those handed out before a restart
+ASSET_CACHE_EPOCH = format(int(time.time()), "x")
+
+
+def asset_cache_etag(cache: AssetSnapshot) -> str:
+    """ETag for responses built from a snapshot"""
+    return f'"assets-{ASSET_CACHE_EPOCH}-{cache.generation}"'
+
+
+def check_asset_cache_etag(
+    request: Request, response: Response, cache: AssetSnapshot
+) -> Optional[Response]:
+    """
+    Tag the response with the snapshot's generation.
+
+    Returns a 304 response if the client already has this generation
+    (If-None-Match), otherwise None and the caller builds the body.
+    """
+    etag = asset_cache_etag(cache)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
+
+
+# Encoded bodies of the large list endpoints, valid for one data generation
+json_response_cache = EncodedResponseCache()
+
+
+def asset_json_response(cache: AssetSnapshot, key, build) -> FastJSONResponse:
+    """Serve content built from a snapshot, encoded only once per generation"""
+    body = json_response_cache.get(key, ("assets", cache.generation), build)
+    return FastJSONResponse(body, headers={"ETag": asset_cache_etag(cache)})
+
+
+def background_cache_refresh(initial_scan: bool = False):
+    """
+    Background thread that refreshes the cache periodically.
+
+    While the assets watcher keeps the cache current, the full rescan only runs
+    as a slow consistency check (e.g. for changes made over NFS/SMB by other
+    hosts, which produce no local filesystem events).
+
+    With initial_scan, the cache loaded from the asset index database is first
+    reconciled against the filesystem.
+    """
     global cache_refresh_running
 
     logger.info(
-        f"Background cache refresh started (interval: {CACHE_REFRESH_INTERVAL}s)"
+        f"Background cache refresh started (interval: {CACHE_REFRESH_INTERVAL}s, "
+        f"with watcher: {CACHE_CONSISTENCY_INTERVAL}s)"
     )
 
+    if initial_scan:
+        try:
+            logger.info("Reconciling asset cache with the filesystem...")
+            scan_and_cache_assets()
+        except Exception as e:
+            logger.error(f"Error reconciling asset cache: {e}")
+        try:
+            manual_assets_index.scan()
+        except Exception as e:
+            logger.error(f"Error building manual assets index: {e}")
+        try:
+            refresh_recent_assets()
+        except Exception as e:
+            logger.error(f"Error rebuilding recent assets: {e}")
+
     while cache_refresh_running:
         try:
             # Wait until the next refresh
-            time.sleep(CACHE_REFRESH_INTERVAL)
+            if assets_watcher is not None and assets_watcher.is_running:
+                time.sleep(CACHE_CONSISTENCY_INTERVAL)
+            else:
+                time.sleep(CACHE_REFRESH_INTERVAL)
 
             if cache_refresh_running:  # Check again after sleep
                 logger.info("Background cache refresh triggered")
-                scan_and_cache_assets()
+                # Cheap mtime-based rescans, with a full pass every few hours to
+                # pick up files overwritten in place on network shares
+                full_scan = (
+                    time.time() - asset_scanner.last_full_scan
+                    >= CACHE_FULL_SCAN_INTERVAL
+                )
+                scan_and_cache_assets(full=full_scan)
+                manual_assets_index.scan()
+                refresh_recent_assets()
                 logger.info("Background cache refresh completed")
         except Exception as e:
             logger.error(f"Error in background cache refresh: {e}")
@@ -954,7 +1581,7 @@ def background_cache_refresh():
             time.sleep(60)  # Wait a bit before retrying
 
 
-def start_cache_refresh_background():
+def start_cache_refresh_background(initial_scan: bool = False):
     """Start the background cache refresh thread"""
     global cache_refresh_task, cache_refresh_running
 
@@ -964,7 +1591,10 @@ def start_cache_refresh_background():
 
     cache_refresh_running = True
     cache_refresh_task = threading.Thread(
-        target=background_cache_refresh, daemon=True, name="CacheRefresh"
+        target=background_cache_refresh,
+        args=(initial_scan,),
+        daemon=True,
+        name="CacheRefresh",
     )
     cache_refresh_task.start()
     logger.info("Background cache refresh thread started")
@@ -974,151 +1604,200 @@ def stop_cache_refresh_background():
     """Stop the background cache refresh thread"""
     global cache_refresh_running
 
-    if cache_refresh_running:
-        logger.info("Stopping background cache refresh...")
-        cache_refresh_running = False
-        if cache_refresh_task:
-            cache_refresh_task.join(timeout=5)
-        logger.info("Background cache refresh stopped")
+    if cache_refresh_running:
+        logger.info("Stopping background cache refresh...")
+        cache_refresh_running = False
+        if cache_refresh_task:
+            cache_refresh_task.join(timeout=5)
+        logger.info("Background cache refresh stopped")
+
+
+def refresh_assets_after_run(run_started: Optional[float] = None):
+    """
+    Bring the asset cache up to date after a Posterizarr run has finished
+
+    Args:
+        run_started: Start time of the run (epoch seconds), if known
+    """
+    refresh_started = time.time()
+    if assets_watcher is not None and assets_watcher.is_running:
+        # The watcher has already seen every file the run wrote
+        assets_watcher.flush()
+    else:
+        scan_and_cache_assets()
+
+    start_thumbnail_prewarm(run_started if run_started is not None else refresh_started)
+
+
+# Assets modified after this time still need pre-warmed thumbnails
+thumbnail_prewarm_since = time.time()
+THUMBNAIL_PREWARM_WIDTH = 300
+THUMBNAIL_PREWARM_WORKERS = int(os.environ.get("THUMBNAIL_PREWARM_WORKERS", 1))
+
+
+def start_thumbnail_prewarm(run_started: float):
+    """
+    Pre-generate gallery thumbnails for assets written since the last pre-warm
+    (i.e. by the run that just finished) in a background thread
+
+    The next pre-warm starts over from run_started: files the run wrote whose
+    watcher events arrive after the flush are only in a later snapshot, and
+    thumbnails that already exist are skipped by the cache.
+    """
+    global thumbnail_prewarm_since
+
+    if thumbnail_cache is None or THUMBNAIL_PREWARM_WORKERS <= 0:
+        return
+
+    since = thumbnail_prewarm_since
+    thumbnail_prewarm_since = max(since, run_started)
+    cache = asset_cache
+
+    def run():
+        # Walking all records happens here, not in the caller's (event loop) thread
+        # Newest first, so the assets the user is most likely to look at are ready first
+        changed = sorted(
+            (r for r in cache.paths.values() if r.type and r.modified >= since),
+            key=lambda r: r.modified,
+            reverse=True,
+        )
+        if not changed:
+            logger.debug("No new assets, skipping thumbnail pre-warm")
+            return
+        try:
+            thumbnail_cache.prewarm(
+                [ASSETS_DIR / record.path for record in changed],
+                width=THUMBNAIL_PREWARM_WIDTH,
+                max_workers=THUMBNAIL_PREWARM_WORKERS,
+            )
+        except Exception as e:
+            logger.error(f"Error pre-warming thumbnails: {e}")
+
+    threading.Thread(target=run, daemon=True, name="ThumbnailPrewarm").start()
 
 
 def get_fresh_assets():
     """Returns the asset cache (always fresh thanks to background refresh)"""
     # Fully rely on background refresh!
     # Only perform a synchronous scan if the cache is completely empty (first startup)
-    if asset_cache["last_scanned"] == 0:
+    # and the startup scan has not picked it up yet
+    if asset_cache["last_scanned"] == 0 and not asset_scan_lock.locked():
         logger.info("First-time cache population...")
         scan_and_cache_assets()
     return asset_cache
 
 
-def find_poster_in_assets(
+BACKGROUND_ASSET_TYPES = (
+    "Background",
+    "Movie Background",
+    "Show Background",
+    "TV Background",
+    "Series Background",
+    "Episode Background",
+)
+
+
+def get_download_source_filename(download_source: str) -> Optional[str]:
+    """File name of a local download_source path (manually created assets), else None"""
+    if download_source and download_source != "N/A":
+        # Check if it looks like a file path (has backslashes or forward slashes and contains a file extension)
+        if ("\\" in download_source or "/" in download_source) and "." in download_source:
+            # Extract filename from path (e.g., "C:\...\S01E02.jpg" -> "S01E02.jpg")
+            return download_source.replace("\\", "/").rsplit("/", 1)[-1]
+    return None
+
+
+def locate_rootfolder_image(
     rootfolder: str,
     asset_type: str = "Poster",
     title: str = "",
-    download_source: str = "",
-) -> str:
+    image_filename: Optional[str] = None,
+) -> Optional[Tuple[Path, os.stat_result]]:
     """
-    Search recursively in ASSETS_DIR for a folder matching rootfolder and return image URL
+    Find the image of an asset in the folder(s) named rootfolder
 
-    Args:
-        rootfolder: The rootfolder name from ImageChoices.csv (e.g. "1 Million Followers (2024) {tmdb-1117126}")
-        asset_type: Type of asset ("Poster", "Season", "TitleCard", "Title_Card", "Background", "Episode", "Show")
-        title: Full title from CSV (used to extract Season/Episode info)
-        download_source: Path from CSV (for manually created assets, contains actual file path)
+    Folders are looked up in the asset index (rootfolder -> directories,
+    directory -> images), so no directory is walked; only the chosen file is
+    stat'ed.
 
     Returns:
-        URL path to image or None if not found
+        (image path, stat result) or None if not found
     """
-    if not ASSETS_DIR.exists():
-        return None
+    directories = get_fresh_assets().directories()
 
-    try:
-        # If download_source is a local path, try to extract the filename from it
-        image_filename = None
-        if download_source and download_source != "N/A":
-            # Check if it looks like a file path (has backslashes or forward slashes and contains a file extension)
-            if (
-                "\\" in download_source or "/" in download_source
-            ) and "." in download_source:
-                # Extract filename from path (e.g., "C:\...\S01E02.jpg" -> "S01E02.jpg")
-                import os
+    for directory in sorted(directories.find(rootfolder)):
+        candidates = []
 
-                image_filename = os.path.basename(download_source)
-                logger.info(
-                    f"Extracted filename from download_source: {image_filename} (from: {download_source})"
-                )
+        # First priority: use filename from download_source if available
+        if image_filename:
+            candidates.append(image_filename)
 
-        # Search recursively for the folder
-        for item in ASSETS_DIR.rglob("*"):
-            # Skip @eaDir folders from Synology NAS
-            if item.is_dir() and item.name == "@eaDir":
-                continue
+        # Second priority: determine by asset type
+        if asset_type == "Season":
+            # Extract season number from title (format: "Show Name | Season 01" or "Title SEASON")
+            match = re.search(r"Season\s*(\d+)", title, re.IGNORECASE)
+            if match:
+                candidates.append(f"Season{match.group(1).zfill(2)}.jpg")
+                # Try without padding
+                candidates.append(f"Season{match.group(1)}.jpg")
+            else:
+                # If no season number in title, use the first Season*.jpg file
+                season_files = [
+                    record.name
+                    for record in directories.files_in(directory)
+                    if record.name.startswith("Season") and record.name.endswith(".jpg")
+                ]
+                candidates.extend(season_files[:1])
+        elif asset_type in ("TitleCard", "Title_Card", "Episode"):
+            # Extract episode info from title (format: "S01E01 | Episode Title")
+            match = re.search(r"(S\d+E\d+)", title, re.IGNORECASE)
+            if match:
+                candidates.append(f"{match.group(1).upper()}.jpg")
+        elif asset_type in BACKGROUND_ASSET_TYPES:
+            candidates.append("background.jpg")
+        else:
+            # Default: poster.jpg (for "Poster", "Show", or any other type)
+            candidates.append("poster.jpg")
 
-            if item.is_dir() and item.name == rootfolder:
-                # Found the matching folder
-                image_file = None
-
-                # First priority: use filename from download_source if available
-                if image_filename:
-                    image_file = item / image_filename
-                    logger.info(f"Checking for file from download_source: {image_file}")
-                    if not image_file.exists():
-                        logger.warning(
-                            f"File from download_source not found: {image_file}"
-                        )
-                        image_file = None
-
-                # Second priority: determine by asset type
-                if not image_file:
-                    if asset_type == "Season":
-                        # Extract season number from title (format: "Show Name | Season 01" or "Title SEASON")
-                        import re
-
-                        match = re.search(r"Season\s*(\d+)", title, re.IGNORECASE)
-                        if match:
-                            season_num = match.group(1).zfill(2)  # Pad to 2 digits
-                            image_file = item / f"Season{season_num}.jpg"
-                            if not image_file.exists():
-                                # Try without padding
-                                image_file = item / f"Season{match.group(1)}.jpg"
-                        else:
-                            # If no season number in title, look for any Season*.jpg file
-                            import glob
+        for name in candidates:
+            record = directories.file(directory, name)
+            if record is None:
+                continue
+            image_file = ASSETS_DIR / record.path
+            try:
+                return image_file, image_file.stat()
+            except OSError:
+                # Deleted since it was indexed
+                continue
 
-                            season_files = list(item.glob("Season*.jpg"))
-                            if season_files:
-                                # Use the first Season*.jpg file found
-                                image_file = season_files[0]
-                                logger.info(
-                                    f"No season number in title, using first found: {image_file.name}"
-                                )
+    return None
 
-                    elif asset_type in ["TitleCard", "Title_Card", "Episode"]:
-                        # Extract episode info from title (format: "S01E01 | Episode Title" or just "Episode Title")
-                        import re
-
-                        match = re.search(r"(S\d+E\d+)", title, re.IGNORECASE)
-                        if match:
-                            episode_code = match.group(1).upper()  # e.g. "S01E01"
-                            image_file = item / f"{episode_code}.jpg"
-
-                    elif asset_type in [
-                        "Background",
-                        "Movie Background",
-                        "Show Background",
-                        "TV Background",
-                        "Series Background",
-                        "Episode Background",
-                    ]:
-                        # Look for background.jpg in the folder
-                        image_file = item / "background.jpg"
 
-                    else:
-                        # Default: look for poster.jpg (for "Poster", "Show", or any other type)
-                        image_file = item / "poster.jpg"
+def find_poster_in_assets(
+    rootfolder: str,
+    asset_type: str = "Poster",
+    title: str = "",
+    download_source: str = "",
+) -> str:
+    """
+    Find the image of a rootfolder (from ImageChoices.csv) in ASSETS_DIR and return its URL
 
-                # Check if the image file exists
-                if image_file and image_file.exists() and image_file.is_file():
-                    # Create relative path from ASSETS_DIR
-                    relative_path = image_file.relative_to(ASSETS_DIR)
-                    # Create URL path with forward slashes
-                    url_path = str(relative_path).replace("\\", "/")
-                    # URL encode the path to handle special characters like #
-                    encoded_url_path = quote(url_path, safe="/")
-                    # Add cache busting parameter using file modification time
-                    mtime = int(image_file.stat().st_mtime)
-                    logger.info(f"Found image: {url_path} (mtime: {mtime})")
-                    return f"/poster_assets/{encoded_url_path}?t={mtime}"
+    Args:
+        rootfolder: The rootfolder name from ImageChoices.csv (e.g. "1 Million Followers (2024) {tmdb-1117126}")
+        asset_type: Type of asset ("Poster", "Season", "TitleCard", "Title_Card", "Background", "Episode", "Show")
+        title: Full title from CSV (used to extract Season/Episode info)
+        download_source: Path from CSV (for manually created assets, contains actual file path)
 
+    Returns:
+        URL path to image or None if not found
+    """
+    metadata = find_poster_with_metadata(rootfolder, asset_type, title, download_source)
+    if metadata is None:
         logger.warning(
             f"No image found for rootfolder: {rootfolder}, type: {asset_type}"
         )
         return None
-
-    except Exception as e:
-        logger.error(f"Error searching for {asset_type} in assets: {e}")
-        return None
+    return metadata["url"]
 
 
 def find_poster_with_metadata(
@@ -1137,88 +1816,240 @@ def find_poster_with_metadata(
         return None
 
     try:
-        # If download_source is a local path, try to extract the filename from it
-        image_filename = None
-        if download_source and download_source != "N/A":
-            if (
-                "\\" in download_source or "/" in download_source
-            ) and "." in download_source:
-                import os
+        image_filename = get_download_source_filename(download_source)
+        found = locate_rootfolder_image(rootfolder, asset_type, title, image_filename)
+        if found is None:
+            return None
+
+        image_file, file_stat = found
+        relative_path = image_file.relative_to(ASSETS_DIR)
+        # Create URL path with forward slashes
+        url_path = str(relative_path).replace("\\", "/")
+        # URL encode the path to handle special characters like #
+        encoded_url_path = quote(url_path, safe="/")
+        # Add cache busting parameter using file modification time
+        mtime = int(file_stat.st_mtime)
+        logger.debug(f"Found image: {url_path} (mtime: {mtime})")
+
+        return {
+            "url": f"/poster_assets/{encoded_url_path}?t={mtime}",
+            "created": file_stat.st_ctime,
+            "modified": file_stat.st_mtime,
+        }
+
+    except Exception as e:
+        logger.error(f"Error searching for {asset_type} in assets: {e}")
+        return None
+
+
+RECENT_ASSETS_LIMIT = 100
+
+# Materialized recent assets feed: (asset snapshot generation, database
+# generation) it was built from, guarded by recent_assets_lock
+recent_assets_source = None
+recent_assets_lock = threading.Lock()
+
+# Writes to imagechoices or the asset cache request a rebuild, which runs on
+# a background thread so /api/recent-assets never rebuilds the feed itself
+RECENT_ASSETS_REFRESH_DELAY = 1.0
+recent_assets_refresh_event = threading.Event()
+recent_assets_refresh_thread = None
+recent_assets_refresh_thread_lock = threading.Lock()
+
+# (database generation, Rootfolder names) of imagechoices, used to tell which
+# asset changes can affect the feed
+recent_assets_rootfolders = (None, frozenset())
+
+
+def is_manually_created_choice(manual_field, download_source: str) -> bool:
+    """Whether an imagechoices record is a manually created asset"""
+    # Manual can be: "Yes" (resolved), "No" (explicitly unresolved), "true"/"false" (legacy), or N/A (not set)
+    # "Yes" = resolved/manually marked as no edits needed
+    # "No" = explicitly unresolved (was resolved but user clicked unresolve)
+    # "true" = legacy resolved state
+    # "false" or N/A = regular assets
+    if manual_field in ["Yes", "true", True]:
+        return True
+    # For "No", "false", False, or N/A - check download_source as fallback
+    return download_source == "N/A" or bool(
+        download_source
+        and (
+            download_source.startswith("C:")
+            or download_source.startswith("/")
+            or download_source.startswith("\\")
+        )
+    )
+
+
+def refresh_recent_assets(force: bool = False) -> bool:
+    """
+    Rebuild the materialized recent assets feed if imagechoices or the asset
+    index changed since it was built.
+
+    Walks the imagechoices records newest first and keeps the first
+    RECENT_ASSETS_LIMIT ones whose image exists (fallback and explicitly
+    unresolved records are skipped), with their resolved poster URL and
+    timestamps.
+
+    Returns True if the feed was rebuilt.
+    """
+    global recent_assets_source
+
+    if not DATABASE_AVAILABLE or db is None:
+        return False
+
+    with recent_assets_lock:
+        cache = get_fresh_assets()
+        source = (cache.generation, db.generation)
+        if not force and source == recent_assets_source:
+            return False
 
-                image_filename = os.path.basename(download_source)
+        build_start = time.time()
+        rows = []
+        for record in db.get_all_choices():
+            if len(rows) >= RECENT_ASSETS_LIMIT:
+                break
 
-        # Search recursively for the folder
-        for item in ASSETS_DIR.rglob("*"):
-            if item.is_dir() and item.name == "@eaDir":
+            rootfolder = record["Rootfolder"] or ""
+            if not rootfolder:
                 continue
 
-            if item.is_dir() and item.name == rootfolder:
-                image_file = None
-
-                # First priority: use filename from download_source if available
-                if image_filename:
-                    image_file = item / image_filename
-                    if not image_file.exists():
-                        image_file = None
-
-                # Second priority: determine by asset type
-                if not image_file:
-                    if asset_type == "Season":
-                        import re
-
-                        match = re.search(r"Season\s*(\d+)", title, re.IGNORECASE)
-                        if match:
-                            season_num = match.group(1).zfill(2)
-                            image_file = item / f"Season{season_num}.jpg"
-                            if not image_file.exists():
-                                image_file = item / f"Season{match.group(1)}.jpg"
-                        else:
-                            import glob
-
-                            season_files = list(item.glob("Season*.jpg"))
-                            if season_files:
-                                image_file = season_files[0]
-
-                    elif asset_type in ["TitleCard", "Title_Card", "Episode"]:
-                        import re
-
-                        match = re.search(r"(S\d+E\d+)", title, re.IGNORECASE)
-                        if match:
-                            episode_code = match.group(1).upper()
-                            image_file = item / f"{episode_code}.jpg"
-
-                    elif asset_type in [
-                        "Background",
-                        "Movie Background",
-                        "Show Background",
-                        "TV Background",
-                        "Series Background",
-                        "Episode Background",
-                    ]:
-                        image_file = item / "background.jpg"
+            title = record["Title"] or ""
 
-                    else:
-                        image_file = item / "poster.jpg"
+            # Skip fallback assets - they should only appear in assets overview
+            if (record["Fallback"] or "").lower() == "true":
+                logger.debug(f"[SKIP]  Skipping fallback asset in recent view: {title}")
+                continue
 
-                # Check if the image file exists
-                if image_file and image_file.exists() and image_file.is_file():
-                    file_stat = image_file.stat()
-                    relative_path = image_file.relative_to(ASSETS_DIR)
-                    url_path = str(relative_path).replace("\\", "/")
-                    encoded_url_path = quote(url_path, safe="/")
-                    mtime = int(file_stat.st_mtime)
+            # Skip assets that were explicitly marked as unresolved (Manual="No")
+            # "No" means user clicked "Unresolve" - these should be hidden from recent assets
+            manual_field = record["Manual"] or "N/A"
+            if manual_field == "No":
+                logger.debug(
+                    f"[SKIP]  Skipping explicitly unresolved asset in recent view: {title}"
+                )
+                continue
 
-                    return {
-                        "url": f"/poster_assets/{encoded_url_path}?t={mtime}",
-                        "created": file_stat.st_ctime,
-                        "modified": file_stat.st_mtime,
-                    }
+            asset_type = record["Type"] or "Poster"
+            download_source = record["DownloadSource"] or ""
+            poster_data = find_poster_with_metadata(
+                rootfolder, asset_type, title, download_source
+            )
+            if not poster_data:
+                logger.debug(f"[SKIP]  Skipping asset (poster not found): {title}")
+                continue
 
-        return None
+            rows.append(
+                (
+                    record["id"],
+                    title,
+                    record["Type"] or "",
+                    rootfolder,
+                    record["LibraryName"] or "",
+                    record["Language"] or "",
+                    record["TextTruncated"] or "",
+                    download_source,
+                    record["FavProviderLink"] or "",
+                    int(is_manually_created_choice(manual_field, download_source)),
+                    poster_data["url"],
+                    poster_data["created"],
+                    poster_data["modified"],
+                )
+            )
 
-    except Exception as e:
-        logger.error(f"Error searching for {asset_type} in assets: {e}")
-        return None
+        db.replace_recent_assets(rows)
+        recent_assets_source = source
+
+    logger.info(
+        f"Recent assets feed rebuilt in {time.time() - build_start:.2f}s "
+        f"({len(rows)} asset(s) with existing images)"
+    )
+    return True
+
+
+def request_recent_assets_refresh():
+    """
+    Schedule a background rebuild of the recent assets feed.
+
+    Requests made in quick succession (e.g. a batch of uploads) are coalesced
+    into a single rebuild.
+    """
+    global recent_assets_refresh_thread
+
+    if not DATABASE_AVAILABLE or db is None:
+        return
+
+    recent_assets_refresh_event.set()
+    with recent_assets_refresh_thread_lock:
+        if recent_assets_refresh_thread is None:
+            recent_assets_refresh_thread = threading.Thread(
+                target=_recent_assets_refresh_loop,
+                daemon=True,
+                name="RecentAssetsRefresh",
+            )
+            recent_assets_refresh_thread.start()
+
+
+def affects_recent_assets(paths) -> bool:
+    """
+    Whether changes to the given asset paths can affect the recent assets feed.
+
+    The feed only shows images located in a folder named after the Rootfolder
+    of an imagechoices record (see locate_rootfolder_image), so a change
+    elsewhere (e.g. a watcher flush during a run writing unrelated assets)
+    does not need a rebuild.
+    """
+    global recent_assets_rootfolders
+
+    if not DATABASE_AVAILABLE or db is None:
+        return False
+
+    generation, rootfolders = recent_assets_rootfolders
+    if generation != db.generation:
+        generation = db.generation
+        try:
+            rootfolders = frozenset(db.get_rootfolders())
+        except Exception as e:
+            logger.error(f"Error loading rootfolders for recent assets: {e}")
+            return True
+        recent_assets_rootfolders = (generation, rootfolders)
+
+    return any(
+        os.path.basename(os.path.dirname(str(path))) in rootfolders for path in paths
+    )
+
+
+def _recent_assets_refresh_loop():
+    while True:
+        recent_assets_refresh_event.wait()
+        # Let a burst of writes settle before rebuilding
+        time.sleep(RECENT_ASSETS_REFRESH_DELAY)
+        recent_assets_refresh_event.clear()
+        try:
+            refresh_recent_assets()
+        except Exception as e:
+            logger.error(f"Error rebuilding recent assets: {e}")
+
+
+def recent_asset_from_row(row) -> dict:
+    """Format a recent_assets record for the frontend (matches the old CSV format)"""
+    provider_link = row["FavProviderLink"] or ""
+    return {
+        "title": row["Title"],
+        "type": row["Type"],
+        "rootfolder": row["Rootfolder"],
+        "library": row["LibraryName"],
+        "language": row["Language"],
+        "fallback": False,  # Fallback assets are never materialized
+        "text_truncated": (row["TextTruncated"] or "").lower() == "true",
+        "download_source": row["DownloadSource"],
+        "provider_link": provider_link if provider_link != "N/A" else "",
+        "is_manually_created": bool(row["is_manually_created"]),
+        "poster_url": row["poster_url"],
+        "has_poster": True,
+        "created": row["created"],
+        "modified": row["modified"],
+    }
 
 
 def parse_image_choices_csv(csv_path: Path) -> list:
@@ -1441,14 +2272,72 @@ class SPAMiddleware(BaseHTTPMiddleware):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown"""
-    global scheduler, db, config_db, logs_watcher
+    global scheduler, db, config_db, logs_watcher, assets_watcher, asset_index_db
+    global manual_assets_watcher
+    global thumbnail_cache
 
     # Startup: Pre-populate asset cache
     logger.info("Starting Posterizarr Web UI Backend")
-    scan_and_cache_assets()
 
-    # Start background cache refresh
-    start_cache_refresh_background()
+    # Load the persisted asset index so the UI can serve immediately
+    cache_loaded_from_db = False
+    if ASSET_INDEX_DB_AVAILABLE:
+        try:
+            asset_index_db = init_asset_index_database(ASSET_INDEX_DB_PATH)
+            cache_loaded_from_db = load_asset_cache_from_db()
+        except Exception as e:
+            logger.error(f"Failed to initialize asset index database: {e}")
+            asset_index_db = None
+
+    if not cache_loaded_from_db:
+        logger.info("No persisted asset index, the first scan runs in the background")
+
+    # Disk cache for resized gallery thumbnails
+    if THUMBNAILS_AVAILABLE:
+        try:
+            thumbnail_cache = ThumbnailCache(
+                THUMBNAILS_DIR,
+                max_bytes=int(os.environ.get("THUMBNAIL_CACHE_MAX_MB", 1024))
+                * 1024
+                * 1024,
+                max_workers=int(os.environ.get("THUMBNAIL_WORKERS", 2)),
+            )
+            thumbnail_cache.initialize()
+        except Exception as e:
+            logger.error(f"Failed to initialize thumbnail cache: {e}")
+            thumbnail_cache = None
+
+    # Start assets watcher so the cache is updated incrementally
+    assets_watcher = None
+    if ASSETS_WATCHER_AVAILABLE:
+        try:
+            assets_watcher = create_assets_watcher(ASSETS_DIR, apply_asset_changes)
+            assets_watcher.start()
+            if not assets_watcher.is_running:
+                logger.warning(
+                    "Assets watcher could not start, falling back to periodic rescans"
+                )
+        except Exception as e:
+            logger.error(f"Failed to initialize assets watcher: {e}")
+            assets_watcher = None
+    else:
+        logger.info("Assets watcher module not available, skipping")
+
+    # Watch the manual assets directory so external changes show up live
+    manual_assets_watcher = None
+    if ASSETS_WATCHER_AVAILABLE:
+        try:
+            manual_assets_watcher = create_assets_watcher(
+                MANUAL_ASSETS_DIR, apply_manual_asset_changes
+            )
+            manual_assets_watcher.start()
+            if not manual_assets_watcher.is_running:
+                logger.warning(
+                    "Manual assets watcher could not start, falling back to periodic rescans"
+                )
+        except Exception as e:
+            logger.error(f"Failed to initialize manual assets watcher: {e}")
+            manual_assets_watcher = None
 
     # Initialize config database if available
     if CONFIG_DATABASE_AVAILABLE:
@@ -1514,6 +2403,11 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Database module not available, skipping database initialization")
 
+    # Start background cache refresh (reconciles the loaded cache with the
+    # filesystem first). Runs after the database init, as its first pass also
+    # builds the recent assets feed.
+    start_cache_refresh_background(initial_scan=True)
+
     # Initialize and start logs watcher if available
     logs_watcher = None
     if LOGS_WATCHER_AVAILABLE and DATABASE_AVAILABLE and RUNTIME_DB_AVAILABLE:
@@ -1530,6 +2424,9 @@ async def lifespan(app: FastAPI):
             logger.info(
                 "✓ Logs watcher started - monitoring for background process files"
             )
+            # /ws/logs tailers schedule their watches on the same observer
+            if logs_watcher.is_running and logs_watcher.observer is not None:
+                log_tailer_hub.use_observer(logs_watcher.observer)
         except Exception as e:
             logger.error(f"Failed to initialize logs watcher: {e}")
             logs_watcher = None
@@ -1576,9 +2473,32 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping queue listener: {e}")
 
+    # Stop assets watcher
+    if assets_watcher:
+        try:
+            assets_watcher.stop()
+        except Exception as e:
+            logger.error(f"Error stopping assets watcher: {e}")
+
+    # Stop manual assets watcher
+    if manual_assets_watcher:
+        try:
+            manual_assets_watcher.stop()
+        except Exception as e:
+            logger.error(f"Error stopping manual assets watcher: {e}")
+
+    # Stop log tailers of open /ws/logs connections
+    try:
+        log_tailer_hub.stop()
+    except Exception as e:
+        logger.error(f"Error stopping log tailers: {e}")
+
     # Stop background cache refresh
     stop_cache_refresh_background()
 
+    if thumbnail_cache:
+        thumbnail_cache.shutdown()
+
     if scheduler:
         try:
             scheduler.stop()
@@ -1600,6 +2520,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error closing config database: {e}")
 
+    if asset_index_db:
+        try:
+            asset_index_db.close()
+        except Exception as e:
+            logger.error(f"Error closing asset index database: {e}")
+
     logger.info("Shutting down Posterizarr Web UI Backend")
 
 
@@ -3675,26 +4601,26 @@ def get_last_log_lines(count=25, mode=None, log_file=None):
         # Fallback: check all log files in order
         log_files_to_check = ["Scriptlog.log", "Testinglog.log", "Manuallog.log"]
 
+    def select_line(line):
+        # Filter out empty lines and decorative lines
+        stripped = line.strip()
+        if (
+            stripped
+            and not stripped.startswith("=====")
+            and not stripped.startswith("_____")
+            and not all(c in "=-_| " for c in stripped)
+        ):
+            return stripped
+        return None
+
     for log_filename in log_files_to_check:
         scriptlog_path = LOGS_DIR / log_filename
         if scriptlog_path.exists() and scriptlog_path.stat().st_size > 0:
             try:
-                with open(scriptlog_path, "r", encoding="utf-8", errors="ignore") as f:
-                    all_lines = f.readlines()
-                    # Filter out empty lines and decorative lines
-                    lines = []
-                    for line in all_lines:
-                        stripped = line.strip()
-                        if (
-                            stripped
-                            and not stripped.startswith("=====")
-                            and not stripped.startswith("_____")
-                            and not all(c in "=-_| " for c in stripped)
-                        ):
-                            lines.append(stripped)
-
-                    if lines:
-                        return lines[-count:]  # Return last N lines
+                # Read backwards from the end, only as far as needed for N lines
+                lines = tail_lines(scriptlog_path, count, select=select_line)
+                if lines:
+                    return lines  # Return last N lines
             except Exception as e:
                 logger.error(f"Error reading log file {log_filename}: {e}")
                 continue
@@ -4327,6 +5253,7 @@ async def get_status():
             )
             # Store mode before clearing for runtime tracking
             finished_mode = current_mode
+            finished_start_time = current_start_time
 
             current_process = None
             current_mode = None
@@ -4336,7 +5263,11 @@ async def get_status():
             # Auto-trigger cache refresh after script finishes
             logger.info("Triggering cache refresh after script completion...")
             try:
-                scan_and_cache_assets()
+                refresh_assets_after_run(
+                    datetime.fromisoformat(finished_start_time).timestamp()
+                    if finished_start_time
+                    else None
+                )
                 logger.info("Cache refreshed successfully after script completion")
             except Exception as e:
                 logger.error(f"Error refreshing cache after script completion: {e}")
@@ -4401,7 +5332,7 @@ async def get_status():
                 # Auto-trigger cache refresh after scheduler finishes
                 logger.info("Triggering cache refresh after scheduler completion...")
                 try:
-                    scan_and_cache_assets()
+                    refresh_assets_after_run(scheduler.current_start_time)
                     logger.info(
                         "Cache refreshed successfully after scheduler completion"
                     )
@@ -6382,9 +7313,48 @@ async def get_logs():
     return {"logs": sorted(log_files, key=lambda x: x["modified"], reverse=True)}
 
 
+def read_log_page(log_path: Path, offset: Optional[int], limit: int, at: Optional[str]) -> dict:
+    """
+    One page of a log through its line index (runs in a worker thread)
+
+    The index is brought up to date first; only bytes appended since the
+    last request are read, or the whole file once after a rotation.
+    """
+    index = log_index_store.get(log_path)
+    st = index.update()
+    if at:
+        offset = index.find_time(at)
+    offset = offset or 0
+    content = index.read_lines(offset, limit)
+    total_lines = index.total_lines(st)
+    next_offset = offset + len(content)
+    return {
+        "content": content,
+        "offset": offset,
+        "limit": limit,
+        "total_lines": total_lines,
+        "next_offset": next_offset if next_offset < total_lines else None,
+        "prev_offset": max(offset - limit, 0) if offset > 0 else None,
+    }
+
+
 @app.get("/api/logs/{log_name}")
-async def get_log_content(log_name: str, tail: int = 100):
-    """Get log file content from either Logs or UILogs directory"""
+async def get_log_content(
+    log_name: str,
+    tail: int = 100,
+    offset: Optional[int] = Query(None, ge=0),
+    limit: int = Query(500, ge=1, le=5000),
+    at: Optional[str] = None,
+):
+    """
+    Get log file content from either Logs or UILogs directory
+
+    - Default: the last `tail` lines (tail=0 for the whole file)
+    - `offset`/`limit`: a page of lines (0-based line numbers), with
+      total_lines and next_offset/prev_offset for scrolling
+    - `at`: a page starting at the first line logged at or after a timestamp
+      ("YYYY-MM-DD HH:MM[:SS]")
+    """
     # Try Logs directory first
     log_path = LOGS_DIR / log_name
 
@@ -6396,14 +7366,139 @@ async def get_log_content(log_name: str, tail: int = 100):
         raise HTTPException(status_code=404, detail="Log file not found")
 
     try:
+        at = normalize_log_timestamp(at) if at else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        if offset is not None or at:
+            return await asyncio.to_thread(read_log_page, log_path, offset, limit, at)
+        if tail:
+            # Seek backwards from the end instead of reading the whole log
+            return {"content": tail_lines(log_path, tail, keepends=True)}
         with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
-            return {"content": lines[-tail:] if tail else lines}
+            return {"content": f.readlines()}
     except Exception as e:
         logger.error(f"Error reading log: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/logs/{log_name}/search")
+async def search_log(
+    request: Request,
+    log_name: str,
+    q: Optional[str] = None,
+    regex: bool = False,
+    case_sensitive: bool = False,
+    level: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=50000),
+):
+    """
+    Stream the lines of a log that match a search, as NDJSON
+
+    - q: substring (or regular expression with regex=true)
+    - level: comma-separated log levels, e.g. "ERROR,WARNING"
+    - since/until: time range ("YYYY-MM-DD HH:MM[:SS]"); the scan starts at
+      `since` through the log's line index and stops after `until`
+
+    Each match is one line: {"type": "match", "line", "timestamp", "level",
+    "content"}. A final {"type": "done", ...} line has the totals. The file is
+    scanned in chunks in a worker thread; the scan stops when the client
+    disconnects.
+    """
+    # Try Logs directory first
+    log_path = LOGS_DIR / log_name
+
+    # If not found, try UILogs directory
+    if not log_path.exists():
+        log_path = UI_LOGS_DIR / log_name
+
+    if not log_path.exists():
+        raise HTTPException(status_code=404, detail="Log file not found")
+
+    levels = [value for value in (level or "").split(",") if value.strip()]
+    if not q and not levels and not since and not until:
+        raise HTTPException(
+            status_code=400, detail="Provide q, level, since or until to search"
+        )
+
+    try:
+        since = normalize_log_timestamp(since) if since else None
+        until = normalize_log_timestamp(until, end=True) if until else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    start_line, start_offset = 0, 0
+    if since:
+        # Jump to the first line at or after `since` instead of scanning up to it
+        index = log_index_store.get(log_path)
+        await asyncio.to_thread(index.update)
+        start_line, start_offset = await asyncio.to_thread(index.seek_time, since)
+
+    try:
+        search = LogSearch(
+            log_path,
+            query=q,
+            regex=regex,
+            case_sensitive=case_sensitive,
+            levels=levels,
+            since=since,
+            until=until,
+            start_offset=start_offset,
+            start_line=start_line,
+        )
+    except re.error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid regular expression: {e}")
+
+    logger.info(
+        f"Searching {log_name} (q={q!r}, regex={regex}, level={level}, since={since}, until={until})"
+    )
+
+    async def generate():
+        start = time.time()
+        match_count = 0
+        truncated = False
+        try:
+            while True:
+                if await request.is_disconnected():
+                    logger.info(f"Log search in {log_name} cancelled (client disconnected)")
+                    return
+                matches = await asyncio.to_thread(search.scan_chunk)
+                if matches is None:
+                    break
+                if not matches:
+                    continue
+                if match_count + len(matches) > limit:
+                    matches = matches[: limit - match_count]
+                    truncated = True
+                match_count += len(matches)
+                yield "".join(
+                    json.dumps(match, ensure_ascii=False) + "\n" for match in matches
+                )
+                if truncated:
+                    break
+
+            yield json.dumps(
+                {
+                    "type": "done",
+                    "matches": match_count,
+                    "scanned_lines": search.scanned_lines,
+                    "truncated": truncated,
+                    "took_ms": round((time.time() - start) * 1000, 1),
+                }
+            ) + "\n"
+        except asyncio.CancelledError:
+            # StreamingResponse cancels the stream when the client disconnects
+            logger.info(f"Log search in {log_name} cancelled (client disconnected)")
+            raise
+        finally:
+            search.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.get("/api/logs/{log_name}/exists")
 async def check_log_exists(log_name: str):
     """Check if a log file exists (for waiting until script creates log)"""
@@ -6423,6 +7518,35 @@ async def check_log_exists(log_name: str):
     }
 
 
+async def wait_for_websocket_disconnect(websocket: WebSocket):
+    """Return once the client closes the connection (other messages are ignored)"""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+async def send_log_frames(websocket: WebSocket, frames) -> None:
+    """
+    Send collected log frames to a client
+
+    - ("lines", [...]) -> {"type": "log_batch", "lines": [...]}
+    - ("dropped", n) -> {"type": "log_dropped", "count": n, "content": "..."}
+      where the client fell too far behind and n lines were skipped
+    """
+    for kind, payload in frames:
+        if kind == "lines":
+            await websocket.send_json({"type": "log_batch", "lines": payload})
+        else:
+            await websocket.send_json(
+                {
+                    "type": "log_dropped",
+                    "count": payload,
+                    "content": f"[... {payload} log lines skipped, connection too slow ...]",
+                }
+            )
+
+
 @app.websocket("/ws/logs")
 async def websocket_logs(
     websocket: WebSocket, log_file: Optional[str] = Query("Scriptlog.log")
@@ -6458,29 +7582,63 @@ async def websocket_logs(
         "scheduled": "Scriptlog.log",
     }
 
+    subscription = None
+    disconnected = None
+    next_lines = None
     try:
-        # Send initial logs (increased to 100 lines)
+        # Subscribe before reading the backlog, so no line written in between is
+        # lost. The backlog ends where the tailer's published lines end, so no
+        # line is sent twice either
+        subscription = log_tailer_hub.subscribe(log_path)
+        backlog_end = subscription.tailer.published_position
+
+        # Send initial logs (increased to 100 lines) as one frame
         if log_path.exists():
-            with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()[-100:]
-                for line in lines:
-                    stripped = line.strip()
-                    if stripped:  # Only send non-empty lines
-                        await websocket.send_json({"type": "log", "content": stripped})
-
-        # Monitor log file for changes with dynamic log file switching
-        last_position = log_path.stat().st_size if log_path.exists() else 0
+            # Only send non-empty lines, read backwards from the end of the log
+            initial_lines = await asyncio.to_thread(
+                tail_lines,
+                log_path,
+                100,
+                lambda line: line.strip() or None,
+                end=backlog_end,
+            )
+            if initial_lines:
+                await send_log_frames(websocket, [("lines", initial_lines)])
+
+        # New lines come from the shared tailer, collected into frames of up to
+        # FRAME_MAX_LINES lines / FRAME_MAX_DELAY seconds. While this client is
+        # slow to receive, its queue fills up and the tailer drops lines for it
+        # (sent as a "log_dropped" marker) instead of buffering without limit.
+        # Wake up regularly to follow mode changes.
         last_mode = current_mode
         current_log_file = log_file  # Track current log file being watched
 
+        # Notice a closed connection right away, not only on the next send
+        disconnected = asyncio.create_task(wait_for_websocket_disconnect(websocket))
+        next_lines = None
+
         while True:
+            if next_lines is None:
+                next_lines = asyncio.create_task(subscription.get_frames())
             try:
-                # FASTER POLLING: 0.3s instead of 1s
-                await asyncio.sleep(0.3)
+                done, _ = await asyncio.wait(
+                    {next_lines, disconnected},
+                    timeout=0.5,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
             except asyncio.CancelledError:
                 logger.info("WebSocket log streaming cancelled (connection closed)")
                 break
 
+            if disconnected in done:
+                logger.info("WebSocket client disconnected")
+                break
+
+            frames = None
+            if next_lines in done:
+                frames = next_lines.result()
+                next_lines = None
+
             # Only auto-switch if user didn't manually request a specific log
             # AND the current mode changed
             if (
@@ -6501,7 +7659,12 @@ async def websocket_logs(
                     log_path = LOGS_DIR / new_log_file
                     if not log_path.exists():
                         log_path = UI_LOGS_DIR / new_log_file
-                    last_position = log_path.stat().st_size if log_path.exists() else 0
+                    log_tailer_hub.unsubscribe(subscription)
+                    subscription = log_tailer_hub.subscribe(log_path)
+                    frames = None  # Lines of the previous file
+                    if next_lines is not None:
+                        next_lines.cancel()
+                        next_lines = None
 
                     # Notify client about log file change
                     await websocket.send_json(
@@ -6520,37 +7683,8 @@ async def websocket_logs(
                     f"Mode changed to {current_mode}, but user manually selected {log_file}, not auto-switching"
                 )
 
-            # Monitor current log file
-            if log_path.exists():
-                try:
-                    current_size = log_path.stat().st_size
-
-                    # Handle log file truncation/rotation
-                    if current_size < last_position:
-                        last_position = 0
-                        logger.info(
-                            f"Log file {log_path.name} was truncated or rotated"
-                        )
-
-                    if current_size > last_position:
-                        with open(
-                            log_path, "r", encoding="utf-8", errors="ignore"
-                        ) as f:
-                            f.seek(last_position)
-                            new_lines = f.readlines()
-
-                            # Send new lines immediately as they come
-                            for line in new_lines:
-                                stripped = line.strip()
-                                if stripped:  # Only send non-empty lines
-                                    await websocket.send_json(
-                                        {"type": "log", "content": stripped}
-                                    )
-
-                        last_position = current_size
-                except OSError as e:
-                    logger.warning(f"Error reading log file: {e}")
-                    await asyncio.sleep(1)  # Wait longer on file errors
+            if frames:
+                await send_log_frames(websocket, frames)
 
     except WebSocketDisconnect as e:
         # Normal disconnect - check close code
@@ -6578,16 +7712,42 @@ async def websocket_logs(
             except:
                 pass
     finally:
+        for task in (disconnected, next_lines):
+            if task is not None:
+                task.cancel()
+        if subscription is not None:
+            log_tailer_hub.unsubscribe(subscription)
         logger.debug("WebSocket connection closed")
 
 
 @app.get("/api/gallery")
-async def get_gallery():
-    """Get poster gallery from assets directory (only poster.jpg) - uses cache"""
+async def get_gallery(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(200, ge=1, le=1000),
+    sort: str = Query("path"),
+    order: str = Query("asc"),
+    library: Optional[str] = Query(None),
+):
+    """
+    Get poster gallery from assets directory (only poster.jpg) - uses cache
+
+    Keyset pagination: pass next_cursor from the previous response as cursor.
+    sort: path, modified or size; order: asc or desc; library: folder name.
+    """
     try:
         cache = get_fresh_assets()
-        # Return cached posters, limit to 200 for performance
-        return {"images": cache["posters"][:200]}
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+        return asset_json_response(
+            cache,
+            ("gallery", "posters", cursor, limit, sort, order, library),
+            lambda: get_gallery_page(cache, "posters", cursor, limit, sort, order, library),
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting gallery from cache: {e}")
         return {"images": []}
@@ -6622,8 +7782,8 @@ async def delete_poster(path: str):
         # Delete corresponding database entries
         delete_db_entries_for_asset(path)
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the file from the asset cache (no rescan)
+        await asyncio.to_thread(remove_asset_paths, [file_path])
 
         return {"success": True, "message": f"Poster '{path}' deleted successfully"}
     except HTTPException:
@@ -6680,8 +7840,10 @@ async def bulk_delete_posters(request: BulkDeleteRequest):
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting poster {path}: {e}")
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the deleted files from the asset cache (no rescan)
+        await asyncio.to_thread(
+            remove_asset_paths, [ASSETS_DIR / path for path in deleted]
+        )
 
         return {
             "success": True,
@@ -6695,11 +7857,33 @@ async def bulk_delete_posters(request: BulkDeleteRequest):
 
 
 @app.get("/api/backgrounds-gallery")
-async def get_backgrounds_gallery():
-    """Get backgrounds gallery from assets directory (only background.jpg) - uses cache"""
+async def get_backgrounds_gallery(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(200, ge=1, le=1000),
+    sort: str = Query("path"),
+    order: str = Query("asc"),
+    library: Optional[str] = Query(None),
+):
+    """
+    Get backgrounds gallery from assets directory (only background.jpg) - uses cache
+
+    Keyset pagination: pass next_cursor from the previous response as cursor.
+    sort: path, modified or size; order: asc or desc; library: folder name.
+    """
     try:
         cache = get_fresh_assets()
-        return {"images": cache["backgrounds"][:200]}
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+        return asset_json_response(
+            cache,
+            ("gallery", "backgrounds", cursor, limit, sort, order, library),
+            lambda: get_gallery_page(cache, "backgrounds", cursor, limit, sort, order, library),
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting backgrounds from cache: {e}")
         return {"images": []}
@@ -6734,8 +7918,8 @@ async def delete_background(path: str):
         # Delete corresponding database entries
         delete_db_entries_for_asset(path)
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the file from the asset cache (no rescan)
+        await asyncio.to_thread(remove_asset_paths, [file_path])
 
         return {"success": True, "message": f"Background '{path}' deleted successfully"}
     except HTTPException:
@@ -6788,8 +7972,10 @@ async def bulk_delete_backgrounds(request: BulkDeleteRequest):
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting background {path}: {e}")
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the deleted files from the asset cache (no rescan)
+        await asyncio.to_thread(
+            remove_asset_paths, [ASSETS_DIR / path for path in deleted]
+        )
 
         return {
             "success": True,
@@ -6803,11 +7989,33 @@ async def bulk_delete_backgrounds(request: BulkDeleteRequest):
 
 
 @app.get("/api/seasons-gallery")
-async def get_seasons_gallery():
-    """Get seasons gallery from assets directory (only SeasonXX.jpg) - uses cache"""
+async def get_seasons_gallery(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(200, ge=1, le=1000),
+    sort: str = Query("path"),
+    order: str = Query("asc"),
+    library: Optional[str] = Query(None),
+):
+    """
+    Get seasons gallery from assets directory (only SeasonXX.jpg) - uses cache
+
+    Keyset pagination: pass next_cursor from the previous response as cursor.
+    sort: path, modified or size; order: asc or desc; library: folder name.
+    """
     try:
         cache = get_fresh_assets()
-        return {"images": cache["seasons"][:200]}
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+        return asset_json_response(
+            cache,
+            ("gallery", "seasons", cursor, limit, sort, order, library),
+            lambda: get_gallery_page(cache, "seasons", cursor, limit, sort, order, library),
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting seasons from cache: {e}")
         return {"images": []}
@@ -6842,8 +8050,8 @@ async def delete_season(path: str):
         # Delete corresponding database entries
         delete_db_entries_for_asset(path)
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the file from the asset cache (no rescan)
+        await asyncio.to_thread(remove_asset_paths, [file_path])
 
         return {"success": True, "message": f"Season '{path}' deleted successfully"}
     except HTTPException:
@@ -6896,8 +8104,10 @@ async def bulk_delete_seasons(request: BulkDeleteRequest):
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting season {path}: {e}")
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the deleted files from the asset cache (no rescan)
+        await asyncio.to_thread(
+            remove_asset_paths, [ASSETS_DIR / path for path in deleted]
+        )
 
         return {
             "success": True,
@@ -6911,16 +8121,235 @@ async def bulk_delete_seasons(request: BulkDeleteRequest):
 
 
 @app.get("/api/titlecards-gallery")
-async def get_titlecards_gallery():
-    """Get title cards gallery from assets directory (only SxxExx.jpg - episodes) - uses cache"""
+async def get_titlecards_gallery(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(200, ge=1, le=1000),
+    sort: str = Query("path"),
+    order: str = Query("asc"),
+    library: Optional[str] = Query(None),
+):
+    """
+    Get title cards gallery from assets directory (only SxxExx.jpg - episodes) - uses cache
+
+    Keyset pagination: pass next_cursor from the previous response as cursor.
+    sort: path, modified or size; order: asc or desc; library: folder name.
+    """
     try:
         cache = get_fresh_assets()
-        return {"images": cache["titlecards"][:200]}
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+        return asset_json_response(
+            cache,
+            ("gallery", "titlecards", cursor, limit, sort, order, library),
+            lambda: get_gallery_page(cache, "titlecards", cursor, limit, sort, order, library),
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting titlecards from cache: {e}")
         return {"images": []}
 
 
+@app.get("/api/assets/images")
+async def get_assets_images(
+    request: Request,
+    response: Response,
+    image_type: str = Query("posters", alias="type"),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(200, ge=1, le=1000),
+    sort: str = Query("path"),
+    order: str = Query("asc"),
+    library: Optional[str] = Query(None),
+):
+    """
+    Paginated images of any asset type (posters, backgrounds, seasons, titlecards)
+    Same parameters and response as the gallery endpoints - uses cache
+    """
+    if image_type not in ASSET_TYPE_COUNT_KEYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid image type. Must be one of: {list(ASSET_TYPE_COUNT_KEYS)}",
+        )
+    try:
+        cache = get_fresh_assets()
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+        return asset_json_response(
+            cache,
+            ("gallery", image_type, cursor, limit, sort, order, library),
+            lambda: get_gallery_page(cache, image_type, cursor, limit, sort, order, library),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting {image_type} from cache: {e}")
+        return {"images": []}
+
+
+@app.get("/api/assets/shows")
+async def get_asset_shows(
+    request: Request,
+    response: Response,
+    library: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """
+    Shows with season posters or titlecards, one page at a time
+    Each show has its season/episode counts, total size and newest mtime;
+    browse into it with /api/assets/shows/seasons - uses cache
+    """
+    try:
+        cache = get_fresh_assets()
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+
+        def build():
+            shows_index = cache.shows()
+            shows, next_cursor = shows_index.page(library, cursor, limit)
+            total = len(
+                shows_index.keys
+                if library is None
+                else shows_index.by_library.get(library, [])
+            )
+            return {"shows": shows, "total": total, "next_cursor": next_cursor}
+
+        return asset_json_response(
+            cache, ("shows", library, cursor, limit), build
+        )
+    except Exception as e:
+        logger.error(f"Error getting shows from cache: {e}")
+        return {"shows": [], "total": 0, "next_cursor": None}
+
+
+@app.get("/api/assets/shows/seasons")
+async def get_asset_show_seasons(
+    request: Request,
+    response: Response,
+    show: str = Query(...),
+):
+    """
+    Seasons of one show (key from /api/assets/shows) with their season poster,
+    episode count, size and newest mtime - uses cache
+    """
+    cache = get_fresh_assets()
+    not_modified = check_asset_cache_etag(request, response, cache)
+    if not_modified:
+        return not_modified
+
+    seasons = cache.shows().seasons(show)
+    if seasons is None:
+        raise HTTPException(status_code=404, detail="Show not found")
+    return {"show": show, "seasons": seasons}
+
+
+@app.get("/api/assets/shows/episodes")
+async def get_asset_show_episodes(
+    request: Request,
+    response: Response,
+    show: str = Query(...),
+    season: int = Query(..., ge=0),
+):
+    """
+    Titlecards of one season of a show, ordered by episode number - uses cache
+    """
+    cache = get_fresh_assets()
+    not_modified = check_asset_cache_etag(request, response, cache)
+    if not_modified:
+        return not_modified
+
+    episodes = cache.shows().episodes(show, season)
+    if episodes is None:
+        raise HTTPException(status_code=404, detail="Season not found")
+    return {"show": show, "season": season, "episodes": episodes}
+
+
+@app.get("/api/assets/search")
+async def search_assets(
+    request: Request,
+    response: Response,
+    q: str = Query(""),
+    tmdb: Optional[str] = Query(None),
+    tvdb: Optional[str] = Query(None),
+    imdb: Optional[str] = Query(None),
+    library: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    Search the asset library by title words (prefix match), year and
+    provider IDs (tmdb/tvdb/imdb, also accepted as q="tmdb-123") - uses cache
+    """
+    if not q.strip() and not (tmdb or tvdb or imdb):
+        raise HTTPException(
+            status_code=400, detail="Provide a search query or a provider ID"
+        )
+    try:
+        cache = get_fresh_assets()
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+
+        start = time.perf_counter()
+        result = cache.search_index().search(q, tmdb, tvdb, imdb, library, limit)
+        result["took_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+    except Exception as e:
+        logger.error(f"Error searching assets: {e}")
+        return {"results": [], "total": 0}
+
+
+@app.get("/api/thumb/{path:path}")
+async def get_thumbnail(
+    path: str,
+    w: int = Query(300, ge=16, le=4000),
+    fmt: str = Query("webp"),
+):
+    """
+    Resized thumbnail of an image in the assets directory (disk cached)
+    Widths are rounded up to the next cached size; falls back to the original
+    image if thumbnails are unavailable or the image cannot be decoded
+    """
+    fmt = fmt.lower()
+    if fmt not in ("webp", "jpeg", "jpg"):
+        raise HTTPException(
+            status_code=400, detail="Invalid format. Must be one of: webp, jpeg"
+        )
+
+    file_path = ASSETS_DIR / path
+
+    # Security check: Ensure the path is within ASSETS_DIR
+    try:
+        file_path = file_path.resolve()
+        file_path.relative_to(ASSETS_DIR.resolve())
+    except ValueError:
+        raise HTTPException(status_code=403, detail="Access denied: Invalid path")
+
+    if not file_path.is_file():
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    cache_headers = {"Cache-Control": "public, max-age=86400"}
+
+    if thumbnail_cache is not None:
+        try:
+            thumb_path = await asyncio.wrap_future(
+                thumbnail_cache.submit(file_path, w, fmt)
+            )
+            return FileResponse(
+                thumb_path, media_type=media_type_for(fmt), headers=cache_headers
+            )
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Image not found")
+        except Exception as e:
+            logger.warning(f"Could not create thumbnail for {path}: {e}")
+
+    return FileResponse(file_path, headers=cache_headers)
+
+
 @app.delete("/api/titlecards/{path:path}")
 async def delete_titlecard(path: str):
     """Delete a titlecard from the assets directory"""
@@ -6950,8 +8379,8 @@ async def delete_titlecard(path: str):
         # Delete corresponding database entries
         delete_db_entries_for_asset(path)
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the file from the asset cache (no rescan)
+        await asyncio.to_thread(remove_asset_paths, [file_path])
 
         return {"success": True, "message": f"TitleCard '{path}' deleted successfully"}
     except HTTPException:
@@ -7004,8 +8433,10 @@ async def bulk_delete_titlecards(request: BulkDeleteRequest):
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting titlecard {path}: {e}")
 
-        # Invalidate cache to reflect changes immediately
-        asset_cache["last_scanned"] = 0
+        # Drop the deleted files from the asset cache (no rescan)
+        await asyncio.to_thread(
+            remove_asset_paths, [ASSETS_DIR / path for path in deleted]
+        )
 
         return {
             "success": True,
@@ -7024,113 +8455,37 @@ async def bulk_delete_titlecards(request: BulkDeleteRequest):
 
 
 @app.get("/api/manual-assets-gallery")
-async def get_manual_assets_gallery():
-    """Get all assets from manualassets directory - organized by library and folder"""
-    try:
-        if not MANUAL_ASSETS_DIR.exists():
-            logger.warning(
-                f"Manual assets directory does not exist: {MANUAL_ASSETS_DIR}"
-            )
-            return {"libraries": [], "total_assets": 0}
-
-        libraries = []
-        total_assets = 0
-
-        # Iterate through library folders
-        for library_dir in MANUAL_ASSETS_DIR.iterdir():
-            # Skip @eaDir folders from Synology NAS
-            if not library_dir.is_dir() or library_dir.name == "@eaDir":
-                continue
-
-            library_name = library_dir.name
-            folders = []
-
-            # Iterate through show/movie folders
-            for folder_dir in library_dir.iterdir():
-                # Skip @eaDir folders from Synology NAS
-                if not folder_dir.is_dir() or folder_dir.name == "@eaDir":
-                    continue
-
-                folder_name = folder_dir.name
-                assets = []
-
-                # Find all image files in this folder
-                for img_file in folder_dir.iterdir():
-                    # Skip items containing @eaDir in path
-                    if "@eaDir" in img_file.parts:
-                        continue
-
-                    if img_file.is_file() and img_file.suffix.lower() in [
-                        ".jpg",
-                        ".jpeg",
-                        ".png",
-                        ".webp",
-                    ]:
-                        # Skip backup files
-                        if img_file.suffix == ".backup" or ".backup" in img_file.name:
-                            continue
-
-                        # Determine asset type from filename
-                        filename_lower = img_file.name.lower()
-                        if (
-                            filename_lower == "poster.jpg"
-                            or filename_lower == "poster.png"
-                        ):
-                            asset_type = "poster"
-                        elif (
-                            filename_lower == "background.jpg"
-                            or filename_lower == "background.png"
-                        ):
-                            asset_type = "background"
-                        elif filename_lower.startswith("season") and any(
-                            c.isdigit() for c in filename_lower
-                        ):
-                            asset_type = "season"
-                        elif re.match(r"^s\d+e\d+\.", filename_lower):
-                            asset_type = "titlecard"
-                        else:
-                            asset_type = "other"
-
-                        # Build relative path from manual assets dir
-                        relative_path = f"{library_name}/{folder_name}/{img_file.name}"
-                        # URL encode the path to handle special characters like #
-                        encoded_relative_path = quote(relative_path, safe="/")
-
-                        assets.append(
-                            {
-                                "name": img_file.name,
-                                "path": relative_path,
-                                "type": asset_type,
-                                "size": img_file.stat().st_size,
-                                "url": f"/manual_poster_assets/{encoded_relative_path}",
-                            }
-                        )
-                        total_assets += 1
+async def get_manual_assets_gallery(
+    library: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """
+    Get assets from manualassets directory - organized by library and folder (uses index)
 
-                if assets:
-                    folders.append(
-                        {
-                            "name": folder_name,
-                            "path": f"{library_name}/{folder_name}",
-                            "assets": assets,
-                            "asset_count": len(assets),
-                        }
-                    )
+    Without library: the whole gallery.
+    With library: one page of that library's folders, ordered by name; pass
+    next_cursor from the previous response as cursor.
+    """
+    try:
+        if not manual_assets_index.last_scanned:
+            manual_assets_index.scan()
 
-            if folders:
-                libraries.append(
-                    {
-                        "name": library_name,
-                        "folders": folders,
-                        "folder_count": len(folders),
-                    }
-                )
+        if library is None:
+            body = json_response_cache.get(
+                ("manual-assets-gallery",),
+                manual_assets_index.generation,
+                manual_assets_index.get_gallery,
+            )
+            return FastJSONResponse(body)
 
-        logger.info(
-            f"Manual assets gallery: {len(libraries)} libraries, {total_assets} total assets"
-        )
-        return {"libraries": libraries, "total_assets": total_assets}
+        page = manual_assets_index.get_library_page(library, cursor, limit)
+        if page is None:
+            raise HTTPException(status_code=404, detail="Library not found")
+        return page
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting manual assets gallery: {e}")
         import traceback
@@ -7139,6 +8494,18 @@ async def get_manual_assets_gallery():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/manual-assets-libraries")
+async def get_manual_assets_libraries():
+    """Manual asset libraries with folder and asset counts (uses index)"""
+    try:
+        if not manual_assets_index.last_scanned:
+            manual_assets_index.scan()
+        return {"libraries": manual_assets_index.get_libraries()}
+    except Exception as e:
+        logger.error(f"Error getting manual asset libraries: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.delete("/api/manual-assets/{path:path}")
 async def delete_manual_asset(path: str):
     """Delete an asset from the manual assets directory"""
@@ -7164,6 +8531,7 @@ async def delete_manual_asset(path: str):
         # Delete the file
         file_path.unlink()
         logger.info(f"Deleted manual asset: {file_path}")
+        manual_assets_index.refresh_path(file_path)
 
         return {
             "success": True,
@@ -7212,6 +8580,7 @@ async def bulk_delete_manual_assets(request: BulkDeleteRequest):
                 file_path.unlink()
                 deleted.append(path)
                 logger.info(f"Deleted manual asset: {file_path}")
+                manual_assets_index.refresh_path(file_path)
             except Exception as e:
                 failed.append({"path": path, "error": str(e)})
                 logger.error(f"Error deleting manual asset {path}: {e}")
@@ -7231,18 +8600,25 @@ async def bulk_delete_manual_assets(request: BulkDeleteRequest):
 
 
 @app.get("/api/assets-folders")
-async def get_assets_folders():
+async def get_assets_folders(request: Request, response: Response):
     """Get list of folders in assets directory with image counts per type - uses cache"""
     try:
         cache = get_fresh_assets()
-        return {"folders": cache["folders"]}
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+        return asset_json_response(
+            cache, ("assets-folders",), lambda: {"folders": cache["folders"]}
+        )
     except Exception as e:
         logger.error(f"Error getting folders from cache: {e}")
         return {"folders": []}
 
 
 @app.get("/api/assets-folder-images/{image_type}/{folder_path:path}")
-async def get_assets_folder_images_filtered(image_type: str, folder_path: str):
+async def get_assets_folder_images_filtered(
+    image_type: str, folder_path: str, request: Request, response: Response
+):
     """Get filtered images from a specific folder - uses cache"""
     # Validate image_type
     valid_types = ["posters", "backgrounds", "seasons", "titlecards"]
@@ -7253,57 +8629,46 @@ async def get_assets_folder_images_filtered(image_type: str, folder_path: str):
 
     try:
         cache = get_fresh_assets()
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
 
-        # Get the appropriate image list from cache
-        all_images = cache[image_type]
-
-        # Filter images that belong to the specified folder
+        # Images that belong to the specified folder, via the path-sorted index
         # folder_path is like "4K" or "Movies/ActionMovies"
-        filtered_images = [
-            img
-            for img in all_images
-            if img["path"].startswith(folder_path + "/")
-            or img["path"].startswith(folder_path + "\\")
-        ]
+        filtered_images = cache.in_folder(image_type, folder_path.rstrip("/\\"))
 
-        return {"images": filtered_images}
+        return {"images": serialize_assets(filtered_images)}
     except Exception as e:
         logger.error(f"Error getting folder images from cache: {e}")
         return {"images": []}
 
 
 @app.get("/api/folder-view/items/{library_path:path}")
-async def get_folder_view_items(library_path: str):
+async def get_folder_view_items(library_path: str, request: Request, response: Response):
     """
     Get list of item folders (movies/shows) within a library for folder view navigation
     Returns folders like "Movie Name (Year) {tmdb-123}" within the specified library
+    Served from the asset index: asset_count is the number of images directly in the folder
     """
     try:
-        if not ASSETS_DIR.exists():
-            return {"folders": []}
-
-        library_full_path = ASSETS_DIR / library_path
-        if not library_full_path.exists() or not library_full_path.is_dir():
-            return {"folders": []}
-
-        folders = []
-        for item in library_full_path.iterdir():
-            # Skip @eaDir folders from Synology NAS
-            if item.is_dir() and item.name == "@eaDir":
-                continue
-
-            if item.is_dir():
-                # Count assets in this folder
-                asset_count = 0
-                for ext in ["*.jpg", "*.jpeg", "*.png", "*.webp"]:
-                    asset_count += len(list(item.glob(ext)))
-
-                folders.append(
-                    {"name": item.name, "path": item.name, "asset_count": asset_count}
-                )
-
-        # Sort by name
-        folders.sort(key=lambda x: x["name"])
+        cache = get_fresh_assets()
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+
+        directories = cache.directories()
+        library_dir = directories.normalize(library_path)
+
+        folders = [
+            {
+                "name": name,
+                "path": name,
+                "asset_count": len(
+                    directories.files_in(os.path.join(library_dir, name))
+                ),
+            }
+            for name in directories.subdirectories(library_dir)
+        ]
         return {"folders": folders}
 
     except Exception as e:
@@ -7312,40 +8677,28 @@ async def get_folder_view_items(library_path: str):
 
 
 @app.get("/api/folder-view/assets/{item_path:path}")
-async def get_folder_view_assets(item_path: str):
+async def get_folder_view_assets(item_path: str, request: Request, response: Response):
     """
     Get all assets (poster, background, seasons, etc.) for a specific item in folder view
     item_path should be like "4K/Movie Name (Year) {tmdb-123}"
+    Served from the asset index
     """
     try:
-        if not ASSETS_DIR.exists():
-            return {"assets": []}
-
-        item_full_path = ASSETS_DIR / item_path
-        if not item_full_path.exists() or not item_full_path.is_dir():
-            return {"assets": []}
-
-        assets = []
-        for ext in ["*.jpg", "*.jpeg", "*.png", "*.webp"]:
-            for image_path in item_full_path.glob(ext):
-                if image_path.is_file():
-                    # Create relative path from ASSETS_DIR
-                    relative_path = image_path.relative_to(ASSETS_DIR)
-                    url_path = str(relative_path).replace("\\", "/")
-                    # URL encode the path to handle special characters like #
-                    encoded_url_path = quote(url_path, safe="/")
-
-                    assets.append(
-                        {
-                            "name": image_path.name,
-                            "path": str(relative_path).replace("\\", "/"),
-                            "url": f"/poster_assets/{encoded_url_path}",
-                            "size": image_path.stat().st_size,
-                        }
-                    )
-
-        # Sort by name
-        assets.sort(key=lambda x: x["name"])
+        cache = get_fresh_assets()
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
+
+        directories = cache.directories()
+        assets = [
+            {
+                "name": record.name,
+                "path": record.url_path,
+                "url": record.url,
+                "size": record.size,
+            }
+            for record in directories.files_in(directories.normalize(item_path))
+        ]
         return {"assets": assets}
 
     except Exception as e:
@@ -7359,120 +8712,27 @@ async def get_recent_assets():
     Get recently created assets from the imagechoices database
     Returns the most recent assets with their poster images from assets folder
 
-    Uses the imagechoices.db database instead of CSV files
+    Served from the materialized recent_assets table, which is rebuilt in the
+    background when ImageChoices.csv is imported or the asset index changes
     Assets are ordered by ID DESC (newest/highest ID first)
     """
+    if not DATABASE_AVAILABLE or db is None:
+        return {"success": True, "assets": [], "total_count": 0}
+
     try:
-        # Auto-import CSV to database before fetching (ensures fresh data)
+        # Pick up a CSV written outside the UI (no-op if unchanged); a changed
+        # CSV schedules a background rebuild of the feed
         try:
             import_imagechoices_to_db()
         except Exception as e:
             logger.warning(f"Could not import CSV to database: {e}")
 
-        # Get all assets from database (already sorted by id DESC - newest first)
-        db_records = db.get_all_choices()
-
-        logger.info(f"Found {len(db_records)} total assets in database")
-
-        # If no assets found, return early
-        if not db_records:
-            logger.warning(" No assets found in database")
-            return {
-                "success": True,
-                "assets": [],
-                "total_count": 0,
-            }
-
-        # Convert database records to asset format and find poster files
-        recent_assets = []
-        max_assets = 100  # Limit to 100 most recent assets
-
-        # Process records until we have 100 valid assets (not just first 100 records)
-        for record in db_records:
-            # Stop once we have enough valid assets
-            if len(recent_assets) >= max_assets:
-                break
-
-            # Convert database record (sqlite3.Row) to dict
-            asset_dict = dict(record)
-
-            rootfolder = asset_dict.get("Rootfolder", "")
-            asset_type = asset_dict.get("Type", "Poster")
-            title = asset_dict.get("Title", "")
-            download_source = asset_dict.get("Download Source", "")
-
-            # Determine if manually created based on Manual field or download_source
-            manual_field = asset_dict.get("Manual", "N/A")
-
-            # Manual can be: "Yes" (resolved), "No" (explicitly unresolved), "true"/"false" (legacy), or N/A (not set)
-            # "Yes" = resolved/manually marked as no edits needed
-            # "No" = explicitly unresolved (was resolved but user clicked unresolve)
-            # "true" = legacy resolved state
-            # "false" or N/A = regular assets
-
-            if manual_field in ["Yes", "true", True]:
-                is_manually_created = True
-            else:
-                # For "No", "false", False, or N/A - check download_source as fallback
-                is_manually_created = download_source == "N/A" or (
-                    download_source
-                    and (
-                        download_source.startswith("C:")
-                        or download_source.startswith("/")
-                        or download_source.startswith("\\")
-                    )
-                )
-
-            if rootfolder:
-                # Check if this is a fallback asset (skip fallback assets in recent view)
-                is_fallback = asset_dict.get("Fallback", "").lower() == "true"
-
-                # Skip fallback assets - they should only appear in assets overview
-                if is_fallback:
-                    logger.debug(
-                        f"[SKIP]  Skipping fallback asset in recent view: {title}"
-                    )
-                    continue
-
-                # Skip assets that were explicitly marked as unresolved (Manual="No")
-                # "No" means user clicked "Unresolve" - these should be hidden from recent assets
-                if manual_field == "No":
-                    logger.debug(
-                        f"[SKIP]  Skipping explicitly unresolved asset in recent view: {title}"
-                    )
-                    continue
-
-                poster_data = find_poster_with_metadata(
-                    rootfolder, asset_type, title, download_source
-                )
-                if poster_data:
-                    # Format asset for frontend (match old CSV format)
-                    asset = {
-                        "title": asset_dict.get("Title", ""),
-                        "type": asset_dict.get("Type", ""),
-                        "rootfolder": rootfolder,
-                        "library": asset_dict.get("LibraryName", ""),
-                        "language": asset_dict.get("Language", ""),
-                        "fallback": False,  # Always false here since we filter out fallback assets
-                        "text_truncated": asset_dict.get("TextTruncated", "").lower()
-                        == "true",
-                        "download_source": download_source,
-                        "provider_link": (
-                            asset_dict.get("Fav Provider Link", "")
-                            if asset_dict.get("Fav Provider Link", "") != "N/A"
-                            else ""
-                        ),
-                        "is_manually_created": is_manually_created,
-                        "poster_url": poster_data["url"],
-                        "has_poster": True,
-                        "created": poster_data["created"],
-                        "modified": poster_data["modified"],
-                    }
-                    recent_assets.append(asset)
-                else:
-                    logger.debug(f"[SKIP]  Skipping asset (poster not found): {title}")
+        recent_assets = [
+            recent_asset_from_row(row)
+            for row in db.get_recent_assets(RECENT_ASSETS_LIMIT)
+        ]
 
-        logger.info(
+        logger.debug(
             f"Returning {len(recent_assets)} most recent assets with existing images from database"
         )
 
@@ -7633,31 +8893,32 @@ async def get_dashboard_all():
 
 
 @app.get("/api/assets/stats")
-async def get_assets_stats():
+async def get_assets_stats(request: Request, response: Response):
     """
     Returns statistics about created assets - uses cache
     """
     try:
         # Use the existing cache instead of rescanning
         cache = get_fresh_assets()
+        not_modified = check_asset_cache_etag(request, response, cache)
+        if not_modified:
+            return not_modified
 
-        # Calculate total size from cache
-        total_size = sum(img["size"] for img in cache["posters"])
-        total_size += sum(img["size"] for img in cache["backgrounds"])
-        total_size += sum(img["size"] for img in cache["seasons"])
-        total_size += sum(img["size"] for img in cache["titlecards"])
-
-        sorted_folders = sorted(
-            cache["folders"], key=lambda x: x["files"], reverse=True
-        )
+        # Running aggregates, maintained as the index changes
+        totals = cache.stats.types
 
         stats = {
-            "posters": len(cache["posters"]),
-            "backgrounds": len(cache["backgrounds"]),
-            "seasons": len(cache["seasons"]),
-            "titlecards": len(cache["titlecards"]),
-            "total_size": total_size,
-            "folders": sorted_folders[:10],  # Top 10 folders by file count
+            "posters": totals["posters"]["count"],
+            "backgrounds": totals["backgrounds"]["count"],
+            "seasons": totals["seasons"]["count"],
+            "titlecards": totals["titlecards"]["count"],
+            "total_size": cache.stats.total_bytes,
+            "folders": cache.top_folders(10),  # Top 10 folders by file count
+            "types": totals,
+            "size_histogram": {
+                "bounds": list(SIZE_HISTOGRAM_BOUNDS),
+                "libraries": cache.stats.histograms,
+            },
         }
 
         return {"success": True, "stats": stats}
@@ -7672,14 +8933,15 @@ async def refresh_cache():
     """Manually refresh the asset cache"""
     try:
         scan_and_cache_assets()
+        cache = asset_cache
         return {
             "success": True,
             "message": "Cache refreshed successfully",
-            "posters": len(asset_cache["posters"]),
-            "backgrounds": len(asset_cache["backgrounds"]),
-            "seasons": len(asset_cache["seasons"]),
-            "titlecards": len(asset_cache["titlecards"]),
-            "folders": len(asset_cache["folders"]),
+            "posters": len(cache["posters"]),
+            "backgrounds": len(cache["backgrounds"]),
+            "seasons": len(cache["seasons"]),
+            "titlecards": len(cache["titlecards"]),
+            "folders": len(cache["folders"]),
         }
     except Exception as e:
         logger.error(f"Error refreshing cache: {e}")
@@ -7691,7 +8953,8 @@ async def get_cache_status():
     """Get detailed cache status including background refresh info"""
     try:
         now = time.time()
-        last_scan = asset_cache.get("last_scanned", 0)
+        cache = asset_cache
+        last_scan = cache.last_scanned
         age_seconds = now - last_scan if last_scan > 0 else 0
 
         # Robust thread checking
@@ -7702,6 +8965,8 @@ async def get_cache_status():
         except Exception:
             thread_alive = False
 
+        watcher_running = assets_watcher is not None and assets_watcher.is_running
+
         return {
             "success": True,
             "cache": {
@@ -7712,18 +8977,43 @@ async def get_cache_status():
                 ),
                 "age_seconds": int(age_seconds),
                 "ttl_seconds": CACHE_TTL_SECONDS,
-                "refresh_interval": CACHE_REFRESH_INTERVAL,
+                "refresh_interval": (
+                    CACHE_CONSISTENCY_INTERVAL
+                    if watcher_running
+                    else CACHE_REFRESH_INTERVAL
+                ),
                 "is_stale": False,  # TTL check removed, cache is always valid
-                "posters_count": len(asset_cache.get("posters", [])),
-                "backgrounds_count": len(asset_cache.get("backgrounds", [])),
-                "seasons_count": len(asset_cache.get("seasons", [])),
-                "titlecards_count": len(asset_cache.get("titlecards", [])),
-                "folders_count": len(asset_cache.get("folders", [])),
+                "posters_count": len(cache.posters),
+                "backgrounds_count": len(cache.backgrounds),
+                "seasons_count": len(cache.seasons),
+                "titlecards_count": len(cache.titlecards),
+                "folders_count": len(cache.folders),
             },
             "background_refresh": {
                 "running": cache_refresh_running,
                 "thread_alive": thread_alive,
-                "scan_in_progress": cache_scan_in_progress,
+                "scan_in_progress": asset_scan_lock.locked(),
+            },
+            "scan": asset_scanner.get_status(),
+            "memory": estimate_memory(cache.paths.values(), len(cache.paths)),
+            "responses": json_response_cache.get_stats(),
+            "thumbnails": thumbnail_cache.get_stats() if thumbnail_cache else None,
+            "watcher": {
+                "running": watcher_running,
+                "pending_changes": (
+                    assets_watcher.pending_count if watcher_running else 0
+                ),
+                "events_received": (
+                    assets_watcher.events_received if assets_watcher else 0
+                ),
+                "batches_applied": (
+                    assets_watcher.batches_flushed if assets_watcher else 0
+                ),
+                "last_applied": (
+                    datetime.fromtimestamp(assets_watcher.last_flush_time).isoformat()
+                    if assets_watcher and assets_watcher.last_flush_time
+                    else None
+                ),
             },
         }
     except Exception as e:
@@ -7998,6 +9288,12 @@ async def run_scheduler_now():
 # ============================================================================
 
 
+@app.get("/api/log-stream/status")
+async def get_log_stream_status():
+    """Shared log tailers behind /ws/logs: subscribers, reads and dropped lines"""
+    return {"success": True, **log_tailer_hub.get_stats()}
+
+
 @app.get("/api/logs-watcher/status")
 async def get_logs_watcher_status():
     """Get current logs watcher status"""
@@ -9591,6 +10887,13 @@ async def upload_asset_replacement(
             logger.info(
                 f"{action} asset: {asset_path} (size: {len(contents)} bytes, target: {target_base_dir.name})"
             )
+
+            # Keep the manual assets gallery index current (new file or move out)
+            manual_assets_index.refresh_path(full_asset_path)
+            manual_assets_index.refresh_path(alternate_asset_path)
+            await asyncio.to_thread(
+                upsert_asset_paths, [full_asset_path, alternate_asset_path]
+            )
         except PermissionError as e:
             logger.error(f"Permission denied writing to {full_asset_path}: {e}")
             raise HTTPException(
@@ -9838,6 +11141,7 @@ def delete_db_entries_for_asset(asset_path: str):
                 logger.info(
                     f"Deleted DB entry #{record_id} for deleted asset: {title} ({entry_type})"
                 )
+            request_recent_assets_refresh()
         else:
             logger.debug(
                 f"No DB entries found for deleted asset: {filename} in {folder_name}"
@@ -10000,6 +11304,7 @@ async def update_asset_db_entry_as_manual(
                 logger.info(
                     f"Deleted DB entry #{record_id} for manual replacement: {old_title} ({entry_type})"
                 )
+            request_recent_assets_refresh()
             logger.info(
                 f"New entry will be created by CSV import after script completes"
             )
@@ -10124,6 +11429,13 @@ async def replace_asset_from_url(
             f"Replaced asset from URL: {asset_path} (size: {len(contents)} bytes, target: {target_base_dir.name})"
         )
 
+        # Keep the manual assets gallery index current (new file or move out)
+        manual_assets_index.refresh_path(full_asset_path)
+        manual_assets_index.refresh_path(alternate_asset_path)
+        await asyncio.to_thread(
+            upsert_asset_paths, [full_asset_path, alternate_asset_path]
+        )
+
         # Add/Update database entry for this replaced asset (mark as Manual)
         try:
             await update_asset_db_entry_as_manual(
@@ -10615,9 +11927,13 @@ async def get_all_imagechoices():
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        records = db.get_all_choices()
-        # Convert sqlite3.Row to dict
-        return [dict(record) for record in records]
+        # Encoded once per database change, sqlite3.Row converted to dict
+        body = json_response_cache.get(
+            ("imagechoices",),
+            (id(db), db.generation),
+            lambda: [dict(record) for record in db.get_all_choices()],
+        )
+        return FastJSONResponse(body)
     except Exception as e:
         logger.error(f"Error fetching image choices: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -10660,6 +11976,7 @@ async def create_imagechoice(record: ImageChoiceRecord):
             fav_provider_link=record.FavProviderLink,
             manual=record.Manual,
         )
+        request_recent_assets_refresh()
         return {"id": record_id, "message": "Record created successfully"}
     except Exception as e:
         logger.error(f"Error creating image choice: {e}")
@@ -10676,6 +11993,7 @@ async def update_imagechoice(record_id: int, record: ImageChoiceRecord):
         # Convert record to dict and filter out None values
         update_data = {k: v for k, v in record.dict().items() if v is not None}
         db.update_choice(record_id, **update_data)
+        request_recent_assets_refresh()
         return {"message": "Record updated successfully"}
     except Exception as e:
         logger.error(f"Error updating image choice: {e}")
@@ -10690,6 +12008,7 @@ async def delete_imagechoice(record_id: int):
 
     try:
         db.delete_choice(record_id)
+        request_recent_assets_refresh()
         return {"message": "Record deleted successfully"}
     except Exception as e:
         logger.error(f"Error deleting image choice: {e}")
@@ -10825,6 +12144,7 @@ async def import_imagechoices_csv():
 
     try:
         stats = db.import_from_csv(csv_path)
+        request_recent_assets_refresh()
         return {
             "message": "CSV import completed",
             "stats": {
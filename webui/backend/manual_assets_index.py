@@ -0,0 +1,369 @@
+"""
+Manual Assets Index
+
+In-memory index of the manual assets directory (Library/Folder/image files),
+so the manual assets gallery no longer walks and stats the whole tree on
+every request.
+
+- Built with os.scandir (one stat per file, @eaDir and .backup files skipped)
+- Updated per file by the upload, replace and delete endpoints, and by a
+  watcher on the manual assets directory for changes made outside the UI
+- Changes made while a full scan runs are re-applied on top of its result
+- Every change bumps a generation number, which callers can use to cache
+  encoded responses
+"""
+
+import bisect
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+MANUAL_ASSETS_URL_PREFIX = "/manual_poster_assets/"
+EXCLUDED_DIRS = {"@eaDir"}
+
+
+def classify_manual_asset(filename: str) -> str:
+    """Asset type of a manual asset, from its file name"""
+    filename_lower = filename.lower()
+    if filename_lower in ("poster.jpg", "poster.png"):
+        return "poster"
+    if filename_lower in ("background.jpg", "background.png"):
+        return "background"
+    if filename_lower.startswith("season") and any(
+        c.isdigit() for c in filename_lower
+    ):
+        return "season"
+    if re.match(r"^s\d+e\d+\.", filename_lower):
+        return "titlecard"
+    return "other"
+
+
+class ManualAssetsIndex:
+    """Library -> folder -> file name -> asset entry, guarded by a lock"""
+
+    def __init__(self, root: Path, image_extensions: Iterable[str]):
+        """
+        Initialize the index
+
+        Args:
+            root: The manual assets directory
+            image_extensions: Lower-case file extensions to index, e.g. {".jpg"}
+        """
+        self.root = Path(root)
+        self.image_extensions = {ext.lower() for ext in image_extensions}
+        self._lock = threading.Lock()
+        self._libraries: Dict[str, Dict[str, Dict[str, dict]]] = {}
+        self.generation = 0
+        self.last_scanned: float = 0
+        # Paths refreshed while a scan runs (None when no scan is running)
+        self._changed_during_scan: Optional[Set[str]] = None
+
+    def _is_indexed_file(self, name: str) -> bool:
+        # Skip backup files created when replacing assets
+        if ".backup" in name:
+            return False
+        return os.path.splitext(name)[1].lower() in self.image_extensions
+
+    @staticmethod
+    def _entry(library: str, folder: str, name: str, size: int) -> dict:
+        relative_path = f"{library}/{folder}/{name}"
+        return {
+            "name": name,
+            "path": relative_path,
+            "type": classify_manual_asset(name),
+            "size": size,
+            # URL encode the path to handle special characters like #
+            "url": MANUAL_ASSETS_URL_PREFIX + quote(relative_path, safe="/"),
+        }
+
+    def scan(self):
+        """Rebuild the whole index from the filesystem"""
+        start = time.time()
+        with self._lock:
+            self._changed_during_scan = set()
+
+        libraries: Dict[str, Dict[str, Dict[str, dict]]] = {}
+        if self.root.is_dir():
+            with os.scandir(self.root) as library_entries:
+                for library_entry in library_entries:
+                    if (
+                        not library_entry.is_dir()
+                        or library_entry.name in EXCLUDED_DIRS
+                    ):
+                        continue
+                    folders = self._scan_library(library_entry.name, library_entry.path)
+                    if folders:
+                        libraries[library_entry.name] = folders
+        else:
+            logger.warning(f"Manual assets directory does not exist: {self.root}")
+
+        with self._lock:
+            self._libraries = libraries
+            self.generation += 1
+            self.last_scanned = time.time()
+            changed_during_scan = self._changed_during_scan
+            self._changed_during_scan = None
+
+        # Uploads and deletes that happened while scanning may be missing from
+        # (or outdated in) the scan result
+        if changed_during_scan:
+            self.refresh_paths(changed_during_scan)
+            logger.debug(
+                f"Re-applied {len(changed_during_scan)} manual asset change(s) made during the scan"
+            )
+
+        logger.info(
+            f"Manual assets index built in {time.time() - start:.2f}s: "
+            f"{len(libraries)} libraries, {self.total_assets} assets"
+        )
+
+    def _scan_folder(self, library: str, folder: str, path: str) -> Dict[str, dict]:
+        files = {}
+        try:
+            with os.scandir(path) as file_entries:
+                for file_entry in file_entries:
+                    if not self._is_indexed_file(file_entry.name):
+                        continue
+                    try:
+                        if not file_entry.is_file():
+                            continue
+                        size = file_entry.stat().st_size
+                    except OSError:
+                        continue
+                    files[file_entry.name] = self._entry(
+                        library, folder, file_entry.name, size
+                    )
+        except OSError as e:
+            logger.warning(f"Cannot list {path}: {e}")
+        return files
+
+    def _scan_library(self, library: str, path: str) -> Dict[str, Dict[str, dict]]:
+        folders = {}
+        try:
+            with os.scandir(path) as folder_entries:
+                for folder_entry in folder_entries:
+                    if not folder_entry.is_dir() or folder_entry.name in EXCLUDED_DIRS:
+                        continue
+                    files = self._scan_folder(library, folder_entry.name, folder_entry.path)
+                    if files:
+                        folders[folder_entry.name] = files
+        except OSError as e:
+            logger.warning(f"Cannot list {path}: {e}")
+        return folders
+
+    def _split(self, path: Path) -> Optional[Tuple[str, str, str]]:
+        """(library, folder, file name) of a path inside the root, else None"""
+        parts = self._parts(path)
+        if parts is None or len(parts) != 3:
+            return None
+        return parts[0], parts[1], parts[2]
+
+    def _parts(self, path: Path) -> Optional[Tuple[str, ...]]:
+        """Parts of a path relative to the root, None if outside or excluded"""
+        try:
+            parts = Path(path).relative_to(self.root).parts
+        except ValueError:
+            try:
+                parts = Path(path).resolve().relative_to(self.root.resolve()).parts
+            except (ValueError, OSError):
+                return None
+        if any(part in EXCLUDED_DIRS for part in parts):
+            return None
+        return parts
+
+    def refresh_paths(self, paths: Iterable[str]) -> bool:
+        """
+        Re-index changed files or directories (e.g. a batch from the watcher)
+
+        Files are refreshed one by one; a library or folder directory is
+        listed again as a whole (it may have been created, moved or deleted).
+
+        Returns True if the index changed.
+        """
+        changed = False
+        for path in paths:
+            parts = self._parts(path)
+            if parts is None:
+                continue
+            if len(parts) == 3:
+                changed |= self.refresh_path(Path(path))
+            elif len(parts) in (1, 2):
+                changed |= self._refresh_directory(parts)
+        return changed
+
+    def _refresh_directory(self, parts: Tuple[str, ...]) -> bool:
+        """Replace the entries of a library (or one of its folders) with a fresh listing"""
+        library = parts[0]
+        directory = self.root.joinpath(*parts)
+        if len(parts) == 1:
+            folders = (
+                self._scan_library(library, str(directory)) if directory.is_dir() else {}
+            )
+        else:
+            folder = parts[1]
+            files = (
+                self._scan_folder(library, folder, str(directory))
+                if directory.is_dir()
+                else {}
+            )
+
+        with self._lock:
+            if self._changed_during_scan is not None:
+                self._changed_during_scan.add(str(directory))
+            if len(parts) == 1:
+                if not folders and library not in self._libraries:
+                    return False
+                if folders:
+                    self._libraries[library] = folders
+                else:
+                    del self._libraries[library]
+            else:
+                current = self._libraries.get(library, {})
+                if not files and folder not in current:
+                    return False
+                if files:
+                    self._libraries.setdefault(library, {})[folder] = files
+                else:
+                    del current[folder]
+                    if not current:
+                        self._libraries.pop(library, None)
+            self.generation += 1
+        return True
+
+    def refresh_path(self, path: Path) -> bool:
+        """
+        Re-index a single file after it was written or deleted.
+
+        Returns True if the index changed. Paths outside the index layout
+        (not Library/Folder/file) are ignored.
+        """
+        split = self._split(path)
+        if split is None:
+            return False
+        library, folder, name = split
+
+        entry = None
+        if self._is_indexed_file(name):
+            try:
+                st = os.stat(path)
+                if not os.path.isdir(path):
+                    entry = self._entry(library, folder, name, st.st_size)
+            except OSError:
+                entry = None
+
+        with self._lock:
+            if self._changed_during_scan is not None:
+                self._changed_during_scan.add(str(path))
+            folders = self._libraries.get(library, {})
+            files = folders.get(folder, {})
+            if entry is None:
+                if name not in files:
+                    return False
+                del files[name]
+                if not files:
+                    folders.pop(folder, None)
+                if not folders:
+                    self._libraries.pop(library, None)
+            else:
+                self._libraries.setdefault(library, {}).setdefault(folder, {})[
+                    name
+                ] = entry
+            self.generation += 1
+        return True
+
+    @property
+    def total_assets(self) -> int:
+        with self._lock:
+            return sum(
+                len(files)
+                for folders in self._libraries.values()
+                for files in folders.values()
+            )
+
+    @staticmethod
+    def _folder_dict(library: str, folder: str, files: Dict[str, dict]) -> dict:
+        assets = [files[name] for name in sorted(files)]
+        return {
+            "name": folder,
+            "path": f"{library}/{folder}",
+            "assets": assets,
+            "asset_count": len(assets),
+        }
+
+    def get_gallery(self) -> dict:
+        """The whole gallery, grouped by library and folder"""
+        with self._lock:
+            libraries = []
+            total_assets = 0
+            for library in sorted(self._libraries):
+                folders = [
+                    self._folder_dict(library, folder, files)
+                    for folder, files in sorted(self._libraries[library].items())
+                ]
+                total_assets += sum(f["asset_count"] for f in folders)
+                libraries.append(
+                    {
+                        "name": library,
+                        "folders": folders,
+                        "folder_count": len(folders),
+                    }
+                )
+        return {"libraries": libraries, "total_assets": total_assets}
+
+    def get_libraries(self) -> List[dict]:
+        """Library names with folder and asset counts (no asset entries)"""
+        with self._lock:
+            return [
+                {
+                    "name": library,
+                    "folder_count": len(folders),
+                    "asset_count": sum(len(files) for files in folders.values()),
+                }
+                for library, folders in sorted(self._libraries.items())
+            ]
+
+    def get_library_page(
+        self, library: str, cursor: Optional[str] = None, limit: int = 50
+    ) -> Optional[dict]:
+        """
+        One page of a library's folders, ordered by name
+
+        Args:
+            library: Library name
+            cursor: Name of the last folder of the previous page
+            limit: Number of folders per page
+
+        Returns:
+            dict with folders, folder_count, asset_count and next_cursor,
+            or None if the library does not exist
+        """
+        with self._lock:
+            folders = self._libraries.get(library)
+            if folders is None:
+                return None
+            names = sorted(folders)
+            start = 0
+            if cursor:
+                # Keyset: first folder after the cursor
+                start = bisect.bisect_right(names, cursor)
+            page_names = names[start : start + limit]
+            page = [
+                self._folder_dict(library, name, folders[name]) for name in page_names
+            ]
+            asset_count = sum(len(files) for files in folders.values())
+
+        more = start + limit < len(names)
+        return {
+            "name": library,
+            "folders": page,
+            "folder_count": len(names),
+            "asset_count": asset_count,
+            "next_cursor": page_names[-1] if more and page_names else None,
+        }
@@ -0,0 +1,102 @@
+"""
+Encoded JSON response cache
+
+Large list endpoints (galleries, asset folders, image choices) are polled
+far more often than their data changes. Their bodies are encoded once per
+data generation and served as ready bytes on every further request.
+
+Encoding uses orjson if installed and falls back to the standard library.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes with orjson and passes pre-encoded bytes through"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+class EncodedResponseCache:
+    """
+    Encoded response bodies, each valid for one data generation
+
+    Entries are keyed by endpoint and parameters. A request for an older or
+    newer generation rebuilds the body; the least recently used entries are
+    evicted beyond max_entries (e.g. deep gallery pages).
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, generation: Any, build: Callable[[], Any]) -> bytes:
+        """
+        Return the encoded body for key at generation, building it if needed
+
+        Args:
+            key: Endpoint and parameters, e.g. ("gallery", "posters", None, 200)
+            generation: Version of the data the body is built from
+            build: Returns the content to encode (only called on a miss)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == generation:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Build outside the lock, concurrent misses for one key just encode twice
+        body = dumps(build())
+
+        with self._lock:
+            self._entries[key] = (generation, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(len(body) for _, body in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "encoder": "orjson" if ORJSON_AVAILABLE else "json",
+            }
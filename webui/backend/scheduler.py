@@ -53,6 +53,7 @@ class PosterizarrScheduler:
         self.config_path = base_dir / "scheduler.json"
         self.scheduler = None
         self.current_process = None
+        self.current_start_time: Optional[float] = None
         self.is_running = False
         self._scheduler_initialized = False
         self._lock = asyncio.Lock()  # Lock for thread-safe operations
@@ -294,6 +295,7 @@ class PosterizarrScheduler:
             def run_in_thread():
                 """Run subprocess in a separate thread to avoid blocking"""
                 try:
+                    self.current_start_time = datetime.now().timestamp()
                     process = subprocess.Popen(
                         command,
                         cwd=str(self.base_dir),
@@ -0,0 +1,110 @@
+"""
+Tests for log_reader.LogSearch: anchored regexes with and without a time
+window, on LF and CRLF logs; timestamp parameters and time lookups through
+the line index.
+
+Run from webui/backend: python -m pytest -q tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from log_reader import LogLineIndex, LogSearch, normalize_log_timestamp  # noqa: E402
+
+
+def write_log(path: Path, newline: str) -> Path:
+    lines = [
+        f"[2025-01-01 00:00:{i:02d}] [{'ERROR' if i % 7 == 0 else 'INFO'}]    |L.1    | msg {i}"
+        for i in range(40)
+    ]
+    path.write_bytes((newline.join(lines) + newline).encode("utf-8"))
+    return path
+
+
+def run_search(path: Path, **kwargs) -> list:
+    search = LogSearch(path, **kwargs)
+    found = []
+    try:
+        while True:
+            matches = search.scan_chunk()
+            if matches is None:
+                break
+            found.extend(match["line"] for match in matches)
+    finally:
+        search.close()
+    return found
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def log_file(request, tmp_path):
+    return write_log(tmp_path / "Scriptlog.log", request.param)
+
+
+@pytest.mark.parametrize(
+    "time_window",
+    [{}, {"since": "2025-01-01 00:00:00", "until": "2025-01-01 00:00:59"}],
+    ids=["no-time", "time-window"],
+)
+class TestAnchoredRegex:
+    def test_end_anchor(self, log_file, time_window):
+        assert run_search(log_file, query=r"msg 1\d$", regex=True, **time_window) == list(
+            range(10, 20)
+        )
+
+    def test_start_anchor(self, log_file, time_window):
+        assert run_search(
+            log_file, query=r"^\[2025-01-01 00:00:1", regex=True, **time_window
+        ) == list(range(10, 20))
+
+    def test_anchor_with_level(self, log_file, time_window):
+        assert run_search(
+            log_file, query=r"msg \d+$", regex=True, levels=["ERROR"], **time_window
+        ) == [0, 7, 14, 21, 28, 35]
+
+
+def test_substring_matches_content_without_line_ending(log_file):
+    search = LogSearch(log_file, query="msg 39")
+    matches = search.scan_chunk()
+    search.close()
+    assert [m["content"] for m in matches] == [
+        "[2025-01-01 00:00:39] [INFO]    |L.1    | msg 39"
+    ]
+
+
+def test_time_window_limits_lines(log_file):
+    assert run_search(
+        log_file, levels=["ERROR"], since="2025-01-01 00:00:10", until="2025-01-01 00:00:30"
+    ) == [14, 21, 28]
+
+
+@pytest.mark.parametrize(
+    "value, end, expected",
+    [
+        ("2025-01-01 00:00:10", False, "2025-01-01 00:00:10"),
+        ("2025-01-01T00:00:10", False, "2025-01-01 00:00:10"),
+        (" 2025-01-01 00:00 ", False, "2025-01-01 00:00:00"),
+        ("2025-01-01 00:00", True, "2025-01-01 00:00:59"),
+    ],
+)
+def test_normalize_log_timestamp(value, end, expected):
+    assert normalize_log_timestamp(value, end=end) == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["", "yesterday", "2025-01-01", "2025-1-1 00:00", "2025-01-01 00:00:10x"]
+)
+def test_normalize_log_timestamp_rejects_malformed(value):
+    with pytest.raises(ValueError):
+        normalize_log_timestamp(value)
+
+
+def test_find_time_with_normalized_timestamp(log_file, tmp_path):
+    index = LogLineIndex(log_file, tmp_path / "Scriptlog.idx", stride=4)
+    index.update()
+    assert index.find_time(normalize_log_timestamp("2025-01-01T00:00:25")) == 25
+    # Minute precision starts at the first line of that minute
+    assert index.find_time(normalize_log_timestamp("2025-01-01 00:00")) == 0
@@ -0,0 +1,395 @@
+"""
+Thumbnail Cache
+
+Resized gallery thumbnails, generated on demand with Pillow and kept on disk.
+
+- Cache files are keyed by source path, mtime, size, width and format, so a
+  replaced asset never serves a stale thumbnail
+- Widths are snapped to a few fixed steps to keep the number of variants low
+- Rendering runs in a thread pool (Pillow releases the GIL while decoding and
+  resizing); concurrent requests for the same thumbnail share one render
+- Least recently used thumbnails are evicted once the total size exceeds the
+  configured cap; the LRU order survives restarts via the files' mtimes
+- After a Posterizarr run, thumbnails of new assets can be pre-generated in a
+  small process pool running at low CPU priority (prewarm)
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+
+# Requested widths are rounded up to the next step (larger requests use the last)
+THUMBNAIL_WIDTHS = (150, 200, 300, 400, 600, 800)
+
+# Query value -> (Pillow format, file extension, media type)
+THUMBNAIL_FORMATS = {
+    "webp": ("WEBP", ".webp", "image/webp"),
+    "jpeg": ("JPEG", ".jpg", "image/jpeg"),
+    "jpg": ("JPEG", ".jpg", "image/jpeg"),
+}
+
+THUMBNAIL_QUALITY = 80
+
+# Niceness of pre-warm worker processes, so gallery requests and the
+# Posterizarr run itself keep priority
+PREWARM_NICENESS = 15
+
+
+def snap_width(width: int) -> int:
+    """Round a requested width up to the next supported step"""
+    for step in THUMBNAIL_WIDTHS:
+        if width <= step:
+            return step
+    return THUMBNAIL_WIDTHS[-1]
+
+
+def render_thumbnail(source: str, target: str, width: int, fmt: str) -> int:
+    """
+    Resize an image to the given width and write it to target atomically.
+
+    Module-level so it can also run in a process pool.
+
+    Returns:
+        Size of the written thumbnail in bytes
+    """
+    pil_format, _, _ = THUMBNAIL_FORMATS[fmt]
+
+    with Image.open(source) as img:
+        # Lets the JPEG decoder downscale while decoding (much faster for posters)
+        img.draft("RGB", (width, width * 4))
+        if img.mode not in ("RGB", "RGBA") or (
+            pil_format == "JPEG" and img.mode == "RGBA"
+        ):
+            img = img.convert("RGB")
+        if img.width > width:
+            height = max(1, round(img.height * width / img.width))
+            img = img.resize((width, height), Image.LANCZOS)
+
+        tmp_target = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        save_options = {"quality": THUMBNAIL_QUALITY}
+        if pil_format == "WEBP":
+            save_options["method"] = 4
+        else:
+            save_options["optimize"] = True
+        try:
+            img.save(tmp_target, pil_format, **save_options)
+            os.replace(tmp_target, target)
+        except BaseException:
+            # Do not leave a partial file in the cache directory
+            try:
+                os.unlink(tmp_target)
+            except OSError:
+                pass
+            raise
+
+    return os.path.getsize(target)
+
+
+def _lower_priority():
+    """Process pool initializer: run pre-warm workers at low CPU priority"""
+    try:
+        os.nice(PREWARM_NICENESS)
+    except (AttributeError, OSError):
+        pass  # Not supported on Windows
+
+
+class ThumbnailCache:
+    """On-disk thumbnail cache with LRU eviction and a total size cap"""
+
+    def __init__(self, cache_dir: Path, max_bytes: int, max_workers: int = 2):
+        """
+        Initialize the thumbnail cache
+
+        Args:
+            cache_dir: Directory holding the cached thumbnails
+            max_bytes: Evict least recently used thumbnails beyond this size
+            max_workers: Number of concurrent renders
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_workers = max(1, max_workers)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="Thumbnail"
+        )
+
+        # Cache file name -> size, oldest first; guarded by _lock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._in_flight: Dict[str, Future] = {}
+
+        # Statistics for /api/cache/status
+        self.hits = 0
+        self.renders = 0
+        self.errors = 0
+        self.evictions = 0
+
+        # One pre-warm at a time, progress guarded by _lock
+        self._prewarm_lock = threading.Lock()
+        self.prewarm_status: dict = {"running": False}
+
+    def initialize(self):
+        """Create the cache directory and load existing thumbnails in LRU order"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        found = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".tmp"):
+                # Leftover of an interrupted render
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            found.append((st.st_mtime, entry.name, st.st_size))
+
+        with self._lock:
+            for _, name, size in sorted(found):
+                self._entries[name] = size
+                self._total_bytes += size
+            self._evict()
+
+        logger.info(
+            f"Thumbnail cache initialized: {len(self._entries)} thumbnails, "
+            f"{self._total_bytes / 1024 / 1024:.1f} MB (limit "
+            f"{self.max_bytes / 1024 / 1024:.0f} MB)"
+        )
+
+    @staticmethod
+    def cache_name(source: Path, st: os.stat_result, width: int, fmt: str) -> str:
+        """
+        Cache file name for a source file in its current version
+
+        The path is resolved first, so the same file reached through a
+        symlinked or non-canonical assets directory maps to the same name.
+        """
+        key = f"{os.path.realpath(source)}|{st.st_mtime_ns}|{st.st_size}|{width}"
+        digest = hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
+        return digest + THUMBNAIL_FORMATS[fmt][1]
+
+    def submit(self, source: Path, width: int, fmt: str = "webp") -> Future:
+        """
+        Get the thumbnail of a source image, rendering it if needed.
+
+        Returns a Future resolving to the path of the cached thumbnail. Raises
+        FileNotFoundError if the source does not exist.
+        """
+        width = snap_width(width)
+        st = os.stat(source)
+        name = self.cache_name(source, st, width, fmt)
+        target = self.cache_dir / name
+
+        with self._lock:
+            if name not in self._entries:
+                future = self._in_flight.get(name)
+                if future is None:
+                    future = self.executor.submit(
+                        self._render, str(source), name, width, fmt
+                    )
+                    self._in_flight[name] = future
+                return future
+            self._entries.move_to_end(name)
+            self.hits += 1
+
+        # Keep the LRU order across restarts
+        try:
+            os.utime(target)
+        except OSError:
+            pass
+        done: Future = Future()
+        done.set_result(target)
+        return done
+
+    def _render(self, source: str, name: str, width: int, fmt: str) -> Path:
+        target = self.cache_dir / name
+        start = time.time()
+        try:
+            size = render_thumbnail(source, str(target), width, fmt)
+            self.add(name, size)
+            logger.debug(
+                f"Rendered {width}px {fmt} thumbnail for {source} "
+                f"in {time.time() - start:.2f}s ({size} bytes)"
+            )
+            return target
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(name, None)
+
+    def add(self, name: str, size: int):
+        """Register a thumbnail written to the cache directory"""
+        with self._lock:
+            previous = self._entries.pop(name, None)
+            if previous is not None:
+                self._total_bytes -= previous
+            self._entries[name] = size
+            self._total_bytes += size
+            self.renders += 1
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used thumbnails beyond the cap. Caller holds _lock."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.unlink(self.cache_dir / name)
+            except OSError:
+                pass
+
+    def prewarm(
+        self,
+        sources: Iterable[Path],
+        width: int = 300,
+        fmt: str = "webp",
+        max_workers: int = 1,
+    ) -> dict:
+        """
+        Pre-generate thumbnails for the given source images (blocking).
+
+        Renders run in a process pool at low CPU priority. At most twice as
+        many renders as workers are queued at any time, so a run that wrote
+        thousands of assets never floods the pool.
+
+        Returns:
+            dict with counts of queued, rendered, skipped and failed thumbnails
+        """
+        width = snap_width(width)
+        max_workers = max(1, max_workers)
+
+        with self._prewarm_lock:
+            jobs = []
+            skipped = 0
+            for source in sources:
+                try:
+                    st = os.stat(source)
+                except OSError:
+                    skipped += 1
+                    continue
+                name = self.cache_name(source, st, width, fmt)
+                with self._lock:
+                    if name in self._entries or name in self._in_flight:
+                        skipped += 1
+                        continue
+                jobs.append((str(source), name))
+
+            status = {
+                "running": True,
+                "queued": len(jobs),
+                "rendered": 0,
+                "skipped": skipped,
+                "failed": 0,
+                "width": width,
+                "format": fmt,
+                "started": time.time(),
+                "duration": None,
+            }
+            with self._lock:
+                self.prewarm_status = status
+
+            if jobs:
+                logger.info(
+                    f"Pre-warming {len(jobs)} {width}px thumbnail(s) with "
+                    f"{max_workers} worker(s) ({skipped} already cached)"
+                )
+                self._run_prewarm(jobs, width, fmt, max_workers, status)
+
+            with self._lock:
+                status["running"] = False
+                status["duration"] = round(time.time() - status["started"], 3)
+            if jobs:
+                logger.info(
+                    f"Thumbnail pre-warm finished in {status['duration']}s: "
+                    f"{status['rendered']} rendered, {status['failed']} failed"
+                )
+            return dict(status)
+
+    def _run_prewarm(self, jobs, width: int, fmt: str, max_workers: int, status: dict):
+        # Never fork the threaded web server process (inherited locks can
+        # deadlock the children). The fork server only preloads this module;
+        # Windows only supports spawn.
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+
+        def collect(done):
+            for future in done:
+                name = names.pop(future)
+                try:
+                    self.add(name, future.result())
+                    status["rendered"] += 1
+                except Exception as e:
+                    status["failed"] += 1
+                    self.errors += 1
+                    logger.debug(f"Pre-warm render failed for {name}: {e}")
+
+        names: Dict[Future, str] = {}
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_lower_priority,
+        ) as pool:
+            for source, name in jobs:
+                if len(names) >= max_workers * 2:
+                    done, _ = wait(names, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = pool.submit(
+                    render_thumbnail, source, str(self.cache_dir / name), width, fmt
+                )
+                names[future] = name
+            collect(wait(names).done)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "thumbnails": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "rendering": len(self._in_flight),
+                "hits": self.hits,
+                "renders": self.renders,
+                "errors": self.errors,
+                "evictions": self.evictions,
+                "workers": self.max_workers,
+                "prewarm": dict(self.prewarm_status),
+            }
+
+
+def media_type_for(fmt: str) -> str:
+    return THUMBNAIL_FORMATS[fmt][2]
+
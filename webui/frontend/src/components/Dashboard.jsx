@@ -423,14 +423,21 @@ function Dashboard() {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          if (data.type === "log") {
-            // Add new log line to allLogs
-            setAllLogs((prev) => [...prev, data.content]);
+          if (
+            data.type === "log_batch" ||
+            data.type === "log" ||
+            data.type === "log_dropped"
+          ) {
+            // log_batch carries several lines; log_dropped marks skipped lines
+            const lines = data.type === "log_batch" ? data.lines : [data.content];
+
+            // Add new log lines to allLogs
+            setAllLogs((prev) => [...prev, ...lines]);
 
             // Update status with last 25 logs for backward compatibility
             setStatus((prev) => ({
               ...prev,
-              last_logs: [...prev.last_logs.slice(-24), data.content],
+              last_logs: [...prev.last_logs, ...lines].slice(-25),
             }));
           } else if (data.type === "log_file_changed") {
             console.log(`Backend switched to: ${data.log_file}`);
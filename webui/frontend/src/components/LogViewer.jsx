@@ -233,7 +233,11 @@ function LogViewer() {
         try {
           const data = JSON.parse(event.data);
 
-          if (data.type === "log") {
+          if (data.type === "log_batch") {
+            // Several lines per frame, appended in one state update
+            setLogs((prev) => [...prev, ...data.lines]);
+          } else if (data.type === "log" || data.type === "log_dropped") {
+            // log_dropped: lines were skipped because the connection was too slow
             setLogs((prev) => [...prev, data.content]);
           } else if (data.type === "log_file_changed") {
             // Only accept this if we're NOT manually viewing a specific log